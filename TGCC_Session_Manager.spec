@@ -3,7 +3,8 @@
 
 a = Analysis(
     ['standalone_session_tool.py'],
-    pathex=[],
+    # 최상위 __init__.py 때문에 패키지로 분석되지 않도록 같은 폴더의 모듈을 직접 찾게 함
+    pathex=[SPECPATH],
     binaries=[],
     datas=[],
     hiddenimports=[],
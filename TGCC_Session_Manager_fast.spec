@@ -0,0 +1,81 @@
+# -*- mode: python ; coding: utf-8 -*-
+# 빠른 시작용 빌드 설정 (onedir)
+#
+#   pyinstaller TGCC_Session_Manager_fast.spec
+#   -> dist/TGCC_Session_Manager_fast/TGCC_Session_Manager_fast(.exe)
+#
+# TGCC_Session_Manager.spec(onefile + UPX)는 실행할 때마다 번들 전체를 임시 폴더에
+# 풀고 압축을 해제하므로 첫 메뉴가 늦게 뜹니다. 이 설정은
+# - onedir: 파일이 이미 풀려 있으므로 실행할 때 압축 해제가 없음
+# - upx=False: DLL/확장 모듈을 불러올 때마다 압축을 풀지 않음
+# - optimize=2: 바이트코드를 미리 -OO로 컴파일 (docstring/assert 제거)
+# - excludes: 앱이 쓰지 않는 표준 라이브러리와 telethon 부가 기능 제외
+# 로 시작 시간을 줄입니다. telethon은 세션을 만들거나 테스트할 때만 import됩니다.
+#
+# 시작 시간 비교: python benchmarks/exe_startup_bench.py
+
+# telethon 클라이언트가 직접 import하는 하위 모듈(tl, network, events 등)은 제외할 수
+# 없으므로, 앱에서 쓰지 않는 동기 래퍼와 선택 의존성만 제외
+TELETHON_EXCLUDES = [
+    'telethon.sync',
+    'PIL',
+    'hachoir',
+]
+
+# 번들에 딸려 들어오지만 앱이 쓰지 않는 표준 라이브러리
+STDLIB_EXCLUDES = [
+    'tkinter',
+    'unittest',
+    'doctest',
+    'pdb',
+    'pydoc',
+    'pydoc_data',
+    'lib2to3',
+    'xmlrpc',
+    'multiprocessing',
+]
+
+
+a = Analysis(
+    ['standalone_session_tool.py'],
+    # 최상위 __init__.py 때문에 패키지로 분석되지 않도록 같은 폴더의 모듈을 직접 찾게 함
+    pathex=[SPECPATH],
+    binaries=[],
+    datas=[],
+    hiddenimports=[],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=TELETHON_EXCLUDES + STDLIB_EXCLUDES,
+    noarchive=False,
+    optimize=2,
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='TGCC_Session_Manager_fast',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=False,
+    console=True,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+)
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name='TGCC_Session_Manager_fast',
+)
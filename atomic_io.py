@@ -0,0 +1,212 @@
+# type: ignore
+"""
+원자적 파일 쓰기
+임시 파일에 쓴 뒤 이름을 바꿔서, 쓰는 도중 프로그램이 종료되어도
+잘린 JSON 파일이 남지 않도록 하는 기능
+(여러 파일을 한 번에 쓸 때는 디스크 동기화를 한 번만 하는 그룹 커밋)
+
+Python 3.11.9
+PEP8 준수
+"""
+
+import itertools
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+try:
+    from . import json_codec
+except ImportError:
+    import json_codec
+
+# 리눅스는 메타데이터를 제외한 fdatasync 사용 (윈도우/맥은 fsync)
+_datasync = getattr(os, "fdatasync", os.fsync)
+
+# 여러 파일을 한 번에 디스크에 기록 (리눅스의 sync는 기록이 끝날 때까지 기다리지만
+# 다른 OS는 기록을 예약만 할 수 있으므로 파일마다 fsync)
+_sync_all = os.sync if sys.platform.startswith("linux") else None
+
+# 같은 프로세스에서 같은 파일을 동시에 쓰더라도 임시 파일이 겹치지 않도록 붙이는 번호
+_tmp_counter = itertools.count()
+
+
+def _tmp_path(path: Path) -> Path:
+    """같은 디렉토리의 숨김 임시 파일 경로 (*.json 목록에 잡히지 않도록)"""
+    return path.with_name(f".{path.name}.{os.getpid()}.{next(_tmp_counter)}.tmp")
+
+
+def _sync_file(path: Path) -> None:
+    """파일 내용을 디스크에 기록"""
+    fd = os.open(path, os.O_RDWR)
+    try:
+        _datasync(fd)
+    finally:
+        os.close(fd)
+
+
+def _sync_dir(directory: Path) -> None:
+    """디렉토리 항목(이름 변경)을 디스크에 기록 (윈도우는 지원하지 않으므로 생략)"""
+    if os.name == "nt":
+        return
+
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class AtomicBatch:
+    """
+    여러 파일을 원자적으로 쓰는 그룹 커밋
+
+    stage()로 임시 파일들을 먼저 쓰고, commit()에서 한 번의 sync로 모두 디스크에
+    기록한 다음 한꺼번에 이름을 바꾸고 디렉토리도 한 번씩만 fsync합니다.
+    파일마다 쓰기-fsync-이름 변경-디렉토리 fsync를 반복하는 것보다
+    디스크 대기가 훨씬 적습니다. (리눅스 외에는 임시 파일마다 fsync)
+
+    사용 예:
+        with AtomicBatch() as batch:
+            batch.stage_json(path1, data1)
+            batch.stage_json(path2, data2)
+    """
+
+    def __init__(self, durable: bool = True) -> None:
+        """
+        그룹 커밋 초기화
+
+        Args:
+            durable: fsync로 디스크 기록까지 보장할지 여부
+                     (False면 원자적 교체만 하고 fsync는 생략)
+        """
+        self.durable = durable
+        # 최종 경로 -> 임시 파일 경로 (stage한 순서대로)
+        self._staged: Dict[Path, Path] = {}
+
+    def __len__(self) -> int:
+        return len(self._staged)
+
+    def __enter__(self) -> "AtomicBatch":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+
+    def stage_json(self, path: Union[str, Path], data: Any,
+                   indent: Optional[int] = None) -> None:
+        """
+        JSON 데이터를 임시 파일에 쓰기 (commit() 전까지 원래 파일은 그대로)
+
+        같은 경로를 다시 stage하면 마지막 데이터만 씁니다.
+
+        Args:
+            path: 최종 파일 경로
+            data: JSON으로 쓸 데이터
+            indent: 들여쓰기 (None이면 한 줄)
+        """
+        path = Path(path)
+        tmp_path = _tmp_path(path)
+        try:
+            # 직렬화는 json_codec 백엔드(orjson 등)로, UTF-8 바이트를 그대로 씀
+            with open(tmp_path, 'wb') as f:
+                f.write(json_codec.dumps(data, indent))
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+
+        old_tmp_path = self._staged.pop(path, None)
+        if old_tmp_path is not None:
+            self._remove(old_tmp_path)
+        self._staged[path] = tmp_path
+
+    def commit(self) -> None:
+        """임시 파일들을 디스크에 기록하고 최종 경로로 교체"""
+        staged, self._staged = self._staged, {}
+        if not staged:
+            return
+
+        try:
+            if self.durable:
+                if len(staged) > 1 and _sync_all is not None:
+                    _sync_all()
+                else:
+                    for tmp_path in staged.values():
+                        _sync_file(tmp_path)
+
+            for path, tmp_path in staged.items():
+                os.replace(tmp_path, path)
+
+        except BaseException:
+            for tmp_path in staged.values():
+                self._remove(tmp_path)
+            raise
+
+        if self.durable:
+            for directory in {path.parent for path in staged}:
+                _sync_dir(directory)
+
+    def abort(self) -> None:
+        """커밋하지 않은 임시 파일 삭제"""
+        staged, self._staged = self._staged, {}
+        for tmp_path in staged.values():
+            self._remove(tmp_path)
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def write_json_atomic(path: Union[str, Path], data: Any, indent: Optional[int] = None,
+                      durable: bool = True) -> None:
+    """
+    JSON 파일 하나를 원자적으로 쓰기
+
+    Args:
+        path: 파일 경로
+        data: JSON으로 쓸 데이터
+        indent: 들여쓰기 (None이면 한 줄)
+        durable: fsync로 디스크 기록까지 보장할지 여부
+    """
+    with AtomicBatch(durable) as batch:
+        batch.stage_json(path, data, indent)
+
+
+def create_json_atomic(path: Union[str, Path], data: Any, indent: Optional[int] = None) -> bool:
+    """
+    JSON 파일이 아직 없을 때만 원자적으로 만들기
+
+    임시 파일에 다 쓴 뒤 하드 링크로 최종 이름을 붙이므로, 여러 프로세스가
+    동시에 만들어도 하나만 성공하고 다른 프로세스가 반쯤 쓴 파일을 읽는 일도 없습니다.
+
+    Args:
+        path: 파일 경로
+        data: JSON으로 쓸 데이터
+        indent: 들여쓰기 (None이면 한 줄)
+
+    Returns:
+        새로 만들었으면 True, 이미 있었으면 False
+    """
+    path = Path(path)
+    tmp_path = _tmp_path(path)
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(json_codec.dumps(data, indent))
+            f.flush()
+            _datasync(f.fileno())
+
+        try:
+            os.link(tmp_path, path)
+        except FileExistsError:
+            return False
+    finally:
+        AtomicBatch._remove(tmp_path)
+
+    _sync_dir(path.parent)
+    return True
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# type: ignore
+"""
+실행 파일 시작 시간 벤치마크
+빌드 방식(프로필)별로 프로세스를 시작해서 첫 메뉴 입력 프롬프트가 나올 때까지
+걸리는 시간을 측정
+
+프로필:
+- source: python standalone_session_tool.py
+- source-OO: python -OO standalone_session_tool.py (optimize=2와 같은 바이트코드)
+- onefile: dist/TGCC_Session_Manager(.exe) (TGCC_Session_Manager.spec)
+- onedir: dist/TGCC_Session_Manager_fast/TGCC_Session_Manager_fast(.exe)
+          (TGCC_Session_Manager_fast.spec)
+빌드되지 않은 실행 파일은 건너뜁니다.
+
+사용법:
+    python benchmarks/exe_startup_bench.py [--runs 5] [--dist dist] [--timeout 60]
+
+Python 3.11.9
+PEP8 준수
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+ENTRY_SCRIPT = REPO_DIR / "standalone_session_tool.py"
+
+# 첫 메뉴 프롬프트 "선택하세요 (1-6): " (콘솔 인코딩과 상관없이 찾도록 ASCII 부분만 사용)
+PROMPT_MARKER = b"(1-6)"
+# 프롬프트가 나온 뒤 보낼 입력 (프로그램 종료 메뉴)
+EXIT_INPUT = b"6\n"
+
+EXE_SUFFIX = ".exe" if os.name == "nt" else ""
+
+
+def profile_commands(dist_dir: Path) -> Dict[str, List[str]]:
+    """프로필 이름 -> 실행 명령 (빌드되지 않은 실행 파일은 제외)"""
+    commands = {
+        "source": [sys.executable, str(ENTRY_SCRIPT)],
+        "source-OO": [sys.executable, "-OO", str(ENTRY_SCRIPT)],
+    }
+
+    executables = {
+        "onefile": dist_dir / f"TGCC_Session_Manager{EXE_SUFFIX}",
+        "onedir": dist_dir / "TGCC_Session_Manager_fast" / f"TGCC_Session_Manager_fast{EXE_SUFFIX}",
+    }
+    for name, path in executables.items():
+        if path.is_file():
+            commands[name] = [str(path)]
+        else:
+            print(f"⚠️ {name}: 실행 파일이 없어서 건너뜁니다 ({path})", file=sys.stderr)
+
+    return commands
+
+
+def time_to_prompt(command: List[str], workdir: Path, timeout: float) -> Optional[float]:
+    """
+    프로세스 시작부터 첫 프롬프트 출력까지 걸린 시간
+
+    Args:
+        command: 실행 명령
+        workdir: 실행 디렉토리 (세션 디렉토리가 여기에 만들어짐)
+        timeout: 최대 대기 시간 (초)
+
+    Returns:
+        걸린 시간 (초, 프롬프트가 나오지 않으면 None)
+    """
+    prompted = threading.Event()
+    elapsed = []
+
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        command, cwd=workdir, stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+    )
+
+    def _read_output() -> None:
+        # 프롬프트는 줄바꿈 없이 출력되므로 줄 단위가 아니라 도착한 만큼씩 읽음
+        output = b""
+        while True:
+            chunk = process.stdout.read1(4096)
+            if not chunk:
+                break
+            if not prompted.is_set():
+                output += chunk
+                if PROMPT_MARKER in output:
+                    elapsed.append(time.perf_counter() - started)
+                    prompted.set()
+
+    reader = threading.Thread(target=_read_output, daemon=True)
+    reader.start()
+
+    try:
+        if not prompted.wait(timeout):
+            return None
+
+        process.stdin.write(EXIT_INPUT)
+        process.stdin.flush()
+        process.wait(timeout)
+        return elapsed[0]
+
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        reader.join(timeout)
+
+
+def main() -> int:
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description="실행 파일 시작 시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=5, help="프로필별 반복 횟수")
+    parser.add_argument("--dist", default=str(REPO_DIR / "dist"),
+                        help="PyInstaller 결과 디렉토리")
+    parser.add_argument("--timeout", type=float, default=60.0,
+                        help="프롬프트를 기다리는 최대 시간 (초)")
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        # 임시 디렉토리에서 실행하므로 실행 파일 경로는 절대 경로로
+        for name, command in profile_commands(Path(args.dist).resolve()).items():
+            runs = [time_to_prompt(command, Path(tmp), args.timeout) for _ in range(args.runs)]
+            times = [run for run in runs if run is not None]
+
+            results[name] = {
+                "command": command,
+                "runs": len(times),
+                "failed": len(runs) - len(times),
+                "median_ms": round(statistics.median(times) * 1000, 1) if times else None,
+                "min_ms": round(min(times) * 1000, 1) if times else None,
+                "max_ms": round(max(times) * 1000, 1) if times else None
+            }
+
+    print(json.dumps({"runs": args.runs, "profiles": results}, indent=2, ensure_ascii=False))
+
+    if any(result["failed"] for result in results.values()):
+        print("❌ 일부 실행에서 프롬프트가 나오지 않았습니다.", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
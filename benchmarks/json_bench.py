@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# type: ignore
+"""
+JSON 직렬화 벤치마크
+json_codec의 백엔드(orjson, msgspec, 표준 json)와 저장 형식(pretty: 2칸 들여쓰기,
+compact: 한 줄)별로 직렬화(dumps)와 파싱(loads)의 처리량과 결과 크기를 측정
+
+측정 대상:
+- session: 세션 파일 하나 (save_session/load_session이 쓰고 읽는 크기)
+- index: 세션 N개의 메타데이터 인덱스 (.meta/index.json과 같은 구조)
+
+설치되지 않은 백엔드는 건너뜁니다.
+
+사용법:
+    python benchmarks/json_bench.py [--entries 10000] [--repeat 5]
+        [--min-time 0.2] [--output result.json]
+
+Python 3.11.9
+PEP8 준수
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_DIR))
+
+import json_codec  # noqa: E402
+
+# 저장 형식 -> indent
+FORMATS = {"pretty": 2, "compact": None}
+
+
+def make_session(i: int) -> Dict[str, Any]:
+    """측정용 세션 정보 (store_bench와 같은 구성, 이름/메모는 한글 포함)"""
+    return {
+        "name": f"세션_{i}",
+        "session_string": "1" + "A" * 352 + "=",
+        "phone": f"+8210{i:08d}",
+        "notes": f"벤치마크 세션 {i}" if i % 3 == 0 else None,
+        "created_at": f"2024-01-01T{i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}",
+        "last_used": None
+    }
+
+
+def make_index(entries: int) -> Dict[str, Any]:
+    """측정용 인덱스 문서 (세션 문자열 없이 메타데이터만)"""
+    return {
+        "version": 2,
+        "dir_mtime_ns": 1700000000000000000,
+        "entries": {
+            f"세션_{i}.json": {
+                **{k: v for k, v in make_session(i).items() if k != "session_string"},
+                "mtime_ns": 1700000000000000000 + i,
+                "file_size": 512
+            }
+            for i in range(entries)
+        }
+    }
+
+
+def throughput(func: Callable[[], Any], repeat: int, min_time: float) -> float:
+    """
+    func의 초당 호출 횟수 (repeat번 측정해서 가장 빠른 값)
+
+    한 번 측정할 때 min_time초 이상 걸리도록 호출 횟수를 늘립니다.
+    """
+    calls = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(calls):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time:
+            break
+        calls *= 2
+
+    best = elapsed
+    for _ in range(repeat - 1):
+        started = time.perf_counter()
+        for _ in range(calls):
+            func()
+        best = min(best, time.perf_counter() - started)
+
+    return calls / best
+
+
+def measure(backend: str, document: Any, indent, repeat: int,
+            min_time: float) -> Dict[str, Any]:
+    """
+    백엔드 하나, 형식 하나의 측정 결과
+
+    Returns:
+        결과 크기(바이트), dumps/loads 초당 횟수와 MB/s
+    """
+    dumps, loads = json_codec.get_codec(backend)
+    encoded = dumps(document, indent)
+    if loads(encoded) != document:
+        raise AssertionError(f"{backend}: 직렬화 결과를 다시 읽은 값이 다릅니다")
+
+    dumps_per_sec = throughput(lambda: dumps(document, indent), repeat, min_time)
+    loads_per_sec = throughput(lambda: loads(encoded), repeat, min_time)
+    megabytes = len(encoded) / 1e6
+
+    return {
+        "bytes": len(encoded),
+        "dumps_per_sec": round(dumps_per_sec, 1),
+        "dumps_mb_per_sec": round(dumps_per_sec * megabytes, 1),
+        "loads_per_sec": round(loads_per_sec, 1),
+        "loads_mb_per_sec": round(loads_per_sec * megabytes, 1)
+    }
+
+
+def main() -> int:
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description="JSON 직렬화 벤치마크")
+    parser.add_argument("--entries", type=int, default=10000, help="인덱스 문서의 세션 수")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수 (가장 빠른 값 사용)")
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="한 번 측정할 때 최소 시간 (초)")
+    parser.add_argument("--output", help="결과 JSON을 저장할 파일")
+    args = parser.parse_args()
+
+    documents = {
+        "session": make_session(1),
+        "index": make_index(args.entries)
+    }
+    backends = json_codec.available_backends()
+    for name in json_codec.JSON_BACKENDS:
+        if name not in backends:
+            print(f"⚠️ {name}: 설치되어 있지 않아서 건너뜁니다", file=sys.stderr)
+
+    result = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "default_backend": json_codec.BACKEND,
+        "entries": args.entries,
+        "cases": []
+    }
+
+    for document_name, document in documents.items():
+        # 다른 백엔드/형식으로 쓴 파일도 읽을 수 있는지 확인 (기존 파일 호환성)
+        for writer in backends:
+            for indent in FORMATS.values():
+                encoded = json_codec.get_codec(writer)[0](document, indent)
+                for reader in backends:
+                    if json_codec.get_codec(reader)[1](encoded) != document:
+                        raise AssertionError(f"{writer} -> {reader}: 읽은 값이 다릅니다")
+
+        for backend in backends:
+            for format_name, indent in FORMATS.items():
+                stats = measure(backend, document, indent, args.repeat, args.min_time)
+                result["cases"].append({
+                    "document": document_name,
+                    "backend": backend,
+                    "format": format_name,
+                    **stats
+                })
+                print(f"⏱️ {document_name}/{backend}/{format_name}: "
+                      f"{stats['bytes']} bytes, "
+                      f"dumps {stats['dumps_mb_per_sec']} MB/s, "
+                      f"loads {stats['loads_mb_per_sec']} MB/s",
+                      file=sys.stderr)
+
+    output = json.dumps(result, indent=2)
+    print(output)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding='utf-8')
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# type: ignore
+"""
+시작 시간 벤치마크
+SessionManager로 세션 목록을 조회하는 데 걸리는 시간을 새 프로세스에서 측정하고,
+그 과정에서 telethon이 import되지 않는지 확인
+
+사용법:
+    python benchmarks/startup_bench.py [--runs 5] [--sessions 100]
+
+Python 3.11.9
+PEP8 준수
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+# 새 프로세스에서 실행할 측정 코드
+LIST_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+from session_manager import SessionManager
+manager = SessionManager(sys.argv[1])
+sessions = manager.list_sessions()
+elapsed = time.perf_counter() - started
+print(json.dumps({
+    "elapsed": elapsed,
+    "sessions": len(sessions),
+    "telethon_loaded": "telethon" in sys.modules
+}))
+"""
+
+TELETHON_SCRIPT = """
+import json, time
+started = time.perf_counter()
+try:
+    import telethon
+except ImportError as e:
+    print(json.dumps({"skipped": str(e)}))
+else:
+    print(json.dumps({"elapsed": time.perf_counter() - started}))
+"""
+
+
+def run_script(script: str, *args: str) -> dict:
+    """새 파이썬 프로세스에서 스크립트를 실행하고 JSON 결과 반환"""
+    output = subprocess.run(
+        [sys.executable, "-c", script, *args],
+        cwd=REPO_DIR, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def prepare_store(sessions_dir: Path, count: int) -> None:
+    """측정용 세션 저장소 생성"""
+    sys.path.insert(0, str(REPO_DIR))
+    from session_storage import JsonFileStorage
+
+    storage = JsonFileStorage(sessions_dir)
+    storage.write_many(
+        (f"bench_{i}.json", {
+            "name": f"bench_{i}",
+            "session_string": "x" * 350,
+            "phone": f"+8210{i:08d}",
+            "notes": None,
+            "created_at": f"2024-01-01T00:00:{i % 60:02d}",
+            "last_used": None
+        })
+        for i in range(count)
+    )
+
+
+def main() -> int:
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description="SessionManager 시작 시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=5, help="반복 횟수")
+    parser.add_argument("--sessions", type=int, default=100, help="측정용 세션 수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sessions_dir = Path(tmp) / "sessions"
+        prepare_store(sessions_dir, args.sessions)
+
+        list_runs = [run_script(LIST_SCRIPT, str(sessions_dir)) for _ in range(args.runs)]
+        # telethon이 없으면 비교 측정은 건너뜀 (목록 조회는 telethon 없이도 동작해야 함)
+        telethon_runs = [run_script(TELETHON_SCRIPT)]
+        if "skipped" not in telethon_runs[0]:
+            telethon_runs += [run_script(TELETHON_SCRIPT) for _ in range(args.runs - 1)]
+
+    result = {
+        "runs": args.runs,
+        "sessions": args.sessions,
+        "list_sessions_ms": round(statistics.median(r["elapsed"] for r in list_runs) * 1000, 2),
+        "import_telethon_ms": None,
+        "telethon_loaded": any(r["telethon_loaded"] for r in list_runs)
+    }
+    if "skipped" in telethon_runs[0]:
+        result["import_telethon_skipped"] = telethon_runs[0]["skipped"]
+    else:
+        result["import_telethon_ms"] = round(
+            statistics.median(r["elapsed"] for r in telethon_runs) * 1000, 2
+        )
+    print(json.dumps(result, indent=2))
+
+    if result["telethon_loaded"]:
+        print("❌ 목록 조회 중에 telethon이 import되었습니다.", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
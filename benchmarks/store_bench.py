@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+# type: ignore
+"""
+세션 저장소 벤치마크
+가짜 세션으로 채운 저장소(10개 ~ 10만 개)에서 SessionManager의 주요 작업
+(save_session, load_session, list_sessions, _find_session_file, delete_session)의
+지연 시간 백분위수와 처리량을 백엔드/배치 방식별로 측정
+
+결과는 JSON으로 출력하므로 파일로 저장해 두고 --baseline으로 다음 측정과
+비교하면 성능 회귀를 확인할 수 있습니다.
+
+사용법:
+    python benchmarks/store_bench.py [--sessions 10 1000 10000]
+        [--backends json sqlite] [--layouts flat sharded]
+        [--samples 200] [--seed 0] [--output result.json]
+        [--baseline previous.json] [--tolerance 0.2]
+
+Python 3.11.9
+PEP8 준수
+"""
+
+import argparse
+import json
+import math
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_DIR))
+
+from session_manager import SessionManager  # noqa: E402
+
+RESULT_VERSION = 1
+
+# 측정하는 작업 (출력 순서)
+OPERATIONS = ("open", "save_session", "load_session", "list_sessions",
+              "find_session_file", "delete_session")
+
+# 한 번에 전체를 읽는 작업은 표본 수를 줄임
+LIST_SAMPLES = 20
+
+
+def make_session(i: int) -> Dict[str, Any]:
+    """측정용 세션 정보 생성"""
+    return {
+        "name": f"bench_{i}",
+        "session_string": "x" * 350,
+        "phone": f"+8210{i:08d}",
+        "notes": f"benchmark session {i}" if i % 3 == 0 else None,
+        "created_at": f"2024-01-01T{i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}",
+        "last_used": None
+    }
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """정렬된 값의 백분위수 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(durations: List[float]) -> Dict[str, Any]:
+    """
+    작업별 측정값 요약
+
+    Args:
+        durations: 작업 한 번씩의 소요 시간 (초)
+
+    Returns:
+        횟수, 백분위수/평균/최대 (마이크로초), 처리량 (초당 작업 수)
+    """
+    values = sorted(durations)
+    total = sum(values)
+    return {
+        "count": len(values),
+        "p50_us": round(percentile(values, 50) * 1e6, 1),
+        "p90_us": round(percentile(values, 90) * 1e6, 1),
+        "p99_us": round(percentile(values, 99) * 1e6, 1),
+        "max_us": round(values[-1] * 1e6, 1) if values else 0.0,
+        "mean_us": round(total / len(values) * 1e6, 1) if values else 0.0,
+        "ops_per_sec": round(len(values) / total, 1) if total else 0.0
+    }
+
+
+def measure(func: Callable[[Any], Any], args: Iterable[Any]) -> List[float]:
+    """인자마다 func를 한 번씩 호출하고 각각의 소요 시간 (초) 반환"""
+    durations = []
+    for arg in args:
+        started = time.perf_counter()
+        func(arg)
+        durations.append(time.perf_counter() - started)
+    return durations
+
+
+def prepare_store(sessions_dir: Path, backend: str, layout: Optional[str], count: int) -> None:
+    """측정용 세션으로 저장소 채우기 (그룹 커밋으로 한 번에 기록)"""
+    manager = SessionManager(str(sessions_dir), backend=backend, layout=layout)
+    try:
+        manager.storage.write_many(
+            (f"bench_{i}.json", make_session(i)) for i in range(count)
+        )
+    finally:
+        manager.close()
+
+
+def run_case(sessions_dir: Path, backend: str, layout: Optional[str], count: int,
+             samples: int, rng: random.Random) -> Dict[str, Dict[str, Any]]:
+    """
+    저장소 하나에서 모든 작업 측정
+
+    저장한 세션은 마지막에 삭제하므로 측정하는 동안 저장소 크기가 거의 변하지 않습니다.
+
+    Returns:
+        작업 이름 -> 요약
+    """
+    prepare_store(sessions_dir, backend, layout, count)
+
+    existing = [f"bench_{i}" for i in rng.sample(range(count), min(samples, count))]
+    new_names = [f"new_{i}" for i in range(samples)]
+    results = {}
+
+    # 프로세스 간 잠금은 프로세스 단위이므로 한 번에 저장소 하나만 열어둠
+    results["open"] = summarize(measure(
+        lambda _: SessionManager(str(sessions_dir), backend=backend).close(),
+        range(min(5, samples))
+    ))
+
+    manager = SessionManager(str(sessions_dir), backend=backend)
+    try:
+        results["save_session"] = summarize(measure(
+            lambda name: manager.save_session("y" * 350, name, notes="benchmark"),
+            new_names
+        ))
+        results["load_session"] = summarize(measure(manager.load_session, existing))
+        results["list_sessions"] = summarize(measure(
+            lambda _: manager.list_sessions(), range(min(LIST_SAMPLES, samples))
+        ))
+        results["find_session_file"] = summarize(measure(
+            manager._find_session_file, existing
+        ))
+        results["delete_session"] = summarize(measure(manager.delete_session, new_names))
+    finally:
+        manager.close()
+
+    return results
+
+
+def git_revision() -> Optional[str]:
+    """측정한 코드의 git 커밋 (git이 없으면 None)"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(result: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """
+    이전 결과와 p50 비교
+
+    Args:
+        result: 이번 측정 결과
+        baseline: 이전 측정 결과
+        tolerance: 허용하는 느려짐 비율 (0.2 = 20%)
+
+    Returns:
+        허용 범위보다 느려진 항목 설명 리스트
+    """
+    previous = {
+        (case["backend"], case["layout"], case["sessions"], operation): stats["p50_us"]
+        for case in baseline.get("cases", [])
+        for operation, stats in case["operations"].items()
+    }
+
+    regressions = []
+    for case in result["cases"]:
+        for operation, stats in case["operations"].items():
+            key = (case["backend"], case["layout"], case["sessions"], operation)
+            before = previous.get(key)
+            if before and stats["p50_us"] > before * (1 + tolerance):
+                regressions.append(
+                    f"{case['backend']}/{case['layout']}/{case['sessions']} {operation}: "
+                    f"p50 {before}us -> {stats['p50_us']}us"
+                )
+    return regressions
+
+
+def main() -> int:
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description="세션 저장소 벤치마크")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[10, 1000, 10000],
+                        help="저장소 크기 (여러 개 지정 가능, 최대 100000 권장)")
+    parser.add_argument("--backends", nargs="+", choices=("json", "sqlite"),
+                        default=["json", "sqlite"], help="측정할 백엔드")
+    parser.add_argument("--layouts", nargs="+", choices=("flat", "sharded"),
+                        default=["flat", "sharded"], help="측정할 JSON 파일 배치 방식")
+    parser.add_argument("--samples", type=int, default=200, help="작업별 측정 횟수")
+    parser.add_argument("--seed", type=int, default=0, help="조회할 세션을 고르는 난수 시드")
+    parser.add_argument("--output", help="결과 JSON을 저장할 파일")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="--baseline 비교에서 허용하는 p50 느려짐 비율")
+    args = parser.parse_args()
+
+    # 배치 방식은 JSON 백엔드에만 의미가 있음
+    cases = [
+        (backend, layout)
+        for backend in args.backends
+        for layout in (args.layouts if backend == "json" else [None])
+    ]
+
+    result = {
+        "version": RESULT_VERSION,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "samples": args.samples,
+        "seed": args.seed,
+        "cases": []
+    }
+
+    for count in args.sessions:
+        for backend, layout in cases:
+            # 경우마다 같은 시드로 같은 세션을 조회
+            rng = random.Random(args.seed)
+            with tempfile.TemporaryDirectory() as tmp:
+                operations = run_case(Path(tmp) / "sessions", backend, layout,
+                                      count, args.samples, rng)
+
+            result["cases"].append({
+                "backend": backend,
+                "layout": layout,
+                "sessions": count,
+                "operations": operations
+            })
+            print(f"⏱️ {backend}/{layout or '-'}/{count}: "
+                  f"load p50 {operations['load_session']['p50_us']}us, "
+                  f"list p50 {operations['list_sessions']['p50_us']}us",
+                  file=sys.stderr)
+
+    output = json.dumps(result, indent=2)
+    print(output)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding='utf-8')
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(result, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"❌ {line}", file=sys.stderr)
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
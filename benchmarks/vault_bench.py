@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# type: ignore
+"""
+암호화 저장소 벤치마크
+같은 세션들을 평문 저장소와 암호화 저장소에 저장/조회/불러오기 하면서
+걸리는 시간을 비교하고, 키 유도(scrypt) 캐시 효과를 측정
+
+사용법:
+    python benchmarks/vault_bench.py [--sessions 2000] [--backend json]
+
+Python 3.11.9
+PEP8 준수
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_DIR))
+
+from session_storage import create_storage  # noqa: E402
+from session_vault import derive_key  # noqa: E402
+
+
+def make_sessions(count: int):
+    """측정용 세션 정보 생성"""
+    return [
+        (f"bench_{i}.json", {
+            "name": f"bench_{i}",
+            "session_string": "x" * 350,
+            "phone": f"+8210{i:08d}",
+            "notes": None,
+            "created_at": f"2024-01-01T00:00:{i % 60:02d}",
+            "last_used": None
+        })
+        for i in range(count)
+    ]
+
+
+def timed(func, *args) -> float:
+    """함수 실행 시간 (밀리초)"""
+    started = time.perf_counter()
+    func(*args)
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+def run_store(sessions_dir: Path, backend: str, passphrase, sessions) -> dict:
+    """저장소 하나에서 저장/목록/전체 불러오기 시간 측정"""
+    result = {}
+
+    derive_key.cache_clear()
+    started = time.perf_counter()
+    storage = create_storage(backend, sessions_dir, passphrase)
+    result["open_ms"] = round((time.perf_counter() - started) * 1000, 2)
+
+    result["write_many_ms"] = timed(storage.write_many, sessions)
+    result["list_entries_ms"] = timed(storage.list_entries)
+    result["read_all_ms"] = timed(
+        lambda: [storage.read(filename) for filename, _ in sessions]
+    )
+    result["iter_sessions_ms"] = timed(lambda: list(storage.iter_sessions()))
+    storage.close()
+
+    # 같은 프로세스에서 다시 열면 캐시된 키를 사용
+    started = time.perf_counter()
+    create_storage(backend, sessions_dir, passphrase).close()
+    result["reopen_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    return result
+
+
+def main() -> int:
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description="암호화 저장소 벤치마크")
+    parser.add_argument("--sessions", type=int, default=2000, help="측정용 세션 수")
+    parser.add_argument("--backend", choices=("json", "sqlite"), default="json",
+                        help="저장소 백엔드")
+    args = parser.parse_args()
+
+    sessions = make_sessions(args.sessions)
+    with tempfile.TemporaryDirectory() as tmp:
+        plain = run_store(Path(tmp) / "plain", args.backend, None, sessions)
+        encrypted = run_store(Path(tmp) / "encrypted", args.backend, "benchmark", sessions)
+
+    result = {
+        "sessions": args.sessions,
+        "backend": args.backend,
+        "plaintext": plain,
+        "encrypted": encrypted,
+        "read_all_overhead_us_per_session": round(
+            (encrypted["read_all_ms"] - plain["read_all_ms"]) * 1000 / max(1, args.sessions), 2
+        )
+    }
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+# type: ignore
+"""
+비대화형 세션 관리 CLI
+스크립트/자동화용 명령줄 도구 (JSON 출력, 종료 코드로 결과 전달)
+
+사용 예:
+    python cli.py list
+    python cli.py list --filter +8210 --sort name --offset 20 --limit 20
+    python cli.py search "alice +8210"
+    python cli.py show "My Session" +821012345678
+    python cli.py load "My Session" "Other Session"
+    python cli.py delete old1 old2
+    python cli.py validate --api-id 12345 --api-hash abcdef...
+    python cli.py export backup.ndjson.gz
+    python cli.py import backup.ndjson.gz --overwrite
+    TG_SESSION_PASSPHRASE=... python cli.py encrypt
+
+TG_SESSION_PASSPHRASE 환경변수가 있으면 세션 문자열을 그 암호로 암호화해서
+저장하고 읽습니다.
+
+안내/경고 메시지는 stderr로 나가며 기본은 경고 이상만 출력합니다.
+(--log-level 또는 TGCC_LOG_LEVEL 환경변수로 조정)
+
+--metrics prometheus|json (또는 TGCC_METRICS 환경변수)을 주면 작업별 지연 시간과
+횟수를 stderr(또는 --metrics-file)에 출력합니다.
+
+종료 코드:
+    0: 성공
+    1: 일부 또는 전체 실패 (세션 없음, 검사 실패 등)
+    2: 잘못된 사용법
+
+Python 3.11.9
+PEP8 준수
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from typing import Any, List, Optional, Tuple
+
+try:
+    from . import log_config
+    from . import metrics
+    from .session_manager import SessionManager
+    from .session_storage import SORT_FIELDS
+except ImportError:
+    import log_config
+    import metrics
+    from session_manager import SessionManager
+    from session_storage import SORT_FIELDS
+
+EXIT_OK = 0
+EXIT_FAILURE = 1
+EXIT_USAGE = 2
+
+
+def _non_negative_int(value: str) -> int:
+    """0 이상의 정수 인자 (--offset, --limit 등)"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"정수가 아닙니다: {value}") from None
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"0 이상이어야 합니다: {value}")
+    return number
+
+
+def _emit(data: Any) -> None:
+    """결과를 JSON으로 표준 출력에 쓰기"""
+    json.dump(data, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write("\n")
+
+
+def cmd_list(manager: SessionManager, args: argparse.Namespace) -> Tuple[int, Any]:
+    """세션 목록 (필터/정렬/페이지 지정 가능)"""
+    return EXIT_OK, [record.to_dict() for record in manager.iter_sessions(
+        filter=args.filter, sort=args.sort, offset=args.offset, limit=args.limit
+    )]
+
+
+def cmd_search(manager: SessionManager, args: argparse.Namespace) -> Tuple[int, Any]:
+    """이름/메모 단어와 전화번호 앞자리로 세션 검색"""
+    return EXIT_OK, [record.to_dict() for record in manager.search(args.query, args.limit)]
+
+
+def cmd_show(manager: SessionManager, args: argparse.Namespace) -> Tuple[int, Any]:
+    """세션 메타데이터 (세션 문자열 제외)"""
+    records = {name: manager.get_session_info(name) for name in args.names}
+    results = {name: record.to_dict() if record else None for name, record in records.items()}
+    return (EXIT_OK if all(results.values()) else EXIT_FAILURE), results
+
+
+def cmd_load(manager: SessionManager, args: argparse.Namespace) -> Tuple[int, Any]:
+    """세션 문자열 불러오기"""
+    results = {name: manager.load_session(name) for name in args.names}
+    return (EXIT_OK if all(results.values()) else EXIT_FAILURE), results
+
+
+def cmd_delete(manager: SessionManager, args: argparse.Namespace) -> Tuple[int, Any]:
+    """세션 삭제"""
+    results = {name: manager.delete_session(name) for name in args.names}
+    return (EXIT_OK if all(results.values()) else EXIT_FAILURE), results
+
+
+def cmd_validate(manager: SessionManager, args: argparse.Namespace) -> Tuple[int, Any]:
+    """저장된 모든 세션 연결 검사"""
+    api_id = args.api_id or os.environ.get("TG_API_ID")
+    api_hash = args.api_hash or os.environ.get("TG_API_HASH")
+    if not api_id or not api_hash:
+        print("❌ --api-id/--api-hash 또는 TG_API_ID/TG_API_HASH 환경변수가 필요합니다.",
+              file=sys.stderr)
+        return EXIT_USAGE, None
+
+    try:
+        api_id = int(api_id)
+    except ValueError:
+        print(f"❌ API ID는 숫자여야 합니다: {api_id}", file=sys.stderr)
+        return EXIT_USAGE, None
+
+    report = asyncio.run(manager.validate_all(
+        api_id, api_hash,
+        concurrency=args.concurrency,
+        timeout=args.timeout,
+        force_refresh=args.force_refresh
+    ))
+    return (EXIT_OK if report["valid"] == report["total"] else EXIT_FAILURE), report
+
+
+def cmd_encrypt(manager: SessionManager, args: argparse.Namespace) -> Tuple[int, Any]:
+    """평문으로 저장된 세션 암호화"""
+    if not os.environ.get("TG_SESSION_PASSPHRASE"):
+        print("❌ TG_SESSION_PASSPHRASE 환경변수가 필요합니다.", file=sys.stderr)
+        return EXIT_USAGE, None
+
+    count = manager.encrypt_existing()
+    return (EXIT_OK if count >= 0 else EXIT_FAILURE), {"encrypted": count}
+
+
+def cmd_export(manager: SessionManager, args: argparse.Namespace) -> Tuple[int, Any]:
+    """세션 아카이브로 내보내기"""
+    count = manager.export_bulk(args.path, compression=args.compression)
+    return (EXIT_OK if count >= 0 else EXIT_FAILURE), {"path": args.path, "exported": count}
+
+
+def cmd_import(manager: SessionManager, args: argparse.Namespace) -> Tuple[int, Any]:
+    """세션 아카이브에서 가져오기"""
+    count = manager.import_bulk(args.path, overwrite=args.overwrite,
+                                compression=args.compression)
+    return (EXIT_OK if count >= 0 else EXIT_FAILURE), {"path": args.path, "imported": count}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """명령줄 파서 구성"""
+    parser = argparse.ArgumentParser(
+        prog="cli.py",
+        description="텔레그램 세션 관리 CLI (결과는 JSON으로 출력)"
+    )
+    parser.add_argument("--sessions-dir", default="sessions",
+                        help="세션 디렉토리 (기본값: sessions)")
+    parser.add_argument("--backend", choices=("json", "sqlite"), default="json",
+                        help="저장소 백엔드 (기본값: json)")
+    parser.add_argument("--layout", choices=("flat", "sharded"),
+                        help="json 백엔드의 파일 배치 방식 (바꾸면 기존 파일을 옮김, 기본값: 지금 방식 유지)")
+    parser.add_argument("--compact-json", action="store_true",
+                        help="json 백엔드의 세션 파일을 들여쓰기 없이 저장 (기존 파일도 그대로 읽음)")
+    parser.add_argument("--log-level", choices=log_config.LOG_LEVELS,
+                        help="stderr에 출력할 메시지 레벨 (기본값: TGCC_LOG_LEVEL 또는 warning)")
+    parser.add_argument("--metrics", choices=metrics.DUMP_FORMATS,
+                        help="작업별 성능 측정 결과를 이 형식으로 출력 (기본값: 측정하지 않음)")
+    parser.add_argument("--metrics-file",
+                        help="성능 측정 결과를 쓸 파일 (기본값: stderr)")
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    sub = subparsers.add_parser("list", help="세션 목록")
+    sub.add_argument("--filter", help="이름/전화번호/메모에 포함된 문자열")
+    sub.add_argument("--sort", default="-created_at",
+                     choices=[prefix + field for field in SORT_FIELDS for prefix in ("", "-")],
+                     metavar="SORT",
+                     help="정렬 필드 (created_at, last_used, name, phone / '-'는 내림차순)")
+    sub.add_argument("--offset", type=_non_negative_int, default=0, help="건너뛸 세션 수")
+    sub.add_argument("--limit", type=_non_negative_int, help="최대 세션 수")
+    sub.set_defaults(func=cmd_list)
+
+    sub = subparsers.add_parser("search", help="세션 검색")
+    sub.add_argument("query", help="검색어 (예: \"alice +8210\", 단어는 모두 일치해야 함)")
+    sub.add_argument("--limit", type=_non_negative_int, help="최대 세션 수")
+    sub.set_defaults(func=cmd_search)
+
+    for name, func, help_text in (
+        ("show", cmd_show, "세션 정보 (세션 문자열 제외)"),
+        ("load", cmd_load, "세션 문자열 불러오기"),
+        ("delete", cmd_delete, "세션 삭제"),
+    ):
+        sub = subparsers.add_parser(name, help=help_text)
+        sub.add_argument("names", nargs="+", help="세션 이름, 파일명 또는 전화번호")
+        sub.set_defaults(func=func)
+
+    sub = subparsers.add_parser("validate", help="모든 세션 연결 검사")
+    sub.add_argument("--api-id", type=int, help="텔레그램 API ID (기본값: TG_API_ID)")
+    sub.add_argument("--api-hash", help="텔레그램 API Hash (기본값: TG_API_HASH)")
+    sub.add_argument("--concurrency", type=int, default=10, help="동시 검사 수")
+    sub.add_argument("--timeout", type=float, default=15.0, help="세션별 제한 시간 (초)")
+    sub.add_argument("--force-refresh", action="store_true",
+                     help="캐시된 검사 결과를 무시하고 다시 검사")
+    sub.set_defaults(func=cmd_validate)
+
+    for name, func, help_text in (
+        ("export", cmd_export, "세션 아카이브로 내보내기"),
+        ("import", cmd_import, "세션 아카이브에서 가져오기"),
+    ):
+        sub = subparsers.add_parser(name, help=help_text)
+        sub.add_argument("path", help="아카이브 경로 (.ndjson, .ndjson.gz, .ndjson.zst)")
+        sub.add_argument("--compression", choices=("auto", "gzip", "zstd", "none"),
+                         default="auto", help="압축 방식 (기본값: 확장자로 판단)")
+        if name == "import":
+            sub.add_argument("--overwrite", action="store_true",
+                             help="같은 파일명의 세션 덮어쓰기")
+        sub.set_defaults(func=func)
+
+    sub = subparsers.add_parser("encrypt", help="평문 세션 암호화 (TG_SESSION_PASSPHRASE 필요)")
+    sub.set_defaults(func=cmd_encrypt)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    CLI 진입점
+
+    Args:
+        argv: 명령줄 인자 (None이면 sys.argv 사용)
+
+    Returns:
+        종료 코드
+    """
+    args = build_parser().parse_args(argv)
+    if getattr(args, "compression", None) == "none":
+        args.compression = None
+
+    if args.metrics:
+        metrics.enable()
+    else:
+        metrics.enable_from_env()
+
+    # 관리자의 안내 메시지는 stderr로 보내서 stdout에는 JSON 결과만 남김
+    # (출력은 큐를 거쳐 별도 스레드에서 하므로 일괄 작업을 느리게 하지 않음)
+    try:
+        log_config.configure(args.log_level, default_level="warning")
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return EXIT_USAGE
+
+    try:
+        manager = SessionManager(args.sessions_dir, backend=args.backend,
+                                 passphrase=os.environ.get("TG_SESSION_PASSPHRASE") or None,
+                                 layout=args.layout, compact=args.compact_json)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return EXIT_FAILURE
+
+    try:
+        code, result = args.func(manager, args)
+    finally:
+        manager.close()
+        # 결과보다 먼저 안내 메시지를 모두 내보냄
+        log_config.flush()
+
+    if result is not None:
+        _emit(result)
+    if args.metrics:
+        metrics.write_dump(args.metrics, args.metrics_file)
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+# type: ignore
+"""
+텔레그램 클라이언트 연결 풀
+같은 세션으로 여러 번 작업할 때 TCP 연결과 인증 키 교환을 반복하지 않도록
+연결된 클라이언트를 재사용하는 기능
+
+Python 3.11.9
+PEP8 준수
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+try:
+    from .telethon_loader import create_client
+except ImportError:
+    from telethon_loader import create_client
+
+
+class _PooledClient:
+    """풀에 보관된 클라이언트 하나"""
+
+    __slots__ = ("client", "last_used", "last_probe", "in_use")
+
+    def __init__(self, client: Any) -> None:
+        self.client = client
+        self.last_used = time.monotonic()
+        self.last_probe = 0.0
+        self.in_use = 0
+
+
+class ClientPool:
+    """세션 문자열별로 연결된 TelegramClient를 재사용하는 풀 (인증된 세션만 보관)"""
+
+    def __init__(self, api_id: Optional[int] = None, api_hash: Optional[str] = None,
+                 max_size: int = 8, idle_timeout: float = 300.0,
+                 probe_interval: float = 60.0,
+                 client_factory: Optional[Callable[[str], Any]] = None) -> None:
+        """
+        연결 풀 초기화
+
+        Args:
+            api_id: 텔레그램 API ID (client_factory가 없을 때 필요)
+            api_hash: 텔레그램 API Hash (client_factory가 없을 때 필요)
+            max_size: 풀에 보관할 최대 클라이언트 수
+            idle_timeout: 이 시간(초) 동안 쓰지 않은 클라이언트는 연결 해제
+            probe_interval: 재사용 전 인증 상태를 다시 확인하는 간격 (초)
+            client_factory: 세션 문자열로 클라이언트를 만드는 함수 (테스트용)
+        """
+        if client_factory is None:
+            if not api_id or not api_hash:
+                raise ValueError("API 정보 또는 client_factory가 필요합니다.")
+
+            def client_factory(session_string: str) -> Any:
+                return create_client(session_string, api_id, api_hash)
+
+        self.max_size = max(1, max_size)
+        self.idle_timeout = idle_timeout
+        self.probe_interval = probe_interval
+        self._client_factory = client_factory
+        self._clients: "OrderedDict[str, _PooledClient]" = OrderedDict()
+        # 세션별 잠금 (서로 다른 세션은 동시에 연결 가능)
+        self._key_locks: Dict[str, asyncio.Lock] = {}
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    @asynccontextmanager
+    async def client(self, session_string: str) -> AsyncIterator[Any]:
+        """
+        연결된 클라이언트를 빌려 쓰기
+
+        사용 예:
+            async with pool.client(session_string) as client:
+                me = await client.get_me()
+
+        Args:
+            session_string: 세션 문자열
+
+        Yields:
+            연결된 클라이언트
+        """
+        pooled = await self._acquire(session_string)
+        try:
+            yield pooled.client
+        finally:
+            pooled.in_use -= 1
+            pooled.last_used = time.monotonic()
+            if not pooled.in_use and self._clients.get(session_string) is not pooled:
+                # 풀에 넣지 않았거나 (인증되지 않음) 상태가 나빠서 풀에서 뺀 클라이언트는
+                # 마지막으로 빌린 쪽이 돌려줄 때 연결 해제
+                await self._disconnect(pooled)
+            await self._disconnect_all(self._pop_overflow())
+
+    async def _acquire(self, session_string: str) -> _PooledClient:
+        """풀에서 클라이언트를 꺼내고, 없거나 상태가 나쁘면 새로 연결 (인증된 세션만 보관)"""
+        await self._disconnect_all(self._pop_idle())
+
+        key_lock = self._key_locks.setdefault(session_string, asyncio.Lock())
+        async with key_lock:
+            pooled = self._clients.get(session_string)
+            if pooled is not None and not await self._is_healthy(pooled):
+                # 다른 쪽이 아직 쓰고 있으면 풀에서만 빼고 연결은 돌려받을 때 해제
+                self._clients.pop(session_string, None)
+                if not pooled.in_use:
+                    await self._disconnect(pooled)
+                pooled = None
+
+            if pooled is None:
+                client = self._client_factory(session_string)
+                try:
+                    await client.connect()
+                    authorized = await client.is_user_authorized()
+                except BaseException:
+                    await self._disconnect(_PooledClient(client))
+                    raise
+                pooled = _PooledClient(client)
+                pooled.last_probe = time.monotonic()
+
+                if not authorized:
+                    # 만료되거나 폐기된 세션은 자리와 연결을 차지하지 않도록
+                    # 풀에 넣지 않고 빌려주기만 함
+                    pooled.in_use += 1
+                    return pooled
+                self._clients[session_string] = pooled
+
+            self._clients.move_to_end(session_string)
+            pooled.in_use += 1
+
+        await self._disconnect_all(self._pop_overflow())
+        return pooled
+
+    async def _is_healthy(self, pooled: _PooledClient) -> bool:
+        """재사용 전 연결/인증 상태 확인 (probe_interval마다 한 번만 서버 확인)"""
+        is_connected = getattr(pooled.client, "is_connected", None)
+        if callable(is_connected) and not is_connected():
+            return False
+
+        if time.monotonic() - pooled.last_probe < self.probe_interval:
+            return True
+
+        try:
+            authorized = await pooled.client.is_user_authorized()
+        except Exception:
+            return False
+
+        pooled.last_probe = time.monotonic()
+        return bool(authorized)
+
+    def _pop_idle(self) -> List[_PooledClient]:
+        """오래 쓰지 않은 클라이언트를 풀에서 꺼내기"""
+        now = time.monotonic()
+        expired = [
+            key for key, pooled in self._clients.items()
+            if not pooled.in_use and now - pooled.last_used > self.idle_timeout
+        ]
+        return [self._pop(key) for key in expired]
+
+    def _pop_overflow(self) -> List[_PooledClient]:
+        """최대 크기를 넘은 만큼 가장 오래 쓰지 않은 클라이언트를 풀에서 꺼내기"""
+        overflow = len(self._clients) - self.max_size
+        if overflow <= 0:
+            return []
+
+        # OrderedDict 앞쪽이 가장 오래 쓰지 않은 클라이언트
+        victims = [key for key, pooled in self._clients.items() if not pooled.in_use]
+        return [self._pop(key) for key in victims[:overflow]]
+
+    def _pop(self, key: str) -> _PooledClient:
+        """풀에서 클라이언트 제거 (사용 중이 아닌 세션 잠금도 정리)"""
+        lock = self._key_locks.get(key)
+        if lock is not None and not lock.locked():
+            del self._key_locks[key]
+        return self._clients.pop(key)
+
+    async def evict_idle(self) -> None:
+        """오래 쓰지 않은 클라이언트 정리 (주기적으로 호출 가능)"""
+        await self._disconnect_all(self._pop_idle())
+
+    async def close(self) -> None:
+        """모든 클라이언트 연결 해제"""
+        await self._disconnect_all([self._pop(key) for key in list(self._clients)])
+
+    @classmethod
+    async def _disconnect_all(cls, clients: List[_PooledClient]) -> None:
+        """여러 클라이언트 동시에 연결 해제"""
+        if clients:
+            await asyncio.gather(*(cls._disconnect(pooled) for pooled in clients))
+
+    @staticmethod
+    async def _disconnect(pooled: _PooledClient) -> None:
+        """클라이언트 연결 해제 (오류 무시)"""
+        try:
+            await pooled.client.disconnect()
+        except Exception:
+            pass
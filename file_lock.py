@@ -0,0 +1,124 @@
+# type: ignore
+"""
+프로세스 간 세션 잠금
+여러 프로세스가 같은 세션 디렉토리에 쓸 때 세션 단위로 충돌을 막는 권고 잠금
+(리눅스/맥은 fcntl, 윈도우는 msvcrt)
+
+잠금 파일 하나에서 세션 키마다 다른 바이트 위치를 잠그므로 세션 수만큼
+잠금 파일을 만들지 않고도 서로 다른 세션은 동시에 쓸 수 있습니다.
+인덱스 등 공유 메타데이터는 0번 바이트를 잠가서 짧게만 보호합니다.
+
+Python 3.11.9
+PEP8 준수
+"""
+
+import hashlib
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Union
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+LOCK_FILENAME = "locks"
+
+# 세션 키를 배치할 바이트 범위 (0번은 메타데이터 잠금)
+_METADATA_OFFSET = 0
+_SESSION_SLOTS = 2 ** 30
+
+# msvcrt.locking이 바로 잠그지 못했을 때 다시 시도하는 간격 (초)
+_WINDOWS_RETRY_DELAY = 0.05
+
+
+def _session_offset(key: str) -> int:
+    """세션 키의 잠금 바이트 위치 (1 이상)"""
+    digest = hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest()
+    return 1 + int.from_bytes(digest, "big") % _SESSION_SLOTS
+
+
+class SessionLocks:
+    """잠금 파일 하나로 세션별/메타데이터 잠금을 제공"""
+
+    def __init__(self, meta_dir: Union[str, Path]) -> None:
+        """
+        잠금 파일 열기 (저장소를 닫을 때까지 열어둠)
+
+        fcntl 잠금은 같은 파일의 fd를 하나라도 닫으면 프로세스의 잠금이
+        모두 풀리므로 fd는 하나만 사용합니다. 같은 프로세스 안의 스레드끼리는
+        저장소의 스레드 잠금으로 따로 보호해야 합니다.
+
+        Args:
+            meta_dir: 잠금 파일을 둘 메타 디렉토리
+        """
+        self.path = Path(meta_dir) / LOCK_FILENAME
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        # 윈도우는 잠글 위치로 이동한 뒤 잠그므로 이동과 잠금을 함께 보호
+        self._seek_lock = threading.Lock()
+
+    @contextmanager
+    def session(self, key: str) -> Iterator[None]:
+        """
+        세션 하나의 쓰기 잠금
+
+        Args:
+            key: 세션 키 (파일명)
+        """
+        with self._locked(_session_offset(key)):
+            yield
+
+    @contextmanager
+    def metadata(self) -> Iterator[None]:
+        """인덱스/상태/사용 기록 저널 갱신 잠금"""
+        with self._locked(_METADATA_OFFSET):
+            yield
+
+    def close(self) -> None:
+        """잠금 파일 닫기 (남은 잠금도 모두 풀림)"""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    @contextmanager
+    def _locked(self, offset: int) -> Iterator[None]:
+        """offset 위치의 1바이트를 잠그고 블록이 끝나면 풀기"""
+        self._acquire(offset)
+        try:
+            yield
+        finally:
+            self._release(offset)
+
+    def _acquire(self, offset: int) -> None:
+        if fcntl is not None:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, 1, offset, os.SEEK_SET)
+            return
+
+        if msvcrt is not None:
+            while True:
+                with self._seek_lock:
+                    os.lseek(self._fd, offset, os.SEEK_SET)
+                    try:
+                        msvcrt.locking(self._fd, msvcrt.LK_NBLCK, 1)
+                        return
+                    except OSError:
+                        pass
+                time.sleep(_WINDOWS_RETRY_DELAY)
+
+    def _release(self, offset: int) -> None:
+        if fcntl is not None:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, 1, offset, os.SEEK_SET)
+            return
+
+        if msvcrt is not None:
+            with self._seek_lock:
+                os.lseek(self._fd, offset, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,218 @@
+# type: ignore
+"""
+세션 디렉토리 변경 감지
+다른 프로세스가 같은 세션 디렉토리를 수정했는지 확인해서
+메모리에 캐시한 메타데이터를 버릴 시점을 알려주는 기능
+
+- InotifyWatcher: 리눅스 inotify (ctypes, 논블로킹 fd) - 변경 즉시 감지
+- PollingWatcher: 그 외 환경 - 일정 간격으로 수정 시간 비교
+
+Python 3.11.9
+PEP8 준수
+"""
+
+import ctypes
+import ctypes.util
+import os
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+# inotify 이벤트 마스크 (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+
+WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+)
+
+# inotify_event 구조체의 고정 길이 부분 (wd, mask, cookie, len)
+_EVENT_HEADER = struct.Struct("iIII")
+
+# 폴링 방식의 기본 확인 간격 (초) - 다른 프로세스의 변경이 늦게 보이는 최대 시간
+DEFAULT_POLL_INTERVAL = 1.0
+
+PathLike = Union[str, Path]
+
+
+class PollingWatcher:
+    """디렉토리/파일의 수정 시간을 일정 간격으로 비교하는 감시기"""
+
+    def __init__(self, paths: Iterable[PathLike],
+                 interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        """
+        폴링 감시기 초기화
+
+        Args:
+            paths: 감시할 디렉토리/파일 (없는 경로도 가능)
+            interval: 확인 간격 (초, 이 간격 안의 호출은 stat 없이 바로 반환)
+        """
+        self.paths = [Path(path) for path in paths]
+        self.interval = interval
+        self._snapshot = self._take_snapshot()
+        self._last_check = time.monotonic()
+
+    def changed(self) -> bool:
+        """
+        마지막 확인 이후 변경 여부
+
+        Returns:
+            변경되었으면 True
+        """
+        return bool(self.poll())
+
+    def poll(self) -> Set[Path]:
+        """
+        마지막 확인 이후 변경된 감시 경로
+
+        Returns:
+            수정 시간/크기가 바뀐 경로 집합 (없으면 빈 집합)
+        """
+        now = time.monotonic()
+        if now - self._last_check < self.interval:
+            return set()
+        self._last_check = now
+
+        snapshot = self._take_snapshot()
+        if snapshot == self._snapshot:
+            return set()
+
+        changed = {
+            path for path, before, after in zip(self.paths, self._snapshot, snapshot)
+            if before != after
+        }
+        self._snapshot = snapshot
+        return changed
+
+    def close(self) -> None:
+        """감시 종료"""
+
+    def _take_snapshot(self) -> List[Optional[Tuple[int, int]]]:
+        """경로별 (수정 시간, 크기)"""
+        snapshot = []
+        for path in self.paths:
+            try:
+                stat = os.stat(path)
+                snapshot.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                snapshot.append(None)
+        return snapshot
+
+
+class InotifyWatcher:
+    """리눅스 inotify로 디렉토리 안의 변경을 감지하는 감시기"""
+
+    def __init__(self, directories: Iterable[PathLike]) -> None:
+        """
+        inotify 감시기 초기화
+
+        Args:
+            directories: 감시할 디렉토리 (안의 파일 변경도 감지)
+
+        Raises:
+            OSError: inotify를 사용할 수 없는 경우
+        """
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+        # 감시 번호(wd) -> 디렉토리
+        self._paths: Dict[int, Path] = {}
+        try:
+            for directory in directories:
+                wd = libc.inotify_add_watch(self._fd, os.fsencode(str(directory)), WATCH_MASK)
+                if wd < 0:
+                    errno = ctypes.get_errno()
+                    raise OSError(errno, os.strerror(errno), str(directory))
+                self._paths[wd] = Path(directory)
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+    def changed(self) -> bool:
+        """
+        마지막 확인 이후 변경 여부 (쌓인 이벤트를 모두 비움, 기다리지 않음)
+
+        Returns:
+            변경되었으면 True
+        """
+        return bool(self.poll())
+
+    def poll(self) -> Set[Path]:
+        """
+        마지막 확인 이후 안의 내용이 바뀐 감시 디렉토리 (쌓인 이벤트를 모두 비움)
+
+        이벤트 큐가 넘쳐서 일부 이벤트를 잃었으면 모든 디렉토리를 돌려줍니다.
+
+        Returns:
+            변경된 디렉토리 집합 (없으면 빈 집합)
+        """
+        if self._fd < 0:
+            return set(self._paths.values())
+
+        changed = set()
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                wd, mask, _, name_length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size + name_length
+
+                if mask & IN_Q_OVERFLOW or wd not in self._paths:
+                    changed.update(self._paths.values())
+                else:
+                    changed.add(self._paths[wd])
+
+        return changed
+
+    def close(self) -> None:
+        """감시 종료"""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def create_watcher(directories: Iterable[PathLike], files: Iterable[PathLike] = (),
+                   poll_interval: float = DEFAULT_POLL_INTERVAL):
+    """
+    사용할 수 있는 가장 좋은 감시기 생성
+
+    리눅스에서는 inotify를 쓰고, 그 외 환경이나 inotify를 쓸 수 없으면
+    (감시 수 제한 등) 폴링으로 대신합니다.
+
+    Args:
+        directories: 감시할 디렉토리 (없는 디렉토리는 무시)
+        files: 폴링 방식에서 추가로 수정 시간을 비교할 파일 (추가 전용 로그 등)
+        poll_interval: 폴링 간격 (초)
+
+    Returns:
+        changed()/poll()/close()를 가진 감시기
+    """
+    directories = [Path(directory) for directory in directories if Path(directory).is_dir()]
+
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(directories)
+        except (OSError, AttributeError):
+            pass
+
+    return PollingWatcher([*directories, *files], poll_interval)
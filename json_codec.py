@@ -0,0 +1,183 @@
+# type: ignore
+"""
+JSON 직렬화 백엔드
+세션 파일/인덱스를 읽고 쓸 때 쓰는 JSON 인코더/디코더를 한 곳에서 고르는 기능
+
+- orjson 또는 msgspec이 설치되어 있으면 사용하고, 없으면 표준 json으로 동작
+- 출력은 항상 UTF-8 바이트 (한글을 \\uXXXX로 바꾸지 않음)
+- indent를 주면 들여쓴 JSON, None이면 공백 없는 한 줄 JSON (compact)
+- 읽을 때는 공백을 신경 쓰지 않으므로 들여쓴 파일과 한 줄 파일을 모두 읽음
+- TGCC_JSON_BACKEND 환경변수로 백엔드 지정 가능 (auto, orjson, msgspec, json)
+
+백엔드별 속도 비교: python benchmarks/json_bench.py
+
+Python 3.11.9
+PEP8 준수
+"""
+
+import json
+import os
+from typing import IO, Any, Callable, Dict, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    from . import log_config
+except ImportError:
+    import log_config
+
+logger = log_config.get_logger(__name__)
+
+JSON_BACKEND_ENV = "TGCC_JSON_BACKEND"
+# auto일 때 고르는 순서
+JSON_BACKENDS = ("orjson", "msgspec", "json")
+
+Dumps = Callable[[Any, Optional[int]], bytes]
+Loads = Callable[[Union[bytes, str]], Any]
+
+
+def _json_dumps(data: Any, indent: Optional[int] = None) -> bytes:
+    if indent is None:
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, indent=indent).encode('utf-8')
+
+
+def _orjson_dumps(data: Any, indent: Optional[int] = None) -> bytes:
+    # orjson은 2칸 들여쓰기만 지원하므로 다른 값은 표준 json으로 처리
+    if indent is None:
+        return orjson.dumps(data)
+    if indent == 2:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return _json_dumps(data, indent)
+
+
+def _msgspec_codec() -> Tuple[Dumps, Loads]:
+    """msgspec 인코더/디코더 (재사용하는 편이 빠르므로 한 번만 만듦)"""
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+
+    def dumps(data: Any, indent: Optional[int] = None) -> bytes:
+        encoded = encoder.encode(data)
+        if indent is None:
+            return encoded
+        return msgspec.json.format(encoded, indent=indent)
+
+    def loads(raw: Union[bytes, str]) -> Any:
+        try:
+            return decoder.decode(raw)
+        except msgspec.DecodeError as e:
+            # 다른 백엔드처럼 ValueError로 (호출하는 쪽은 ValueError만 처리함)
+            raise ValueError(str(e)) from None
+
+    return dumps, loads
+
+
+def _available() -> Dict[str, Callable[[], Tuple[Dumps, Loads]]]:
+    """설치된 백엔드 이름 -> (dumps, loads)를 만드는 함수"""
+    backends = {}
+    if orjson is not None:
+        backends["orjson"] = lambda: (_orjson_dumps, orjson.loads)
+    if msgspec is not None:
+        backends["msgspec"] = _msgspec_codec
+    backends["json"] = lambda: (_json_dumps, json.loads)
+    return backends
+
+
+def available_backends() -> Tuple[str, ...]:
+    """
+    사용할 수 있는 백엔드 이름
+
+    Returns:
+        설치된 백엔드 이름 (빠른 순서, json은 항상 포함)
+    """
+    return tuple(_available())
+
+
+def get_codec(backend: str = "auto") -> Tuple[Dumps, Loads]:
+    """
+    백엔드의 (dumps, loads) 반환
+
+    Args:
+        backend: "auto"(설치된 것 중 가장 빠른 것), "orjson", "msgspec" 또는 "json"
+
+    Returns:
+        (dumps(data, indent) -> bytes, loads(bytes 또는 str) -> 데이터)
+
+    Raises:
+        ValueError: 알 수 없거나 설치되지 않은 백엔드인 경우
+    """
+    backends = _available()
+    if backend == "auto":
+        backend = next(iter(backends))
+
+    if backend not in backends:
+        if backend in JSON_BACKENDS:
+            raise ValueError(f"{backend} 패키지가 설치되어 있지 않습니다: pip install {backend}")
+        raise ValueError(f"알 수 없는 JSON 백엔드: {backend} (가능: auto, {', '.join(JSON_BACKENDS)})")
+    return backends[backend]()
+
+
+def use_backend(backend: str = "auto") -> str:
+    """
+    모듈 수준 dumps/loads/load가 쓸 백엔드 변경
+
+    Args:
+        backend: get_codec()과 같음
+
+    Returns:
+        선택된 백엔드 이름
+
+    Raises:
+        ValueError: 알 수 없거나 설치되지 않은 백엔드인 경우
+    """
+    global BACKEND, _dumps, _loads
+
+    _dumps, _loads = get_codec(backend)
+    BACKEND = next(iter(_available())) if backend == "auto" else backend
+    return BACKEND
+
+
+def dumps(data: Any, indent: Optional[int] = None) -> bytes:
+    """
+    데이터를 JSON 바이트로
+
+    Args:
+        data: JSON으로 쓸 데이터
+        indent: 들여쓰기 (None이면 공백 없는 한 줄)
+
+    Returns:
+        UTF-8 JSON 바이트
+    """
+    return _dumps(data, indent)
+
+
+def loads(raw: Union[bytes, str]) -> Any:
+    """
+    JSON 바이트/문자열을 데이터로 (들여쓰기 여부와 상관없음)
+
+    Raises:
+        ValueError: 올바른 JSON이 아닌 경우
+    """
+    return _loads(raw)
+
+
+def load(f: IO) -> Any:
+    """열린 파일 전체를 JSON으로 읽기 (바이너리 모드로 열면 디코딩을 한 번 덜 함)"""
+    return _loads(f.read())
+
+
+BACKEND = "json"
+_dumps, _loads = _json_dumps, json.loads
+try:
+    use_backend(os.environ.get(JSON_BACKEND_ENV, "").strip().lower() or "auto")
+except ValueError as e:
+    # 잘못 지정한 환경변수로 프로그램이 시작하지 못하지 않도록 자동 선택
+    logger.warning("⚠️ %s: %s (자동 선택: %s)", JSON_BACKEND_ENV, e, use_backend("auto"))
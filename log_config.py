@@ -0,0 +1,156 @@
+# type: ignore
+"""
+로깅 설정
+라이브러리 모듈(저장소, 세션 관리자 등)은 get_logger()로 받은 로거에 레벨별로
+기록만 하고, 출력 여부와 위치는 실행 프로그램이 configure()로 정하는 기능
+
+- 아무것도 설정하지 않으면 출력하지 않음 (라이브러리로 쓸 때는 조용함)
+- configure(): 지정한 레벨 이상을 스트림에 출력. 기본은 QueueHandler로 큐에만
+  넣고 별도 스레드의 QueueListener가 실제로 쓰므로 호출한 쪽은 출력을 기다리지 않음
+- 대화형 메뉴는 입력 프롬프트와 순서가 섞이지 않도록 use_queue=False로 바로 출력
+- TGCC_LOG_LEVEL 환경변수로 레벨 지정 가능 (debug, info, warning, error, critical)
+
+사용 예:
+    logger = log_config.get_logger(__name__)
+    logger.info("💾 세션이 저장되었습니다: %s", path)
+
+Python 3.11.9
+PEP8 준수
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+from typing import Optional, TextIO, Union
+
+LOGGER_NAME = "tgcc"
+LOG_LEVEL_ENV = "TGCC_LOG_LEVEL"
+LOG_LEVELS = ("debug", "info", "warning", "error", "critical")
+
+# 대화형 메뉴용 (안내 메시지에 이미 이모지가 붙어 있으므로 메시지만)
+CONSOLE_FORMAT = "%(message)s"
+# 로그 파일/디버깅용
+DETAILED_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+# 설정하지 않으면 logging의 기본 출력(lastResort)으로 경고가 새지 않도록 NullHandler
+_root_logger = logging.getLogger(LOGGER_NAME)
+_root_logger.addHandler(logging.NullHandler())
+
+_handler: Optional[logging.Handler] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue: Optional[queue.Queue] = None
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    모듈용 로거 반환
+
+    Args:
+        name: 모듈 이름 (보통 __name__)
+
+    Returns:
+        "tgcc." 아래의 로거
+    """
+    return logging.getLogger(f"{LOGGER_NAME}.{name}")
+
+
+def _resolve_level(level: Union[str, int, None], default: str) -> int:
+    """레벨 이름/숫자를 logging 레벨로 (None이면 환경변수, 그것도 없으면 기본값)"""
+    if level is None:
+        level = os.environ.get(LOG_LEVEL_ENV, "").strip() or default
+    if isinstance(level, int):
+        return level
+
+    if level.lower() not in LOG_LEVELS:
+        raise ValueError(f"알 수 없는 로그 레벨: {level} (가능: {', '.join(LOG_LEVELS)})")
+    return getattr(logging, level.upper())
+
+
+def configure(level: Union[str, int, None] = None,
+              stream: Optional[TextIO] = None,
+              fmt: str = CONSOLE_FORMAT,
+              use_queue: bool = True,
+              default_level: str = "info") -> logging.Logger:
+    """
+    로그 출력 설정 (다시 호출하면 이전 설정을 대체)
+
+    Args:
+        level: 출력할 최소 레벨 (None이면 TGCC_LOG_LEVEL 환경변수 또는 default_level)
+        stream: 출력 스트림 (None이면 stderr)
+        fmt: 메시지 형식
+        use_queue: 큐와 별도 스레드로 출력할지 여부 (False면 호출한 스레드에서 바로 출력)
+        default_level: level과 환경변수가 모두 없을 때 레벨
+
+    Returns:
+        최상위 로거
+
+    Raises:
+        ValueError: 알 수 없는 로그 레벨인 경우
+    """
+    global _handler, _listener, _queue
+
+    resolved = _resolve_level(level, default_level)
+    shutdown()
+
+    handler = logging.StreamHandler(stream or sys.stderr)
+    handler.setFormatter(logging.Formatter(fmt))
+
+    if use_queue:
+        _queue = queue.Queue()
+        _listener = logging.handlers.QueueListener(_queue, handler)
+        _listener.start()
+        _handler = logging.handlers.QueueHandler(_queue)
+    else:
+        _handler = handler
+
+    _root_logger.addHandler(_handler)
+    _root_logger.setLevel(resolved)
+    # 설정한 뒤에는 응용 프로그램의 루트 로거로 같은 메시지가 한 번 더 나가지 않게 함
+    _root_logger.propagate = False
+    return _root_logger
+
+
+def configure_console(level: Union[str, int, None] = None) -> logging.Logger:
+    """
+    대화형 메뉴용 설정 (안내 메시지를 stdout에 바로 출력)
+
+    Args:
+        level: 출력할 최소 레벨 (None이면 TGCC_LOG_LEVEL 환경변수 또는 info)
+
+    Returns:
+        최상위 로거
+    """
+    try:
+        return configure(level, stream=sys.stdout, use_queue=False)
+    except ValueError as e:
+        # 환경변수를 잘못 지정해도 메뉴는 기본 레벨로 실행
+        root = configure("info", stream=sys.stdout, use_queue=False)
+        root.warning("⚠️ %s", e)
+        return root
+
+
+def flush() -> None:
+    """큐에 쌓인 메시지가 모두 출력될 때까지 대기 (큐를 쓰지 않으면 바로 반환)"""
+    if _queue is not None:
+        _queue.join()
+
+
+def shutdown() -> None:
+    """출력 스레드를 멈추고 (남은 메시지는 모두 출력) 설정 해제"""
+    global _handler, _listener, _queue
+
+    if _listener is not None:
+        _listener.stop()
+    if _handler is not None:
+        _root_logger.removeHandler(_handler)
+        _handler.close()
+
+    _handler = _listener = _queue = None
+    _root_logger.setLevel(logging.NOTSET)
+    _root_logger.propagate = True
+
+
+atexit.register(shutdown)
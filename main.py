@@ -13,12 +13,18 @@ from typing import Optional
 # 로컬 모듈 import
 try:
     from session_creator import SessionCreator, get_api_credentials, get_phone_number
-    from session_manager import SessionManager, test_session_connection
+    from session_manager import SessionManager
+    from client_pool import ClientPool
+    import log_config
+    import metrics
 except ImportError as e:
     print(f"❌ 모듈 import 오류: {e}")
     print("session_creator.py와 session_manager.py 파일이 같은 폴더에 있는지 확인하세요.")
     exit(1)
 
+# 세션 목록을 한 번에 보여줄 개수
+LIST_PAGE_SIZE = 20
+
 
 class SimpleTelegramSessionApp:
     """간단한 텔레그램 세션 앱"""
@@ -28,11 +34,18 @@ class SimpleTelegramSessionApp:
         self.session_manager = SessionManager()
         self.api_id: Optional[int] = None
         self.api_hash: Optional[str] = None
+        self.client_pool: Optional[ClientPool] = None
 
-    def setup_api_credentials(self) -> None:
+    async def setup_api_credentials(self) -> None:
         """API 인증 정보 설정"""
         print("🔑 API 정보를 설정합니다.")
         self.api_id, self.api_hash = get_api_credentials()
+
+        # API 정보가 바뀌면 기존 연결은 재사용할 수 없음
+        if self.client_pool:
+            await self.client_pool.close()
+        self.client_pool = ClientPool(self.api_id, self.api_hash)
+
         print("✅ API 정보가 설정되었습니다!")
 
     async def create_new_session(self) -> None:
@@ -68,7 +81,7 @@ class SimpleTelegramSessionApp:
                     notes = None
 
                 # 세션 저장
-                success = self.session_manager.save_session(
+                success = await self.session_manager.asave_session(
                     session_string=session_string,
                     name=name,
                     phone=phone,
@@ -91,14 +104,14 @@ class SimpleTelegramSessionApp:
         else:
             print("❌ 세션 생성에 실패했습니다.")
 
-    def view_saved_sessions(self) -> None:
+    async def view_saved_sessions(self) -> None:
         """저장된 세션 목록 보기"""
         print("\n📋 저장된 세션들:")
-        self.session_manager.print_sessions_list()
+        await self.session_manager.aprint_sessions_list(page_size=LIST_PAGE_SIZE)
 
     async def load_saved_session(self) -> None:
         """저장된 세션 불러오기"""
-        sessions = self.session_manager.list_sessions()
+        sessions = await self.session_manager.alist_sessions()
 
         if not sessions:
             print("📭 저장된 세션이 없습니다.")
@@ -106,9 +119,9 @@ class SimpleTelegramSessionApp:
 
         print("\n📋 사용 가능한 세션:")
         for i, session in enumerate(sessions, 1):
-            phone = session.get('phone', 'Unknown')
-            notes = session.get('notes', '')
-            print(f"{i:2d}. {session['name']} ({phone})")
+            phone = session.phone or 'Unknown'
+            notes = session.notes
+            print(f"{i:2d}. {session.name} ({phone})")
             if notes:
                 print(f"     메모: {notes}")
 
@@ -116,8 +129,8 @@ class SimpleTelegramSessionApp:
             idx = int(input("\n📂 불러올 세션 번호를 선택하세요: ")) - 1
 
             if 0 <= idx < len(sessions):
-                session_name = sessions[idx]["name"]
-                session_string = self.session_manager.load_session(session_name)
+                session_name = sessions[idx].name
+                session_string = await self.session_manager.aload_session(session_name)
 
                 if session_string:
                     print("\n" + "=" * 60)
@@ -133,8 +146,9 @@ class SimpleTelegramSessionApp:
                             "\n🔍 세션을 테스트해보시겠습니까? (y/n): "
                         ).strip().lower()
                         if test_choice in ['y', 'yes', '예']:
-                            await test_session_connection(
-                                session_string, self.api_id, self.api_hash
+                            await self.session_manager.test_connection(
+                                session_name, self.api_id, self.api_hash,
+                                pool=self.client_pool
                             )
 
                 else:
@@ -145,9 +159,9 @@ class SimpleTelegramSessionApp:
         except ValueError:
             print("❌ 숫자를 입력하세요.")
 
-    def delete_saved_session(self) -> None:
+    async def delete_saved_session(self) -> None:
         """저장된 세션 삭제"""
-        sessions = self.session_manager.list_sessions()
+        sessions = await self.session_manager.alist_sessions()
 
         if not sessions:
             print("📭 저장된 세션이 없습니다.")
@@ -155,20 +169,20 @@ class SimpleTelegramSessionApp:
 
         print("\n📋 저장된 세션:")
         for i, session in enumerate(sessions, 1):
-            phone = session.get('phone', 'Unknown')
-            print(f"{i:2d}. {session['name']} ({phone})")
+            phone = session.phone or 'Unknown'
+            print(f"{i:2d}. {session.name} ({phone})")
 
         try:
             idx = int(input("\n🗑️ 삭제할 세션 번호를 선택하세요: ")) - 1
 
             if 0 <= idx < len(sessions):
-                session_name = sessions[idx]["name"]
+                session_name = sessions[idx].name
 
                 print(f"\n⚠️ 정말로 '{session_name}' 세션을 삭제하시겠습니까?")
                 confirm = input("삭제하려면 'DELETE'를 입력하세요: ").strip()
 
                 if confirm == "DELETE":
-                    success = self.session_manager.delete_session(session_name)
+                    success = await self.session_manager.adelete_session(session_name)
                     if success:
                         print("✅ 세션이 삭제되었습니다.")
                     else:
@@ -181,6 +195,12 @@ class SimpleTelegramSessionApp:
         except ValueError:
             print("❌ 숫자를 입력하세요.")
 
+    async def close(self) -> None:
+        """풀에 남은 연결을 끊고 저장소 정리"""
+        if self.client_pool:
+            await self.client_pool.close()
+        self.session_manager.close()
+
     async def run(self) -> None:
         """메인 실행 루프"""
         print("🤖 간단한 텔레그램 세션 관리 프로그램")
@@ -205,19 +225,19 @@ class SimpleTelegramSessionApp:
 
             try:
                 if choice == "1":
-                    self.setup_api_credentials()
+                    await self.setup_api_credentials()
 
                 elif choice == "2":
                     await self.create_new_session()
 
                 elif choice == "3":
-                    self.view_saved_sessions()
+                    await self.view_saved_sessions()
 
                 elif choice == "4":
                     await self.load_saved_session()
 
                 elif choice == "5":
-                    self.delete_saved_session()
+                    await self.delete_saved_session()
 
                 elif choice == "6":
                     print("👋 프로그램을 종료합니다.")
@@ -236,6 +256,12 @@ class SimpleTelegramSessionApp:
 
 async def main() -> None:
     """프로그램 진입점"""
+    # 저장/불러오기 등의 안내 메시지를 화면에 출력 (TGCC_LOG_LEVEL로 레벨 조정)
+    log_config.configure_console()
+    # TGCC_METRICS 환경변수가 있으면 성능 측정 (종료할 때 결과 출력)
+    metrics.enable_from_env()
+
+    app = None
     try:
         app = SimpleTelegramSessionApp()
         await app.run()
@@ -246,6 +272,10 @@ async def main() -> None:
         print(f"\n❌ 예상치 못한 오류: {general_error}")
         input("아무 키나 눌러서 종료...")
 
+    finally:
+        if app:
+            await app.close()
+
 
 if __name__ == "__main__":
     asyncio.run(main())
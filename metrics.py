@@ -0,0 +1,450 @@
+# type: ignore
+"""
+작업별 성능 측정
+세션 저장/불러오기, 디스크 읽기/쓰기, JSON 파싱, 텔레그램 연결 등의
+지연 시간 히스토그램과 카운터를 모으고 Prometheus 텍스트나 JSON으로 출력하는 기능
+
+기본값은 꺼짐이며, 꺼져 있을 때는 측정 지점마다 전역 변수 하나만 확인하고
+아무것도 하지 않는 타이머를 돌려주므로 비용이 거의 없습니다.
+
+사용 예:
+    import metrics
+    metrics.enable()
+    with metrics.timer("disk_read"):
+        ...
+    print(metrics.dump("prometheus"))
+
+환경변수 (enable_from_env()를 호출하는 진입점에서 사용):
+    TGCC_METRICS=prometheus|json   측정을 켜고 종료할 때 결과 출력
+    TGCC_METRICS_FILE=경로          결과를 stderr 대신 파일에 기록
+
+Python 3.11.9
+PEP8 준수
+"""
+
+import atexit
+import bisect
+import functools
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    from . import log_config
+except ImportError:
+    import log_config
+
+logger = log_config.get_logger(__name__)
+
+METRICS_ENV = "TGCC_METRICS"
+METRICS_FILE_ENV = "TGCC_METRICS_FILE"
+DUMP_FORMATS = ("prometheus", "json")
+
+# Prometheus 메트릭 이름 앞에 붙는 접두사
+METRIC_PREFIX = "tgcc"
+
+# 지연 시간 히스토그램 구간 상한 (초, 로컬 디스크 ~ 네트워크 왕복)
+DEFAULT_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+# 텔레그램 클라이언트에서 측정하는 코루틴
+CLIENT_OPERATIONS = ("connect", "is_user_authorized", "get_me", "disconnect")
+
+
+class Histogram:
+    """누적하지 않는 구간별 개수, 합계, 횟수를 보관하는 히스토그램"""
+
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.buckets = buckets
+        # 마지막 칸은 가장 큰 상한보다 큰 값 (+Inf)
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """측정값 하나 추가"""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        구간 상한으로 근사한 분위수 (값이 없으면 None)
+
+        Args:
+            q: 0~1 사이 분위 (0.5 = 중앙값)
+        """
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        seen = 0
+        for upper, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return upper
+        return float("inf")
+
+
+class _Timer:
+    """블록 실행 시간을 측정해서 레지스트리에 기록하는 컨텍스트 매니저"""
+
+    __slots__ = ("_registry", "_operation", "_started")
+
+    def __init__(self, registry: "MetricsRegistry", operation: str) -> None:
+        self._registry = registry
+        self._operation = operation
+
+    def __enter__(self) -> None:
+        self._started = time.perf_counter()
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self._registry.observe(self._operation, time.perf_counter() - self._started,
+                               failed=exc_type is not None)
+        return False
+
+
+class _NullTimer:
+    """측정이 꺼져 있을 때 쓰는 아무것도 하지 않는 타이머 (하나를 공유)"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class MetricsRegistry:
+    """작업별 지연 시간 히스토그램과 카운터 모음 (스레드 안전)"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """
+        레지스트리 초기화
+
+        Args:
+            buckets: 히스토그램 구간 상한 (초, 오름차순)
+        """
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Histogram] = {}
+        self._errors: Dict[str, int] = {}
+        self._counters: Dict[str, float] = {}
+
+    def timer(self, operation: str) -> _Timer:
+        """
+        블록 실행 시간 측정 (예외가 나면 오류 횟수도 기록)
+
+        Args:
+            operation: 작업 이름 (예: "disk_read")
+        """
+        return _Timer(self, operation)
+
+    def observe(self, operation: str, seconds: float, failed: bool = False) -> None:
+        """
+        작업 한 번의 소요 시간 기록
+
+        Args:
+            operation: 작업 이름
+            seconds: 소요 시간 (초)
+            failed: 예외로 끝났는지 여부
+        """
+        with self._lock:
+            histogram = self._histograms.get(operation)
+            if histogram is None:
+                histogram = self._histograms[operation] = Histogram(self.buckets)
+            histogram.observe(seconds)
+            if failed:
+                self._errors[operation] = self._errors.get(operation, 0) + 1
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """
+        카운터 증가
+
+        Args:
+            name: 카운터 이름 (예: "disk_read_bytes")
+            value: 증가량
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def reset(self) -> None:
+        """모든 측정값 지우기"""
+        with self._lock:
+            self._histograms.clear()
+            self._errors.clear()
+            self._counters.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        현재 측정값 요약
+
+        Returns:
+            {"operations": {작업: {count, errors, sum_seconds, mean_ms, p50_ms, p90_ms,
+             p99_ms, buckets}}, "counters": {이름: 값}}
+        """
+        with self._lock:
+            operations = {}
+            for operation, histogram in sorted(self._histograms.items()):
+                operations[operation] = {
+                    "count": histogram.count,
+                    "errors": self._errors.get(operation, 0),
+                    "sum_seconds": round(histogram.sum, 6),
+                    "mean_ms": round(histogram.sum / histogram.count * 1000, 3),
+                    "p50_ms": _to_ms(histogram.quantile(0.5)),
+                    "p90_ms": _to_ms(histogram.quantile(0.9)),
+                    "p99_ms": _to_ms(histogram.quantile(0.99)),
+                    "buckets": {
+                        _format_bound(upper): count
+                        for upper, count in zip((*self.buckets, float("inf")), histogram.counts)
+                    }
+                }
+            return {"operations": operations, "counters": dict(sorted(self._counters.items()))}
+
+    def to_json(self) -> str:
+        """측정값을 JSON 문자열로"""
+        return json.dumps(self.snapshot(), ensure_ascii=False, indent=2)
+
+    def to_prometheus(self) -> str:
+        """측정값을 Prometheus 텍스트 형식으로"""
+        seconds = f"{METRIC_PREFIX}_operation_seconds"
+        errors = f"{METRIC_PREFIX}_operation_errors_total"
+        lines = [
+            f"# HELP {seconds} Operation latency in seconds.",
+            f"# TYPE {seconds} histogram"
+        ]
+
+        with self._lock:
+            for operation, histogram in sorted(self._histograms.items()):
+                cumulative = 0
+                for upper, count in zip((*self.buckets, float("inf")), histogram.counts):
+                    cumulative += count
+                    lines.append(
+                        f'{seconds}_bucket{{operation="{operation}",le="{_format_bound(upper)}"}} {cumulative}'
+                    )
+                lines.append(f'{seconds}_sum{{operation="{operation}"}} {histogram.sum!r}')
+                lines.append(f'{seconds}_count{{operation="{operation}"}} {histogram.count}')
+
+            lines.append(f"# HELP {errors} Operations that raised an exception.")
+            lines.append(f"# TYPE {errors} counter")
+            for operation in sorted(self._histograms):
+                lines.append(f'{errors}{{operation="{operation}"}} {self._errors.get(operation, 0)}')
+
+            for name, value in sorted(self._counters.items()):
+                metric = f"{METRIC_PREFIX}_{name}_total"
+                lines.append(f"# TYPE {metric} counter")
+                lines.append(f"{metric} {value}")
+
+        return "\n".join(lines) + "\n"
+
+
+class InstrumentedClient:
+    """
+    텔레그램 클라이언트의 connect/is_user_authorized/get_me/disconnect 시간을 측정하는 래퍼
+
+    나머지 속성과 메서드는 감싼 클라이언트에 그대로 넘깁니다.
+    """
+
+    def __init__(self, client: Any) -> None:
+        self._client = client
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+
+def _timed_client_call(operation: str) -> Callable[..., Any]:
+    """감싼 클라이언트의 코루틴을 시간 측정과 함께 호출하는 메서드 생성"""
+    async def method(self, *args: Any, **kwargs: Any) -> Any:
+        with timer(operation):
+            return await getattr(self._client, operation)(*args, **kwargs)
+
+    method.__name__ = operation
+    return method
+
+
+for _operation in CLIENT_OPERATIONS:
+    setattr(InstrumentedClient, _operation, _timed_client_call(_operation))
+
+
+# 측정이 꺼져 있으면 None
+_registry: Optional[MetricsRegistry] = None
+
+
+def enable(buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> MetricsRegistry:
+    """
+    측정 켜기 (이미 켜져 있으면 기존 레지스트리 유지)
+
+    Args:
+        buckets: 히스토그램 구간 상한 (초)
+
+    Returns:
+        측정값을 모으는 레지스트리
+    """
+    global _registry
+    if _registry is None:
+        _registry = MetricsRegistry(buckets)
+    return _registry
+
+
+def disable() -> None:
+    """측정 끄기 (모은 측정값도 버림)"""
+    global _registry
+    _registry = None
+
+
+def get_registry() -> Optional[MetricsRegistry]:
+    """현재 레지스트리 (꺼져 있으면 None)"""
+    return _registry
+
+
+def timer(operation: str) -> Any:
+    """
+    블록 실행 시간 측정 (꺼져 있으면 아무것도 하지 않음)
+
+    Args:
+        operation: 작업 이름
+    """
+    registry = _registry
+    if registry is None:
+        return _NULL_TIMER
+    return _Timer(registry, operation)
+
+
+def increment(name: str, value: float = 1) -> None:
+    """
+    카운터 증가 (꺼져 있으면 아무것도 하지 않음)
+
+    Args:
+        name: 카운터 이름
+        value: 증가량
+    """
+    registry = _registry
+    if registry is not None:
+        registry.increment(name, value)
+
+
+def timed(operation: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    함수/코루틴 함수 실행 시간을 측정하는 데코레이터
+
+    Args:
+        operation: 작업 이름
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                registry = _registry
+                if registry is None:
+                    return await func(*args, **kwargs)
+                with _Timer(registry, operation):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            registry = _registry
+            if registry is None:
+                return func(*args, **kwargs)
+            with _Timer(registry, operation):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def instrument_client(client: Any) -> Any:
+    """
+    측정이 켜져 있으면 클라이언트를 InstrumentedClient로 감싸기
+
+    Args:
+        client: TelegramClient 또는 같은 코루틴을 가진 객체
+
+    Returns:
+        감싼 클라이언트 (꺼져 있으면 받은 클라이언트 그대로)
+    """
+    if _registry is None:
+        return client
+    return InstrumentedClient(client)
+
+
+def dump(format: str = "prometheus") -> str:
+    """
+    현재 측정값 출력 문자열
+
+    Args:
+        format: "prometheus" 또는 "json"
+
+    Returns:
+        출력 문자열 (꺼져 있으면 빈 측정값)
+
+    Raises:
+        ValueError: 알 수 없는 형식인 경우
+    """
+    if format not in DUMP_FORMATS:
+        raise ValueError(f"알 수 없는 측정값 형식: {format} (가능: {', '.join(DUMP_FORMATS)})")
+
+    registry = _registry or MetricsRegistry()
+    return registry.to_prometheus() if format == "prometheus" else registry.to_json()
+
+
+def write_dump(format: str, path: Optional[str] = None) -> None:
+    """
+    측정값을 파일이나 stderr에 쓰기
+
+    Args:
+        format: "prometheus" 또는 "json"
+        path: 파일 경로 (None이면 stderr)
+    """
+    text = dump(format)
+    if path:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+    else:
+        sys.stderr.write(text)
+
+
+def enable_from_env() -> Optional[MetricsRegistry]:
+    """
+    TGCC_METRICS 환경변수가 있으면 측정을 켜고 종료할 때 결과 출력
+
+    Returns:
+        레지스트리 (환경변수가 없으면 None)
+    """
+    format = os.environ.get(METRICS_ENV, "").strip().lower()
+    if not format:
+        return None
+    if format not in DUMP_FORMATS:
+        logger.warning("⚠️ %s=%s: 알 수 없는 형식이라 측정을 켜지 않습니다 (가능: %s)",
+                       METRICS_ENV, format, ", ".join(DUMP_FORMATS))
+        return None
+
+    registry = enable()
+    atexit.register(write_dump, format, os.environ.get(METRICS_FILE_ENV) or None)
+    return registry
+
+
+def _to_ms(seconds: Optional[float]) -> Optional[float]:
+    """초를 밀리초로 (값이 없거나 가장 큰 구간 상한을 넘으면 None)"""
+    if seconds is None or seconds == float("inf"):
+        return None
+    return round(seconds * 1000, 3)
+
+
+def _format_bound(upper: float) -> str:
+    """히스토그램 구간 상한 표기 (Prometheus le 라벨)"""
+    return "+Inf" if upper == float("inf") else repr(upper)
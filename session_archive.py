@@ -0,0 +1,130 @@
+# type: ignore
+"""
+세션 아카이브 입출력
+여러 세션을 줄 단위 JSON(NDJSON) 파일 하나로 내보내고 가져오는 기능
+(gzip 또는 zstd 압축 선택 가능)
+
+Python 3.11.9
+PEP8 준수
+"""
+
+import gzip
+import io
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Any, Union
+
+try:
+    from . import json_codec
+except ImportError:
+    import json_codec
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+ARCHIVE_FORMAT = "tgcc-sessions"
+ARCHIVE_VERSION = 1
+
+# 확장자 -> 압축 방식
+COMPRESSION_SUFFIXES = {
+    ".gz": "gzip",
+    ".zst": "zstd",
+}
+
+
+def detect_compression(path: Union[str, Path]) -> Optional[str]:
+    """
+    파일 확장자로 압축 방식 추정
+
+    Args:
+        path: 아카이브 경로
+
+    Returns:
+        "gzip", "zstd" 또는 None(압축 없음)
+    """
+    return COMPRESSION_SUFFIXES.get(Path(path).suffix.lower())
+
+
+def _open_binary(path: Path, mode: str, compression: Optional[str]):
+    """압축 방식에 맞는 바이너리 파일 객체 열기"""
+    if compression is None:
+        return open(path, mode + "b")
+
+    if compression == "gzip":
+        return gzip.open(path, mode + "b")
+
+    if compression == "zstd":
+        if zstandard is None:
+            raise ValueError("zstd 압축을 사용하려면 zstandard 패키지가 필요합니다: pip install zstandard")
+
+        raw = open(path, mode + "b")
+        if mode == "w":
+            return zstandard.ZstdCompressor().stream_writer(raw, closefd=True)
+        return zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+
+    raise ValueError(f"알 수 없는 압축 방식: {compression}")
+
+
+def write_archive(path: Union[str, Path], records: Iterable[Dict[str, Any]],
+                  compression: Optional[str] = "auto") -> int:
+    """
+    세션 정보들을 아카이브 파일 하나로 쓰기
+
+    첫 줄은 형식 헤더이고, 이후 한 줄에 세션 하나씩 기록합니다.
+
+    Args:
+        path: 아카이브 경로
+        records: 세션 정보 (filename, session_string 포함)
+        compression: "gzip", "zstd", None 또는 "auto"(확장자로 판단)
+
+    Returns:
+        기록한 세션 수
+    """
+    path = Path(path)
+    if compression == "auto":
+        compression = detect_compression(path)
+
+    count = 0
+    # json_codec이 UTF-8 바이트로 직렬화하므로 텍스트 래퍼 없이 바로 씀
+    with _open_binary(path, "w", compression) as f:
+        header = {"format": ARCHIVE_FORMAT, "version": ARCHIVE_VERSION}
+        f.write(json_codec.dumps(header) + b"\n")
+
+        for record in records:
+            f.write(json_codec.dumps(record) + b"\n")
+            count += 1
+
+    return count
+
+
+def read_archive(path: Union[str, Path],
+                 compression: Optional[str] = "auto") -> Iterator[Dict[str, Any]]:
+    """
+    아카이브 파일에서 세션 정보를 한 줄씩 읽기
+
+    Args:
+        path: 아카이브 경로
+        compression: "gzip", "zstd", None 또는 "auto"(확장자로 판단)
+
+    Yields:
+        세션 정보 딕셔너리
+
+    Raises:
+        ValueError: 아카이브 형식이 아닌 경우
+    """
+    path = Path(path)
+    if compression == "auto":
+        compression = detect_compression(path)
+
+    with _open_binary(path, "r", compression) as raw:
+        with io.TextIOWrapper(raw, encoding='utf-8') as f:
+            header = json_codec.loads(f.readline() or "{}")
+            if header.get("format") != ARCHIVE_FORMAT:
+                raise ValueError(f"세션 아카이브 파일이 아닙니다: {path}")
+            if header.get("version") != ARCHIVE_VERSION:
+                raise ValueError(f"지원하지 않는 아카이브 버전: {header.get('version')}")
+
+            for line in f:
+                if line.strip():
+                    yield json_codec.loads(line)
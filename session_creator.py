@@ -11,17 +11,9 @@ import asyncio
 from typing import Optional, Tuple
 
 try:
-    from telethon import TelegramClient
-    from telethon.sessions import StringSession
-    from telethon.errors import (
-        SessionPasswordNeededError,
-        PhoneCodeInvalidError,
-        ApiIdInvalidError
-    )
-except ImportError as e:
-    print(f"❌ 텔레그램 라이브러리가 없습니다: {e}")
-    print("설치 명령어: pip install telethon")
-    exit(1)
+    from .telethon_loader import create_client, telethon_errors
+except ImportError:
+    from telethon_loader import create_client, telethon_errors
 
 
 class SessionCreator:
@@ -48,12 +40,15 @@ class SessionCreator:
         Returns:
             세션 문자열 (실패시 None)
         """
+        # 텔레그램 라이브러리는 세션을 만들 때만 불러옴
+        errors = telethon_errors()
+
         client = None
         try:
             print(f"📱 {phone}로 세션 생성을 시작합니다...")
 
             # StringSession으로 클라이언트 생성
-            client = TelegramClient(StringSession(), self.api_id, self.api_hash)
+            client = create_client(None, self.api_id, self.api_hash)
 
             # 텔레그램 연결
             print("🔗 텔레그램에 연결 중...")
@@ -70,7 +65,7 @@ class SessionCreator:
                 # 인증 코드로 로그인 시도
                 await client.sign_in(phone, code)
 
-            except SessionPasswordNeededError:
+            except errors.SessionPasswordNeededError:
                 # 2단계 인증이 필요한 경우
                 print("🔐 2단계 인증이 설정되어 있습니다.")
                 password = input("🔐 2단계 인증 비밀번호를 입력하세요: ")
@@ -87,11 +82,11 @@ class SessionCreator:
 
             return session_string
 
-        except PhoneCodeInvalidError:
+        except errors.PhoneCodeInvalidError:
             print("❌ 잘못된 인증 코드입니다.")
             return None
 
-        except ApiIdInvalidError:
+        except errors.ApiIdInvalidError:
             print("❌ 잘못된 API ID 또는 Hash입니다.")
             return None
 
@@ -119,11 +114,7 @@ class SessionCreator:
             print("🔍 세션을 테스트합니다...")
 
             # 세션 문자열로 클라이언트 생성
-            client = TelegramClient(
-                StringSession(session_string),
-                self.api_id,
-                self.api_hash
-            )
+            client = create_client(session_string, self.api_id, self.api_hash)
 
             # 연결 및 인증 확인
             await client.connect()
@@ -164,7 +155,7 @@ def get_api_credentials() -> Tuple[int, str]:
 
         except ValueError:
             print("❌ API ID는 숫자여야 합니다.")
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError):
             print("\n👋 프로그램을 종료합니다.")
             exit(0)
 
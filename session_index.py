@@ -0,0 +1,929 @@
+# type: ignore
+"""
+세션 메타데이터 인덱스
+세션 디렉토리의 메타데이터를 인덱스 파일 하나에 모아서
+목록 조회 시 모든 세션 파일을 열지 않도록 하는 기능
+
+Python 3.11.9
+PEP8 준수
+"""
+
+import contextlib
+import functools
+import hashlib
+import os
+from pathlib import Path
+from typing import (
+    Callable, ContextManager, Dict, Iterable, Iterator, List, Optional, Any, Set, Tuple
+)
+
+try:
+    from . import json_codec
+    from . import log_config
+    from . import metrics
+    from .atomic_io import write_json_atomic
+except ImportError:
+    import json_codec
+    import log_config
+    import metrics
+    from atomic_io import write_json_atomic
+
+logger = log_config.get_logger(__name__)
+
+# 인덱스 등 부가 파일을 보관하는 디렉토리 (세션 디렉토리 안)
+META_DIR_NAME = ".meta"
+INDEX_FILENAME = "index.json"
+INDEX_LOG_FILENAME = "index.log"
+INDEX_VERSION = 3
+USAGE_JOURNAL_FILENAME = "usage.log"
+STATUS_FILENAME = "status.json"
+LAYOUT_FILENAME = "layout.json"
+
+# 세션 파일 배치 방식
+# - flat: sessions/<파일명>
+# - sharded: sessions/<해시 1자리>/<해시 1자리>/<파일명> (256개 하위 디렉토리)
+SESSION_LAYOUTS = ("flat", "sharded")
+_HEX_DIGITS = "0123456789abcdef"
+
+# 인덱스 로그가 이 크기(바이트)와 스냅샷 크기를 모두 넘으면 스냅샷을 다시 씀
+INDEX_LOG_COMPACT_BYTES = 256 * 1024
+
+# 사용 기록 저널이 이 크기(바이트)를 넘으면 세션 파일에 반영하고 비움
+USAGE_JOURNAL_COMPACT_BYTES = 64 * 1024
+
+# 인덱스에 보관하는 메타데이터 필드 (session_string은 보관하지 않음)
+META_FIELDS = ("name", "phone", "notes", "created_at", "last_used")
+
+
+def shard_dir(sessions_dir: Path, filename: str) -> Path:
+    """
+    sharded 배치에서 세션 파일이 들어갈 하위 디렉토리
+
+    Args:
+        sessions_dir: 세션 디렉토리
+        filename: 세션 파일명
+
+    Returns:
+        하위 디렉토리 경로 (예: sessions/3/f)
+    """
+    digest = hashlib.blake2b(filename.encode('utf-8'), digest_size=1).hexdigest()
+    return sessions_dir / digest[0] / digest[1]
+
+
+@functools.lru_cache(maxsize=16)
+def _shard_dirs(sessions_dir: Path) -> Tuple[Path, ...]:
+    """sharded 배치의 모든 하위 디렉토리 (조회마다 수정 시간을 비교하므로 경로 256개는 캐시)"""
+    return tuple(sessions_dir / a / b for a in _HEX_DIGITS for b in _HEX_DIGITS)
+
+
+def _scan_json(directory: Path) -> Iterator[Path]:
+    """디렉토리 바로 아래의 *.json 파일 (glob보다 가벼운 scandir 사용)"""
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.name.endswith(".json") and entry.is_file():
+                    yield Path(entry.path)
+    except FileNotFoundError:
+        return
+
+
+def iter_session_files(sessions_dir: Path) -> Iterator[Path]:
+    """
+    배치 방식과 상관없이 세션 디렉토리의 모든 세션 파일
+
+    Args:
+        sessions_dir: 세션 디렉토리
+
+    Yields:
+        세션 파일 경로
+    """
+    sessions_dir = Path(sessions_dir)
+    yield from _scan_json(sessions_dir)
+    for directory in _shard_dirs(sessions_dir):
+        yield from _scan_json(directory)
+
+
+class SessionIndex:
+    """
+    세션 파일명 -> 메타데이터 인덱스
+
+    인덱스는 스냅샷(index.json)과 추가 전용 변경 로그(index.log)로 나뉩니다.
+    저장/삭제할 때는 로그에 한 줄만 덧붙이므로 세션 수와 상관없이 일정한 비용이고,
+    로그가 스냅샷보다 커지면 스냅샷을 다시 써서 로그를 비웁니다.
+    (다시 쓰는 비용을 그동안의 기록에 나눠 보면 기록 한 번에 일정한 비용)
+
+    로그의 첫 줄에는 스냅샷과 같은 로그 ID가 있어서, 스냅샷을 다시 쓰는 도중에
+    읽더라도 이미 스냅샷에 반영된 이전 로그를 두 번 적용하지 않습니다.
+    """
+
+    def __init__(self, sessions_dir: Path, layout: Optional[str] = None,
+                 lock: Optional[Callable[[], ContextManager]] = None) -> None:
+        """
+        인덱스 초기화
+
+        지정한 배치 방식이 지금 저장된 방식과 다르면 세션 파일을 옮깁니다.
+
+        Args:
+            sessions_dir: 세션 파일들이 저장된 디렉토리
+            layout: "flat" 또는 "sharded" (None이면 지금 방식 유지, 처음이면 flat)
+            lock: 인덱스를 기록할 때 잡는 프로세스 간 잠금 (put/remove를 호출하는
+                  쪽은 이미 잡고 있어야 함, 디렉토리 스캔으로 다시 만들 때는 직접 잡음)
+
+        Raises:
+            ValueError: 알 수 없는 배치 방식인 경우
+        """
+        self.sessions_dir = Path(sessions_dir)
+        self.meta_dir = self.sessions_dir / META_DIR_NAME
+        self.meta_dir.mkdir(exist_ok=True)
+        self.index_path = self.meta_dir / INDEX_FILENAME
+        self.log_path = self.meta_dir / INDEX_LOG_FILENAME
+        self.layout_path = self.meta_dir / LAYOUT_FILENAME
+        self._lock = lock or contextlib.nullcontext
+        with self._lock():
+            self.layout = self._init_layout(layout)
+        # 마지막으로 읽거나 기록한 인덱스 상태와 그때의 스냅샷 파일 (inode, 수정 시간, 크기),
+        # 로그 파일 inode와 읽은 위치 (다른 프로세스의 변경은 revalidate()/invalidate()로 반영)
+        self._data: Optional[Dict[str, Any]] = None
+        self._stamp: Optional[Tuple[int, int, int]] = None
+        self._log_ino: Optional[int] = None
+        self._log_offset = 0
+        # 다른 프로세스의 변경을 반영할 때마다 늘어나는 값 (자기 기록으로는 바뀌지 않음,
+        # 인덱스로 만든 다른 캐시가 다시 만들어야 하는지 판단할 때 사용)
+        self.generation = 0
+
+    def invalidate(self) -> None:
+        """메모리에 캐시한 인덱스를 버리고 다음 조회 때 파일에서 다시 읽기"""
+        self._data = None
+        self.generation += 1
+
+    def revalidate(self, check_dirs: bool = True) -> None:
+        """
+        메모리에 캐시한 인덱스가 아직 최신인지 확인하고, 아니면 버리기
+
+        스냅샷이 그대로면 다른 프로세스가 로그에 덧붙인 부분만 읽어서 반영합니다.
+        자기 자신의 사용 기록 저널 추가처럼 인덱스와 상관없는 변경 때문에 큰 인덱스를
+        다시 읽지 않도록 디렉토리 감시기가 변경을 알렸을 때 invalidate() 대신 사용합니다.
+
+        Args:
+            check_dirs: 세션 디렉토리 수정 시간도 비교할지 여부
+                        (감시기가 메타 디렉토리만 바뀌었다고 알려준 경우 False,
+                        sharded 배치는 하위 디렉토리 256개를 stat하지 않아도 됨)
+        """
+        if self._data is None:
+            return
+
+        if not self._catch_up():
+            self.invalidate()
+        elif check_dirs and self._data["dir_mtime_ns"] != self.dir_mtime_ns():
+            self.invalidate()
+
+    def watch_dirs(self) -> List[Path]:
+        """
+        변경을 감시해야 하는 디렉토리 (세션 파일과 메타 파일이 있는 곳)
+
+        Returns:
+            디렉토리 리스트
+        """
+        directories = [self.sessions_dir, self.meta_dir]
+        if self.layout == "sharded":
+            directories.extend(_shard_dirs(self.sessions_dir))
+        return directories
+
+    def path(self, filename: str) -> Path:
+        """
+        세션 파일명의 실제 경로
+
+        Args:
+            filename: 세션 파일명
+
+        Returns:
+            배치 방식에 맞는 파일 경로
+        """
+        if self.layout == "sharded":
+            return shard_dir(self.sessions_dir, filename) / filename
+        return self.sessions_dir / filename
+
+    def _init_layout(self, layout: Optional[str]) -> str:
+        """저장된 배치 방식 확인 후 필요하면 세션 파일 이동"""
+        try:
+            with open(self.layout_path, 'rb') as f:
+                marker = json_codec.load(f)
+        except (OSError, ValueError):
+            marker = {"layout": "flat", "complete": True}
+
+        target = layout or marker.get("layout", "flat")
+        if target not in SESSION_LAYOUTS:
+            raise ValueError(f"알 수 없는 세션 배치 방식: {target} (가능: {', '.join(SESSION_LAYOUTS)})")
+
+        # 이동 중에 종료된 경우에도 다시 열면 이어서 옮김
+        if target != marker.get("layout") or not marker.get("complete", True):
+            self._migrate_layout(target)
+
+        return target
+
+    def _migrate_layout(self, target: str) -> None:
+        """모든 세션 파일을 target 배치 방식의 경로로 옮기기"""
+        write_json_atomic(self.layout_path, {"layout": target, "complete": False})
+
+        if target == "sharded":
+            for directory in _shard_dirs(self.sessions_dir):
+                directory.mkdir(parents=True, exist_ok=True)
+
+        moved = 0
+        for filepath in list(iter_session_files(self.sessions_dir)):
+            if target == "sharded":
+                destination = shard_dir(self.sessions_dir, filepath.name) / filepath.name
+            else:
+                destination = self.sessions_dir / filepath.name
+
+            if filepath != destination:
+                # 같은 파일 시스템 안의 이름 변경이므로 수정 시간/크기는 그대로 (인덱스 항목 재사용)
+                os.replace(filepath, destination)
+                moved += 1
+
+        if target == "flat":
+            # 비어 있는 하위 디렉토리 정리
+            for directory in _shard_dirs(self.sessions_dir):
+                for path in (directory, directory.parent):
+                    try:
+                        path.rmdir()
+                    except OSError:
+                        pass
+
+        write_json_atomic(self.layout_path, {"layout": target, "complete": True})
+        if moved:
+            logger.info("📁 세션 파일 %d개를 %s 배치로 옮겼습니다.", moved, target)
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        인덱스 항목 반환 (디렉토리가 변경되었으면 재구성)
+
+        스냅샷과 로그만 읽고, 세션 디렉토리의 mtime이 인덱스가 알고 있는
+        값과 다르면 다른 프로세스나 수동 작업으로 파일이 추가/삭제된 것으로
+        보고 디렉토리를 스캔해서 인덱스를 다시 맞춥니다.
+
+        Returns:
+            파일명 -> 메타데이터 딕셔너리
+        """
+        return self._load_data()["entries"]
+
+    def get(self, filename: str) -> Optional[Dict[str, Any]]:
+        """
+        세션 파일 하나의 인덱스 항목
+
+        Args:
+            filename: 세션 파일명
+
+        Returns:
+            메타데이터 딕셔너리 (없으면 None)
+        """
+        return self._load_data()["entries"].get(filename)
+
+    def find(self, key: str) -> Optional[str]:
+        """
+        파일명, 세션 이름 또는 전화번호로 세션 파일명 찾기
+
+        메모리에 만든 이름/전화번호 해시맵을 사용하므로 디렉토리를
+        스캔하거나 세션 파일을 열지 않습니다.
+
+        Args:
+            key: 파일명(확장자 생략 가능), 세션 이름 또는 전화번호
+
+        Returns:
+            찾은 파일명 (없으면 None)
+        """
+        data = self._load_data()
+        entries = data["entries"]
+
+        # 정확한 파일명 -> 세션 이름 -> 확장자 없는 파일명 -> 전화번호 순
+        # (이름이 파일명보다 먼저여야 "ab"로 저장된 ab_2.json을 찾을 수 있음)
+        if key in entries:
+            return key
+        found = self._latest(data["names"].get(key), entries)
+        if found:
+            return found
+        if f"{key}.json" in entries:
+            return f"{key}.json"
+
+        return self._latest(data["phones"].get(key), entries)
+
+    @staticmethod
+    def _latest(filenames: Optional[Set[str]], entries: Dict[str, Dict[str, Any]]
+                ) -> Optional[str]:
+        """같은 이름/전화번호의 세션 중 가장 최근에 생성된 세션"""
+        if not filenames:
+            return None
+        return max(filenames, key=lambda filename: (entries[filename].get("created_at") or "",
+                                                    filename))
+
+    def _load_data(self) -> Dict[str, Any]:
+        """인덱스 전체 읽기 (캐시가 없을 때만, 디렉토리가 변경되었으면 재구성)"""
+        if self._data is not None:
+            return self._data
+
+        data = self._read_state()
+        if data is None or data["dir_mtime_ns"] != self.dir_mtime_ns():
+            with self._lock():
+                # 잠금을 기다리는 동안 다른 프로세스가 이미 다시 만들었거나 로그에 기록했을 수 있음
+                data = self._read_state(locked=True)
+                if data is None or data["dir_mtime_ns"] != self.dir_mtime_ns():
+                    # _write()가 캐시와 파일 정보를 기록
+                    return self._rebuild_data(data["entries"] if data else None)
+
+        return data
+
+    def rebuild(self, previous: Optional[Dict[str, Dict[str, Any]]] = None
+                ) -> Dict[str, Dict[str, Any]]:
+        """
+        세션 디렉토리를 스캔해서 인덱스 재구성
+
+        Args:
+            previous: 이전 인덱스 항목 (크기/수정시간이 같은 파일은 다시 읽지 않음)
+
+        Returns:
+            재구성된 파일명 -> 메타데이터 딕셔너리
+        """
+        with self._lock():
+            self.generation += 1
+            return self._rebuild_data(previous)["entries"]
+
+    def _rebuild_data(self, previous: Optional[Dict[str, Dict[str, Any]]] = None
+                      ) -> Dict[str, Any]:
+        """디렉토리 스캔으로 인덱스를 재구성하고 기록된 인덱스 전체 반환"""
+        # 스캔 도중 추가된 파일이 있으면 다음 조회 때 다시 맞추도록 스캔 전 수정 시간 기록
+        dir_mtime_ns = self.dir_mtime_ns()
+        entries = {}
+
+        if self.layout == "sharded":
+            filepaths = (
+                filepath
+                for directory in _shard_dirs(self.sessions_dir)
+                for filepath in _scan_json(directory)
+            )
+        else:
+            filepaths = _scan_json(self.sessions_dir)
+
+        for filepath in filepaths:
+            try:
+                stat = filepath.stat()
+
+                # 변경되지 않은 파일은 기존 항목 재사용
+                old_entry = previous.get(filepath.name) if previous else None
+                if (old_entry
+                        and old_entry.get("mtime_ns") == stat.st_mtime_ns
+                        and old_entry.get("file_size") == stat.st_size):
+                    entries[filepath.name] = old_entry
+                    continue
+
+                with open(filepath, 'rb') as f:
+                    session_data = json_codec.load(f)
+
+                entries[filepath.name] = self._make_entry(session_data, stat)
+
+            except (OSError, ValueError) as e:
+                logger.warning("⚠️ 파일 읽기 실패 (%s): %s", filepath.name, e)
+                continue
+
+        return self._write(entries, dir_mtime_ns)
+
+    def put(self, filename: str, session_data: Dict[str, Any],
+            dir_mtime_before: Optional[int] = None) -> None:
+        """
+        저장/수정된 세션 파일의 항목 갱신 (메타데이터 잠금을 잡은 상태에서 호출)
+
+        Args:
+            filename: 세션 파일명
+            session_data: 파일에 기록된 세션 정보
+            dir_mtime_before: 세션 파일을 쓰기 전의 dir_mtime_ns()
+                              (없으면 다음 조회 때 디렉토리를 다시 스캔)
+        """
+        self.put_many({filename: session_data}, dir_mtime_before)
+
+    def put_many(self, items: Dict[str, Dict[str, Any]],
+                 dir_mtime_before: Optional[int] = None) -> None:
+        """
+        여러 세션 파일의 항목을 한 번에 갱신 (로그에 한 번에 기록)
+
+        Args:
+            items: 파일명 -> 파일에 기록된 세션 정보
+            dir_mtime_before: 세션 파일들을 쓰기 전의 dir_mtime_ns()
+        """
+        ops = [
+            ["put", filename, self._make_entry(session_data, self.path(filename).stat())]
+            for filename, session_data in items.items()
+        ]
+        self._append(ops, dir_mtime_before)
+
+    def remove(self, filename: str, dir_mtime_before: Optional[int] = None) -> None:
+        """
+        삭제된 세션 파일의 항목 제거 (메타데이터 잠금을 잡은 상태에서 호출)
+
+        Args:
+            filename: 세션 파일명
+            dir_mtime_before: 세션 파일을 지우기 전의 dir_mtime_ns()
+        """
+        self._append([["del", filename]], dir_mtime_before)
+
+    def _append(self, ops: List[List[Any]], dir_mtime_before: Optional[int]) -> None:
+        """
+        변경 내용을 로그에 추가하고 캐시에 반영
+
+        로그에는 변경 전후의 디렉토리 수정 시간도 기록합니다. 인덱스가 알고 있는
+        수정 시간에서 시작하는 변경만 이어 붙이므로, 그 사이 라이브러리 밖에서
+        파일을 추가/삭제하면 수정 시간이 이어지지 않아 다음 조회 때 다시 스캔합니다.
+        """
+        if not self._catch_up():
+            if self._read_state(locked=True) is None:
+                # 스냅샷이 없거나 손상됨: 방금 쓴 파일까지 포함해서 다시 만듦
+                self._rebuild_data()
+                return
+
+        if dir_mtime_before is not None:
+            ops.append(["dir", dir_mtime_before, self.dir_mtime_ns()])
+
+        if self._log_ino is None:
+            # 로그가 없거나 이전 스냅샷의 로그: 지금 스냅샷의 로그 ID로 새로 시작
+            self._start_log(self._data["log_id"])
+
+        payload = b"".join(json_codec.dumps(op) + b"\n" for op in ops)
+        with open(self.log_path, 'ab') as f:
+            f.write(payload)
+            self._log_offset = f.tell()
+
+        for op in ops:
+            self._apply(self._data, op)
+
+        # 로그가 스냅샷보다 커지면 스냅샷을 다시 써서 로그를 비움
+        if self._log_offset > max(INDEX_LOG_COMPACT_BYTES, self._stamp[2]):
+            self._write(self._data["entries"], self._data["dir_mtime_ns"])
+
+    def _read_state(self, locked: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        스냅샷과 로그 전체를 읽어서 캐시
+
+        Args:
+            locked: 메타데이터 잠금을 이미 잡고 있는지 여부 (잡고 있으면 스냅샷이
+                    바뀌지 않으므로 한 번에 읽힘, 잠금은 다시 잡지 않음)
+
+        Returns:
+            메모리 상태 (스냅샷이 없거나 손상/버전 불일치면 None)
+        """
+        # 처음 읽는 것이 아니면 다른 프로세스가 바꾼 인덱스를 다시 읽는 것
+        replaced = self._data is not None
+        generation = self.generation
+
+        for _ in range(1 if locked else 3):
+            snapshot, stamp = self._read()
+            if snapshot is None:
+                self._data = None
+                self.generation = generation + replaced
+                return None
+
+            self._data = self._make_state(snapshot)
+            self._stamp = stamp
+            self._log_ino = None
+            self._log_offset = 0
+            if self._catch_up() or locked:
+                self.generation = generation + replaced
+                return self._data
+
+        # 다른 프로세스가 계속 스냅샷을 다시 쓰는 경우: 잠금을 잡고 읽음
+        with self._lock():
+            return self._read_state(locked=True)
+
+    def _catch_up(self) -> bool:
+        """
+        캐시 이후 로그에 추가된 부분만 읽어서 반영
+
+        Returns:
+            캐시가 최신이 되었는지 여부 (스냅샷이 바뀌었으면 False)
+        """
+        if self._data is None or self._stamp != self._snapshot_stamp():
+            return False
+
+        # 로그가 그대로면 열지 않음 (사용 기록 저널 추가 등으로 자주 불림)
+        try:
+            log_stat = os.stat(self.log_path)
+            if log_stat.st_ino == self._log_ino and log_stat.st_size == self._log_offset:
+                return True
+        except FileNotFoundError:
+            if self._log_ino is None:
+                return True
+
+        try:
+            with open(self.log_path, 'rb') as f:
+                ino = os.fstat(f.fileno()).st_ino
+                if ino != self._log_ino:
+                    # 처음 읽거나 스냅샷을 다시 쓰면서 새로 만든 로그: 로그 ID부터 확인
+                    header = f.readline()
+                    if not header.endswith(b"\n"):
+                        ino, offset, chunk = None, 0, b""
+                    elif json_codec.loads(header) != ["log", self._data["log_id"]]:
+                        # 이전 스냅샷의 로그 (이미 스냅샷에 반영됨)
+                        ino, offset, chunk = None, 0, b""
+                    else:
+                        offset = f.tell()
+                        chunk = f.read()
+                else:
+                    offset = self._log_offset
+                    f.seek(offset)
+                    chunk = f.read()
+        except FileNotFoundError:
+            ino, offset, chunk = None, 0, b""
+        except ValueError:
+            return False
+
+        # 마지막 줄이 아직 쓰는 중이면 다음에 읽음
+        complete = chunk[:chunk.rfind(b"\n") + 1]
+        if complete:
+            self.generation += 1
+        for line in complete.splitlines():
+            try:
+                self._apply(self._data, json_codec.loads(line))
+            except (ValueError, IndexError, TypeError):
+                continue
+
+        self._log_ino = ino
+        self._log_offset = offset + len(complete)
+
+        # 읽는 사이 스냅샷을 다시 썼으면 이 로그는 이미 반영된 이전 로그일 수 있음
+        return self._stamp == self._snapshot_stamp()
+
+    def _start_log(self, log_id: str) -> None:
+        """로그 ID 한 줄만 있는 새 로그로 교체"""
+        tmp_path = self.log_path.with_name(f".{self.log_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(json_codec.dumps(["log", log_id]) + b"\n")
+            self._log_offset = f.tell()
+        os.replace(tmp_path, self.log_path)
+        self._log_ino = os.stat(self.log_path).st_ino
+
+    def _read(self) -> Tuple[Optional[Dict[str, Any]], Optional[Tuple[int, int, int]]]:
+        """스냅샷 파일과 읽은 파일의 정보 읽기 (없거나 손상/버전 불일치면 None)"""
+        try:
+            with metrics.timer("index_load"):
+                with open(self.index_path, 'rb') as f:
+                    stamp = self._file_stamp(os.fstat(f.fileno()))
+                    data = json_codec.load(f)
+        except (OSError, ValueError):
+            return None, None
+
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return None, None
+
+        return data, stamp
+
+    def _snapshot_stamp(self) -> Optional[Tuple[int, int, int]]:
+        """지금 스냅샷 파일 정보 (없으면 None)"""
+        try:
+            return self._file_stamp(os.stat(self.index_path))
+        except OSError:
+            return None
+
+    def _write(self, entries: Dict[str, Dict[str, Any]], dir_mtime_ns: int) -> Dict[str, Any]:
+        """
+        스냅샷 쓰기 (메타데이터 잠금을 잡은 상태에서 호출)
+
+        새 로그 ID로 스냅샷을 쓴 다음 로그를 새로 시작합니다. 그 사이에 읽는 쪽은
+        로그 ID가 달라서 이전 로그를 무시하므로 같은 변경을 두 번 적용하지 않습니다.
+        임시 파일에 쓴 뒤 교체하므로 읽는 쪽에서 잘린 파일을 보지 않고,
+        메타 디렉토리 안에서만 교체하므로 세션 디렉토리의 mtime은 바뀌지 않습니다.
+
+        Args:
+            entries: 파일명 -> 메타데이터
+            dir_mtime_ns: 디렉토리 스캔 직전, 또는 로그로 이어 온 디렉토리 수정 시간
+        """
+        snapshot = {
+            "version": INDEX_VERSION,
+            "dir_mtime_ns": dir_mtime_ns,
+            "log_id": os.urandom(8).hex(),
+            "entries": entries
+        }
+
+        # 인덱스는 언제든 다시 만들 수 있으므로 fsync는 생략
+        write_json_atomic(self.index_path, snapshot, durable=False)
+        self._stamp = self._file_stamp(os.stat(self.index_path))
+        self._start_log(snapshot["log_id"])
+        self._data = self._make_state(snapshot)
+
+        return self._data
+
+    def _make_state(self, snapshot: Dict[str, Any]) -> Dict[str, Any]:
+        """스냅샷으로 메모리 상태 만들기 (이름/전화번호 -> 파일명 집합 해시맵 포함)"""
+        data = {
+            "dir_mtime_ns": snapshot["dir_mtime_ns"],
+            "log_id": snapshot["log_id"],
+            "entries": {},
+            "names": {},
+            "phones": {}
+        }
+        for filename, entry in snapshot["entries"].items():
+            self._apply(data, ["put", filename, entry])
+        return data
+
+    @staticmethod
+    def _apply(data: Dict[str, Any], op: List[Any]) -> None:
+        """로그 한 줄을 메모리 상태에 반영"""
+        kind = op[0]
+        if kind == "dir":
+            # 인덱스가 알고 있는 수정 시간에서 시작한 변경만 이어 붙임
+            if op[1] == data["dir_mtime_ns"]:
+                data["dir_mtime_ns"] = op[2]
+            return
+
+        filename = op[1]
+        old = data["entries"].pop(filename, None)
+        if old is not None:
+            for field, lookup in (("name", "names"), ("phone", "phones")):
+                filenames = data[lookup].get(old.get(field))
+                if filenames is not None:
+                    filenames.discard(filename)
+                    if not filenames:
+                        del data[lookup][old.get(field)]
+
+        if kind == "put":
+            entry = op[2]
+            data["entries"][filename] = entry
+            for field, lookup in (("name", "names"), ("phone", "phones")):
+                if entry.get(field):
+                    data[lookup].setdefault(entry[field], set()).add(filename)
+
+    @staticmethod
+    def _file_stamp(stat: os.stat_result) -> Tuple[int, int, int]:
+        """스냅샷 파일이 교체되었는지 비교할 값 (교체되면 inode가 바뀜)"""
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def dir_mtime_ns(self) -> int:
+        """
+        세션 디렉토리 수정 시간 (나노초)
+
+        sharded 배치는 파일이 추가/삭제되면 하위 디렉토리의 수정 시간만
+        바뀌므로 모든 하위 디렉토리 중 가장 최근 값을 사용합니다.
+        세션 파일을 쓰거나 지우기 전에 읽어서 put()/remove()에 넘깁니다.
+
+        Returns:
+            수정 시간 (나노초)
+        """
+        latest = self.sessions_dir.stat().st_mtime_ns
+        if self.layout == "sharded":
+            for directory in _shard_dirs(self.sessions_dir):
+                try:
+                    latest = max(latest, os.stat(directory).st_mtime_ns)
+                except FileNotFoundError:
+                    continue
+        return latest
+
+    @staticmethod
+    def _make_entry(session_data: Dict[str, Any], stat: os.stat_result) -> Dict[str, Any]:
+        """세션 정보에서 인덱스 항목 생성"""
+        entry = {field: session_data.get(field) for field in META_FIELDS}
+        entry["file_size"] = stat.st_size
+        entry["mtime_ns"] = stat.st_mtime_ns
+        return entry
+
+
+class UsageJournal:
+    """
+    세션 마지막 사용 시간 저널 (추가 전용)
+
+    세션을 불러올 때마다 세션 파일 전체를 다시 쓰는 대신
+    "파일명, 사용 시간" 한 줄만 덧붙이고, 저널이 커지면 한꺼번에 반영합니다.
+
+    읽은 내용은 메모리에 두고 다음에는 저널에 새로 추가된 부분만 읽으므로
+    세션을 불러올 때마다 저널 전체를 다시 읽지 않습니다.
+    """
+
+    def __init__(self, meta_dir: Path) -> None:
+        """
+        저널 초기화
+
+        Args:
+            meta_dir: 저널 파일을 둘 메타 디렉토리
+        """
+        self.path = Path(meta_dir) / USAGE_JOURNAL_FILENAME
+        # 저널에서 읽은 내용과 저널 파일 inode, 첫 줄, 읽은 위치
+        # (반영 후 새로 만든 저널이 같은 inode를 받아도 첫 줄이 달라서 구분됨)
+        self._journal: Dict[str, str] = {}
+        self._ino: Optional[int] = None
+        self._head = b""
+        self._offset = 0
+        # 반영 중인 저널의 내용과 그때의 파일 정보 (inode, 수정 시간, 크기)
+        self._pending: Dict[str, str] = {}
+        self._pending_stamp: Optional[Tuple[int, int, int]] = None
+        # 두 저널을 합친 결과 (load()가 반환)
+        self._latest: Dict[str, str] = {}
+
+    def record(self, filename: str, used_at: str) -> int:
+        """
+        사용 기록 한 줄 추가
+
+        Args:
+            filename: 세션 파일명
+            used_at: 사용 시간 (ISO 형식)
+
+        Returns:
+            기록 후 저널 크기 (바이트)
+        """
+        line = json_codec.dumps([filename, used_at]) + b"\n"
+        with open(self.path, 'ab') as f:
+            f.write(line)
+            return f.tell()
+
+    @property
+    def pending_path(self) -> Path:
+        """반영 중인 저널 경로 (반영하는 동안 새 기록은 원래 경로에 쌓임)"""
+        return self.path.with_name(self.path.name + ".compacting")
+
+    def load(self) -> Dict[str, str]:
+        """
+        파일명별 가장 최근 사용 시간 읽기 (반영 중인 저널 포함)
+
+        지난번 이후 저널에 추가된 줄만 읽습니다. 아직 쓰는 중인 마지막 줄은
+        다음에 읽고, 읽을 수 없는 줄은 무시합니다.
+
+        Returns:
+            파일명 -> 마지막 사용 시간 (캐시이므로 수정하지 말 것)
+        """
+        try:
+            stat = os.stat(self.pending_path)
+            pending_stamp = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            pending_stamp = None
+
+        rebuild = False
+        if pending_stamp != self._pending_stamp:
+            self._pending = self._read_lines(self.pending_path) if pending_stamp else {}
+            self._pending_stamp = pending_stamp
+            rebuild = True
+
+        try:
+            with open(self.path, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                if (stat.st_ino != self._ino or stat.st_size < self._offset
+                        or f.read(len(self._head)) != self._head):
+                    # 반영하면서 새로 만든 저널: 처음부터 읽음
+                    self._journal, self._ino, self._head, self._offset = {}, stat.st_ino, b"", 0
+                    rebuild = True
+                f.seek(self._offset)
+                chunk = f.read()
+        except FileNotFoundError:
+            if self._ino is not None:
+                self._journal, self._ino, self._head, self._offset = {}, None, b"", 0
+                rebuild = True
+            chunk = b""
+
+        if rebuild:
+            self._latest = dict(self._pending)
+            self._merge(self._latest, self._journal)
+
+        complete = chunk[:chunk.rfind(b"\n") + 1]
+        if complete:
+            if not self._offset:
+                self._head = complete[:complete.index(b"\n") + 1]
+            self._offset += len(complete)
+            added = self._parse(complete.splitlines())
+            self._merge(self._journal, added)
+            self._merge(self._latest, added)
+
+        return self._latest
+
+    def begin_compaction(self) -> Dict[str, str]:
+        """
+        저널을 반영용 파일로 옮기고 그 내용 반환
+
+        옮긴 뒤에 다른 프로세스가 추가하는 기록은 새 저널에 쌓이므로
+        반영하는 동안 기록이 사라지지 않습니다. 이전 반영이 중간에 끊겨
+        반영용 파일이 남아 있으면 그것부터 반영합니다.
+
+        Returns:
+            파일명 -> 마지막 사용 시간
+        """
+        if not self.pending_path.exists():
+            try:
+                os.replace(self.path, self.pending_path)
+            except FileNotFoundError:
+                return {}
+
+        return self._read_lines(self.pending_path)
+
+    def end_compaction(self) -> None:
+        """반영이 끝난 반영용 파일 삭제"""
+        try:
+            self.pending_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    @classmethod
+    def _read_lines(cls, path: Path) -> Dict[str, str]:
+        """저널 파일 하나에서 파일명별 가장 최근 사용 시간 읽기"""
+        try:
+            with open(path, 'rb') as f:
+                return cls._parse(f)
+        except FileNotFoundError:
+            return {}
+
+    @staticmethod
+    def _parse(lines: Iterable[bytes]) -> Dict[str, str]:
+        """저널 줄들에서 파일명별 가장 최근 사용 시간 읽기"""
+        latest = {}
+        for line in lines:
+            try:
+                filename, used_at = json_codec.loads(line)
+            except (ValueError, TypeError):
+                continue
+
+            if used_at > latest.get(filename, ""):
+                latest[filename] = used_at
+        return latest
+
+    @staticmethod
+    def _merge(latest: Dict[str, str], updates: Dict[str, str]) -> None:
+        """더 최근 사용 시간만 합치기"""
+        for filename, used_at in updates.items():
+            if used_at > latest.get(filename, ""):
+                latest[filename] = used_at
+
+    @staticmethod
+    def apply(session_data: Dict[str, Any], used_at: Optional[str]) -> bool:
+        """
+        저널의 사용 시간을 세션 정보에 반영
+
+        세션이 다시 저장된 뒤의 오래된 기록은 반영하지 않습니다.
+
+        Args:
+            session_data: 세션 정보 또는 인덱스 항목
+            used_at: 저널에 기록된 사용 시간
+
+        Returns:
+            반영 여부
+        """
+        if not used_at:
+            return False
+
+        current = session_data.get("last_used") or session_data.get("created_at") or ""
+        if used_at <= current:
+            return False
+
+        session_data["last_used"] = used_at
+        return True
+
+
+class SessionStatusStore:
+    """
+    세션 상태 저장소 (연결 검사 결과 등)
+
+    세션 파일과 별도로 파일명 -> 상태 딕셔너리를 파일 하나에 보관하므로
+    상태를 갱신해도 세션 파일은 다시 쓰지 않습니다.
+    """
+
+    def __init__(self, meta_dir: Path) -> None:
+        """
+        상태 저장소 초기화
+
+        Args:
+            meta_dir: 상태 파일을 둘 메타 디렉토리
+        """
+        self.path = Path(meta_dir) / STATUS_FILENAME
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        모든 세션 상태 읽기
+
+        Returns:
+            파일명 -> 상태 딕셔너리
+        """
+        try:
+            with open(self.path, 'rb') as f:
+                data = json_codec.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        return data if isinstance(data, dict) else {}
+
+    def update(self, updates: Dict[str, Dict[str, Any]]) -> None:
+        """
+        여러 세션 상태를 한 번에 갱신 (기존 상태에 병합)
+
+        Args:
+            updates: 파일명 -> 갱신할 상태 필드
+        """
+        statuses = self.load()
+        for filename, fields in updates.items():
+            statuses.setdefault(filename, {}).update(fields)
+        self._write(statuses)
+
+    def remove(self, *filenames: str) -> None:
+        """
+        삭제되었거나 새로 저장된 세션의 상태 제거
+
+        Args:
+            filenames: 세션 파일명들
+        """
+        statuses = self.load()
+        removed = [statuses.pop(filename) for filename in filenames if filename in statuses]
+        if removed:
+            self._write(statuses)
+
+    def _write(self, statuses: Dict[str, Dict[str, Any]]) -> None:
+        """상태 파일 쓰기 (임시 파일에 쓴 뒤 교체, 검사 결과는 다시 얻을 수 있으므로 fsync 생략)"""
+        write_json_atomic(self.path, statuses, durable=False)
@@ -7,33 +7,76 @@ Python 3.11.9
 PEP8 준수
 """
 
-import json
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import Callable, Iterator, List, Dict, Optional, Any, Tuple, Union
 
 try:
-    from telethon import TelegramClient
-    from telethon.sessions import StringSession
-except ImportError as e:
-    print(f"❌ 텔레그램 라이브러리가 없습니다: {e}")
-    print("설치 명령어: pip install telethon")
-    exit(1)
+    from . import log_config
+    from . import metrics
+    from .client_pool import ClientPool
+    from .session_archive import read_archive, write_archive
+    from .session_record import SessionRecord
+    from .session_search import SessionSearchIndex
+    from .session_storage import SessionStorage, create_storage, unique_filenames
+    from .session_vault import is_encrypted
+    from .telethon_loader import create_client
+except ImportError:
+    import log_config
+    import metrics
+    from client_pool import ClientPool
+    from session_archive import read_archive, write_archive
+    from session_record import SessionRecord
+    from session_search import SessionSearchIndex
+    from session_storage import SessionStorage, create_storage, unique_filenames
+    from session_vault import is_encrypted
+    from telethon_loader import create_client
+
+logger = log_config.get_logger(__name__)
 
 
 class SessionManager:
     """세션 저장/불러오기 관리 클래스"""
 
-    def __init__(self, sessions_dir: str = "sessions") -> None:
+    def __init__(self, sessions_dir: str = "sessions",
+                 backend: Union[str, SessionStorage] = "json",
+                 identity_ttl: float = 3600.0,
+                 passphrase: Optional[str] = None,
+                 layout: Optional[str] = None,
+                 compact: bool = False) -> None:
         """
         세션 관리자 초기화
 
         Args:
             sessions_dir: 세션 파일들을 저장할 디렉토리
+            backend: 저장소 백엔드 ("json", "sqlite" 또는 SessionStorage 인스턴스)
+            identity_ttl: 검사 결과와 사용자 정보를 다시 확인하지 않고 쓰는 시간 (초)
+            passphrase: 세션 문자열 암호화 암호 (None이면 평문 저장)
+            layout: JSON 백엔드의 파일 배치 방식 ("flat" 또는 "sharded",
+                    None이면 지금 방식 유지, 바꾸면 기존 파일을 자동으로 옮김)
+            compact: JSON 백엔드의 세션 파일을 들여쓰기 없이 한 줄로 저장
+                     (기존 들여쓴 파일도 그대로 읽음)
+
+        Raises:
+            ValueError: 암호가 틀렸거나 cryptography가 없는 경우,
+                        잘못된 배치 방식인 경우
         """
         self.sessions_dir = Path(sessions_dir)
         self.sessions_dir.mkdir(exist_ok=True)
-
+        self.storage = create_storage(backend, self.sessions_dir, passphrase, layout,
+                                      compact)
+        self.identity_ttl = identity_ttl
+        self._io_executor: Optional[ThreadPoolExecutor] = None
+        # 검색 인덱스 (처음 검색할 때 만들고 저장/삭제시 함께 갱신,
+        # 다른 프로세스의 변경은 저장소 generation()이 바뀌면 다시 만들어서 반영)
+        self._search_index: Optional[SessionSearchIndex] = None
+        self._search_generation: Any = None
+
+    @metrics.timed("save_session")
     def save_session(self, session_string: str, name: str,
                     phone: Optional[str] = None, notes: Optional[str] = None) -> bool:
         """
@@ -49,13 +92,7 @@ class SessionManager:
             저장 성공 여부
         """
         try:
-            # 파일명 정리 (특수문자 제거)
-            safe_name = "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).strip()
-            if not safe_name:
-                safe_name = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-
-            filename = f"{safe_name}.json"
-            filepath = self.sessions_dir / filename
+            filename = self._make_filename(name)
 
             # 세션 정보 구성
             session_data = {
@@ -67,17 +104,22 @@ class SessionManager:
                 "last_used": None
             }
 
-            # JSON 파일로 저장
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(session_data, f, ensure_ascii=False, indent=2)
+            # 저장소에 기록 (파일명이 같은 다른 이름의 세션은 덮어쓰지 않음)
+            saved_as = self.storage.write_unique(filename, session_data)
+            if self._search_index is not None:
+                self._search_index.put(saved_as, session_data)
 
-            print(f"💾 세션이 저장되었습니다: {filepath}")
+            if saved_as != filename:
+                logger.warning("⚠️ '%s' 파일명을 다른 세션이 쓰고 있어서 '%s'(으)로 저장합니다.",
+                               filename, saved_as)
+            logger.info("💾 세션이 저장되었습니다: %s", self.storage.location(saved_as))
             return True
 
         except Exception as e:
-            print(f"❌ 세션 저장 실패: {e}")
+            logger.error("❌ 세션 저장 실패: %s", e)
             return False
 
+    @metrics.timed("load_session")
     def load_session(self, name: str) -> Optional[str]:
         """
         저장된 세션 문자열을 불러오기
@@ -92,62 +134,151 @@ class SessionManager:
             # 파일명 찾기
             filename = self._find_session_file(name)
             if not filename:
-                print(f"❌ '{name}' 세션을 찾을 수 없습니다.")
+                logger.warning("❌ '%s' 세션을 찾을 수 없습니다.", name)
                 return None
 
-            filepath = self.sessions_dir / filename
-
-            # JSON 파일 읽기
-            with open(filepath, 'r', encoding='utf-8') as f:
-                session_data = json.load(f)
-
-            # 마지막 사용 시간 업데이트
-            session_data["last_used"] = datetime.now().isoformat()
+            # 세션 정보 읽기
+            session_data = self.storage.read(filename)
+            if is_encrypted(session_data["session_string"]):
+                logger.warning("❌ '%s' 세션은 암호화되어 있습니다. 암호를 지정해서 불러오세요.", name)
+                return None
 
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(session_data, f, ensure_ascii=False, indent=2)
+            # 마지막 사용 시간 기록 (세션 파일은 다시 쓰지 않음)
+            used_at = datetime.now().isoformat()
+            self.storage.touch(filename, used_at)
+            if self._search_index is not None:
+                self._search_index.touch(filename, used_at)
 
             session_string = session_data["session_string"]
-            print(f"📂 세션을 불러왔습니다: {session_data['name']}")
+            logger.info("📂 세션을 불러왔습니다: %s", session_data['name'])
 
             return session_string
 
         except Exception as e:
-            print(f"❌ 세션 불러오기 실패: {e}")
+            logger.error("❌ 세션 불러오기 실패: %s", e)
             return None
 
-    def list_sessions(self) -> List[Dict[str, Any]]:
+    @metrics.timed("list_sessions")
+    def list_sessions(self) -> List[SessionRecord]:
         """
-        저장된 모든 세션 목록 반환
+        저장된 모든 세션 목록 반환 (최근 생성순)
+
+        저장소의 메타데이터 인덱스에서 조회하므로 세션 문자열은 포함되지 않습니다.
+        세션이 많으면 iter_sessions()로 나눠서 조회하세요.
 
         Returns:
-            세션 정보 리스트
+            세션 레코드 리스트
         """
-        sessions = []
-
         try:
-            for filepath in self.sessions_dir.glob("*.json"):
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        session_data = json.load(f)
+            return list(self.iter_sessions())
 
-                    # 파일 정보 추가
-                    session_data["filename"] = filepath.name
-                    session_data["file_size"] = filepath.stat().st_size
+        except Exception as e:
+            logger.error("❌ 세션 목록 조회 실패: %s", e)
+            return []
 
-                    sessions.append(session_data)
+    def iter_sessions(self, filter: Optional[str] = None, sort: str = "-created_at",
+                      offset: int = 0, limit: Optional[int] = None
+                      ) -> Iterator[SessionRecord]:
+        """
+        세션 메타데이터를 정렬/필터/페이지 단위로 하나씩 반환
 
-                except Exception as e:
-                    print(f"⚠️ 파일 읽기 실패 ({filepath.name}): {e}")
-                    continue
+        세션 문자열은 포함하지 않으며, 정렬과 필터는 저장소 인덱스
+        (SQLite 백엔드는 인덱스된 컬럼)에서 처리합니다.
 
-        except Exception as e:
-            print(f"❌ 세션 목록 조회 실패: {e}")
+        Args:
+            filter: 이름/전화번호/메모에 포함된 문자열 (대소문자 무시)
+            sort: 정렬 필드 (created_at, last_used, name, phone / "-" 접두사는 내림차순)
+            offset: 건너뛸 세션 수
+            limit: 반환할 최대 세션 수 (None이면 전부)
+
+        Yields:
+            세션 레코드
+        """
+        for filename, entry in self.storage.query_entries(filter, sort, offset, limit):
+            yield SessionRecord.from_entry(filename, entry)
+
+    def count_sessions(self, filter: Optional[str] = None) -> int:
+        """
+        조건에 맞는 세션 수
+
+        Args:
+            filter: 이름/전화번호/메모에 포함된 문자열 (대소문자 무시)
+
+        Returns:
+            세션 수
+        """
+        return self.storage.count_entries(filter)
+
+    def get_session_info(self, name: str) -> Optional[SessionRecord]:
+        """
+        세션 하나의 메타데이터 조회 (세션 문자열 제외)
+
+        Args:
+            name: 세션 이름, 파일명 또는 전화번호
+
+        Returns:
+            세션 레코드 (없으면 None)
+        """
+        filename = self._find_session_file(name)
+        if not filename:
+            return None
+
+        entry = self.storage.list_entries().get(filename)
+        if entry is None:
+            return None
+
+        return SessionRecord.from_entry(filename, entry)
 
-        # 생성 시간순 정렬
-        sessions.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-        return sessions
+    @metrics.timed("search")
+    def search(self, query: str, limit: Optional[int] = None) -> List[SessionRecord]:
+        """
+        이름/메모 단어와 전화번호 앞자리로 세션 검색 (최근 생성순)
+
+        처음 검색할 때 저장소 메타데이터로 메모리 인덱스를 만들고,
+        이후에는 다른 프로세스가 세션을 바꾸지 않은 한 인덱스만 조회합니다.
+
+        Args:
+            query: 검색어 (공백으로 나눈 단어는 모두 일치해야 함, 예: "alice +8210")
+            limit: 반환할 최대 세션 수 (None이면 전부)
+
+        Returns:
+            일치하는 세션 레코드 리스트
+        """
+        generation = self.storage.generation()
+        if self._search_index is None or generation != self._search_generation:
+            self._search_index = SessionSearchIndex(self.storage.list_entries())
+            self._search_generation = generation
+
+        records = [
+            SessionRecord.from_entry(filename, entry)
+            for filename, entry in self._search_index.search(query).items()
+        ]
+        records.sort(reverse=True)
+        return records[:limit] if limit is not None else records
+
+    def encrypt_existing(self) -> int:
+        """
+        평문으로 저장된 세션을 모두 암호화 (암호를 지정한 경우만)
+
+        Returns:
+            암호화한 세션 수 (실패시 -1)
+        """
+        encrypt = getattr(self.storage, "encrypt_existing", None)
+        if encrypt is None:
+            logger.error("❌ 암호를 지정하지 않아 세션을 암호화할 수 없습니다.")
+            return -1
 
+        try:
+            count = encrypt()
+            self._search_index = None
+            logger.info("🔒 세션 %d개를 암호화했습니다.", count)
+            return count
+
+        except Exception as e:
+            logger.error("❌ 세션 암호화 실패: %s", e)
+            return -1
+
+    @metrics.timed("delete_session")
     def delete_session(self, name: str) -> bool:
         """
         세션 파일 삭제
@@ -161,141 +292,672 @@ class SessionManager:
         try:
             filename = self._find_session_file(name)
             if not filename:
-                print(f"❌ '{name}' 세션을 찾을 수 없습니다.")
+                logger.warning("❌ '%s' 세션을 찾을 수 없습니다.", name)
                 return False
 
-            filepath = self.sessions_dir / filename
-            filepath.unlink()
+            self.storage.delete(filename)
+            if self._search_index is not None:
+                self._search_index.remove(filename)
 
-            print(f"🗑️ 세션이 삭제되었습니다: {filename}")
+            logger.info("🗑️ 세션이 삭제되었습니다: %s", filename)
             return True
 
         except Exception as e:
-            print(f"❌ 세션 삭제 실패: {e}")
+            logger.error("❌ 세션 삭제 실패: %s", e)
             return False
 
+    @metrics.timed("find_session")
     def _find_session_file(self, name: str) -> Optional[str]:
         """
         세션 이름으로 파일명 찾기
 
         Args:
-            name: 세션 이름
+            name: 세션 이름, 파일명 또는 전화번호
 
         Returns:
             찾은 파일명 (없으면 None)
         """
-        # 정확한 파일명인 경우
-        if name.endswith('.json'):
-            filepath = self.sessions_dir / name
-            if filepath.exists():
-                return name
+        # 저장소 인덱스의 파일명/이름/전화번호로 조회
+        return self.storage.find(name)
 
-        # 확장자 없는 파일명인 경우
-        filename_with_ext = f"{name}.json"
-        filepath = self.sessions_dir / filename_with_ext
-        if filepath.exists():
-            return filename_with_ext
+    def export_bulk(self, path: Union[str, Path],
+                    compression: Optional[str] = "auto") -> int:
+        """
+        모든 세션을 아카이브 파일 하나로 내보내기
 
-        # 세션 이름으로 검색
-        for filepath in self.sessions_dir.glob("*.json"):
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    session_data = json.load(f)
+        Args:
+            path: 아카이브 경로 (.ndjson, .ndjson.gz, .ndjson.zst 등)
+            compression: "gzip", "zstd", None 또는 "auto"(확장자로 판단)
 
-                if session_data.get("name") == name:
-                    return filepath.name
+        Returns:
+            내보낸 세션 수 (실패시 -1)
+        """
+        try:
+            records = (
+                {"filename": filename, **session_data}
+                for filename, session_data in self.storage.iter_sessions()
+            )
+            count = write_archive(path, records, compression)
 
-            except Exception:
-                continue
+            logger.info("📦 세션 %d개를 내보냈습니다: %s", count, path)
+            return count
 
-        return None
+        except Exception as e:
+            logger.error("❌ 세션 내보내기 실패: %s", e)
+            return -1
 
-    def print_sessions_list(self) -> None:
-        """저장된 세션 목록을 예쁘게 출력"""
-        sessions = self.list_sessions()
+    def import_bulk(self, path: Union[str, Path], overwrite: bool = False,
+                    compression: Optional[str] = "auto") -> int:
+        """
+        아카이브 파일의 세션들을 한 번에 가져오기
 
-        if not sessions:
-            print("📭 저장된 세션이 없습니다.")
+        아카이브를 한 줄씩 읽어서 저장소에 일괄 기록합니다.
+        (JSON 백엔드는 인덱스를 한 번만, SQLite 백엔드는 트랜잭션 하나로 기록)
+
+        Args:
+            path: 아카이브 경로
+            overwrite: 같은 이름의 세션이 같은 파일명에 있으면 덮어쓸지 여부
+                       (이름이 다른 세션과 파일명이 겹치면 "이름_2.json"처럼 번호를 붙여 저장)
+            compression: "gzip", "zstd", None 또는 "auto"(확장자로 판단)
+
+        Returns:
+            가져온 세션 수 (실패시 -1)
+        """
+        try:
+            # 파일명 -> 세션 이름 (아카이브에서 가져온 세션도 추가됨)
+            existing = {
+                filename: entry.get("name")
+                for filename, entry in self.storage.list_entries().items()
+            }
+            skipped = 0
+
+            def _items():
+                nonlocal skipped
+                for record in read_archive(path, compression):
+                    if not record.get("session_string") or not record.get("name"):
+                        skipped += 1
+                        continue
+
+                    # 아카이브의 파일명은 세션 디렉토리 안의 평범한 .json 파일명일 때만 사용
+                    # (이름이 다른 세션과 파일명이 겹치면 save_session()처럼 번호를 붙임)
+                    filename = self._archive_filename(record.pop("filename", None))
+                    if filename is None:
+                        filename = self._make_filename(record["name"])
+                    for filename in unique_filenames(filename):
+                        if filename not in existing or existing[filename] == record["name"]:
+                            break
+
+                    if filename in existing and not overwrite:
+                        skipped += 1
+                        continue
+
+                    existing[filename] = record["name"]
+                    yield filename, record
+
+            count = self.storage.write_many(_items())
+            self._search_index = None
+
+            logger.info("📦 세션 %d개를 가져왔습니다 (건너뜀: %d개): %s", count, skipped, path)
+            return count
+
+        except Exception as e:
+            logger.error("❌ 세션 가져오기 실패: %s", e)
+            return -1
+
+    async def validate_all(self, api_id: Optional[int] = None,
+                           api_hash: Optional[str] = None,
+                           concurrency: int = 10, timeout: float = 15.0,
+                           client_factory: Optional[Callable[[str], Any]] = None,
+                           pool: Optional[ClientPool] = None,
+                           force_refresh: bool = False) -> Dict[str, Any]:
+        """
+        저장된 모든 세션의 연결 상태를 동시에 검사
+
+        세마포어로 동시 연결 수를 제한하고, 세션마다 제한 시간을 둡니다.
+        검사 결과와 사용자 정보(id, first_name, username)는 저장소의 세션 상태에
+        한 번에 기록되며, identity_ttl 안에 확인된 세션은 네트워크 없이
+        저장된 결과를 사용합니다.
+
+        Args:
+            api_id: 텔레그램 API ID (client_factory가 없을 때 필요)
+            api_hash: 텔레그램 API Hash (client_factory가 없을 때 필요)
+            concurrency: 동시에 검사할 최대 세션 수
+            timeout: 세션 하나당 제한 시간 (초)
+            client_factory: 세션 문자열로 클라이언트를 만드는 함수
+                (connect/is_user_authorized/get_me/disconnect 코루틴 필요,
+                테스트용 가짜 클라이언트 주입에 사용)
+            pool: 클라이언트 연결 풀 (있으면 연결을 재사용하고 검사 후 끊지 않음)
+            force_refresh: True면 캐시를 무시하고 모든 세션을 다시 검사
+
+        Returns:
+            검사 결과 보고서
+            {"total", "valid", "invalid", "errors", "cached", "elapsed", "results": [...]}
+        """
+        if client_factory is None and pool is None:
+            if not api_id or not api_hash:
+                raise ValueError("API 정보, client_factory 또는 pool이 필요합니다.")
+
+            def client_factory(session_string: str) -> Any:
+                return create_client(session_string, api_id, api_hash)
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        started = time.perf_counter()
+
+        async def _check(filename: str) -> Dict[str, Any]:
+            async with semaphore:
+                result = {
+                    "filename": filename,
+                    "name": None,
+                    "valid": None,
+                    "identity": None,
+                    "error": None,
+                    "cached": False
+                }
+                check_started = time.perf_counter()
+                client = None
+
+                try:
+                    session_data = await self._run_io(self.storage.read, filename)
+                    result["name"] = session_data.get("name")
+
+                    if pool is not None:
+                        probe = _probe_pooled(pool, session_data["session_string"])
+                    else:
+                        client = client_factory(session_data["session_string"])
+                        probe = _probe_client(client)
+
+                    result["valid"], result["identity"] = await asyncio.wait_for(
+                        probe, timeout
+                    )
+                except asyncio.TimeoutError:
+                    result["error"] = f"시간 초과 ({timeout}초)"
+                except Exception as e:
+                    result["error"] = str(e) or type(e).__name__
+                finally:
+                    if client is not None:
+                        try:
+                            await asyncio.wait_for(client.disconnect(), timeout)
+                        except Exception:
+                            pass
+
+                result["elapsed"] = round(time.perf_counter() - check_started, 3)
+                return result
+
+        try:
+            # 최근에 확인된 세션은 저장된 결과 사용
+            results = []
+            stale = []
+            entries = await self._run_io(self.storage.list_entries)
+            for filename, entry in entries.items():
+                status = entry.get("status")
+                if not force_refresh and self._is_status_fresh(status):
+                    results.append({
+                        "filename": filename,
+                        "name": entry.get("name"),
+                        "valid": status.get("valid"),
+                        "identity": status.get("identity"),
+                        "error": None,
+                        "cached": True,
+                        "elapsed": 0.0
+                    })
+                else:
+                    stale.append(filename)
+
+            checked = await asyncio.gather(*(_check(filename) for filename in stale))
+            results.extend(checked)
+
+            # 검사 결과를 세션 상태에 일괄 기록
+            checked_at = datetime.now().isoformat()
+            await self._run_io(self.storage.update_status, {
+                result["filename"]: {
+                    "valid": result["valid"],
+                    "identity": result["identity"],
+                    "error": result["error"],
+                    "checked_at": checked_at
+                }
+                for result in checked
+            })
+            self._search_index = None
+
+        except Exception as e:
+            logger.error("❌ 세션 일괄 검사 실패: %s", e)
+            raise
+
+        report = {
+            "total": len(results),
+            "valid": sum(1 for r in results if r["valid"] is True),
+            "invalid": sum(1 for r in results if r["valid"] is False),
+            "errors": sum(1 for r in results if r["error"] is not None),
+            "cached": sum(1 for r in results if r["cached"]),
+            "elapsed": round(time.perf_counter() - started, 3),
+            "results": results
+        }
+
+        logger.info("🔍 세션 %d개 검사 완료: 유효 %d개, 만료 %d개, 오류 %d개 (캐시 %d개)",
+                    report['total'], report['valid'], report['invalid'], report['errors'],
+                    report['cached'])
+        return report
+
+    @metrics.timed("test_connection")
+    async def test_connection(self, name: str, api_id: int, api_hash: str,
+                              pool: Optional[ClientPool] = None,
+                              force_refresh: bool = False) -> bool:
+        """
+        저장된 세션의 텔레그램 연결 테스트
+
+        identity_ttl 안에 유효하다고 확인된 세션은 네트워크 없이 저장된 결과를
+        사용하고, 새로 검사한 결과는 validate_all()처럼 세션 상태에 기록합니다.
+
+        Args:
+            name: 세션 이름, 파일명 또는 전화번호
+            api_id: 텔레그램 API ID
+            api_hash: 텔레그램 API Hash
+            pool: 클라이언트 연결 풀 (있으면 연결을 재사용하고 끊지 않음)
+            force_refresh: True면 캐시를 무시하고 다시 검사
+
+        Returns:
+            연결 성공 여부
+        """
+        filename = await self._run_io(self._find_session_file, name)
+        if not filename:
+            logger.warning("❌ '%s' 세션을 찾을 수 없습니다.", name)
+            return False
+
+        if not force_refresh:
+            identity = await self._run_io(self.get_cached_identity, filename)
+            if identity is not None:
+                return _report_authorization(True, identity, cached=True)
+
+        try:
+            logger.info("🔍 세션 연결을 테스트합니다...")
+            session_data = await self._run_io(self.storage.read, filename)
+            if is_encrypted(session_data["session_string"]):
+                logger.warning("❌ '%s' 세션은 암호화되어 있습니다. 암호를 지정해서 불러오세요.", name)
+                return False
+
+            valid, identity = await _check_connection(
+                session_data["session_string"], api_id, api_hash, pool
+            )
+
+            await self._run_io(self.storage.update_status, {
+                filename: {
+                    "valid": valid,
+                    "identity": identity,
+                    "error": None,
+                    "checked_at": datetime.now().isoformat()
+                }
+            })
+            self._search_index = None
+
+        except Exception as e:
+            logger.error("❌ 연결 테스트 실패: %s", e)
+            return False
+
+        return _report_authorization(valid, identity)
+
+    def get_cached_identity(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        마지막 검사에서 저장된 사용자 정보 조회 (네트워크 사용 안 함)
+
+        Args:
+            name: 세션 이름, 파일명 또는 전화번호
+
+        Returns:
+            {"id", "first_name", "username"} (identity_ttl이 지났거나 없으면 None)
+        """
+        filename = self._find_session_file(name)
+        if not filename:
+            return None
+
+        status = self.storage.list_entries().get(filename, {}).get("status")
+        if not self._is_status_fresh(status) or not status.get("valid"):
+            return None
+
+        return status.get("identity")
+
+    def _is_status_fresh(self, status: Optional[Dict[str, Any]]) -> bool:
+        """
+        세션 상태가 identity_ttl 안에 확인된 결과인지 여부
+
+        Args:
+            status: 저장소의 세션 상태
+
+        Returns:
+            캐시로 사용할 수 있는지 여부 (오류로 끝난 검사는 캐시하지 않음)
+        """
+        if not status or status.get("valid") is None or not status.get("checked_at"):
+            return False
+
+        try:
+            checked_at = datetime.fromisoformat(status["checked_at"])
+        except (TypeError, ValueError):
+            return False
+
+        return (datetime.now() - checked_at).total_seconds() < self.identity_ttl
+
+    async def _run_io(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        저장소 작업을 전용 스레드에서 실행 (이벤트 루프를 막지 않음)
+
+        작업은 스레드 하나에서 순서대로 실행되므로 서로 겹치지 않습니다.
+        """
+        if self._io_executor is None:
+            self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="session-io")
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._io_executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def alist_sessions(self) -> List[SessionRecord]:
+        """list_sessions()의 비동기 버전 (파일 입출력을 스레드에서 실행)"""
+        return await self._run_io(self.list_sessions)
+
+    async def asearch(self, query: str, limit: Optional[int] = None) -> List[SessionRecord]:
+        """search()의 비동기 버전 (인덱스 구성을 스레드에서 실행)"""
+        return await self._run_io(self.search, query, limit)
+
+    async def aload_session(self, name: str) -> Optional[str]:
+        """load_session()의 비동기 버전 (파일 입출력을 스레드에서 실행)"""
+        return await self._run_io(self.load_session, name)
+
+    async def asave_session(self, session_string: str, name: str,
+                            phone: Optional[str] = None,
+                            notes: Optional[str] = None) -> bool:
+        """save_session()의 비동기 버전 (파일 입출력을 스레드에서 실행)"""
+        return await self._run_io(self.save_session, session_string, name, phone, notes)
+
+    async def adelete_session(self, name: str) -> bool:
+        """delete_session()의 비동기 버전 (파일 입출력을 스레드에서 실행)"""
+        return await self._run_io(self.delete_session, name)
+
+    def close(self) -> None:
+        """미뤄둔 변경사항을 반영하고 저장소 닫기"""
+        if self._io_executor is not None:
+            self._io_executor.shutdown(wait=True)
+            self._io_executor = None
+        self.storage.close()
+
+    @staticmethod
+    def _archive_filename(filename: Any) -> Optional[str]:
+        """
+        아카이브에 기록된 파일명 검사
+
+        _make_filename()이 만드는 것과 같은 문자(글자, 숫자, 공백, -, _)로 된
+        .json 파일명만 받으므로 경로 구분자나 "..", 숨김 파일(.meta 등)이
+        들어간 파일명으로 세션 디렉토리 밖이나 메타데이터를 덮어쓸 수 없습니다.
+
+        Args:
+            filename: 아카이브 레코드의 filename 값
+
+        Returns:
+            그대로 써도 되는 파일명 (아니면 None)
+        """
+        if not isinstance(filename, str) or not filename.endswith(".json"):
+            return None
+
+        stem = filename[:-len(".json")]
+        if not stem or stem != stem.strip():
+            return None
+        if not all(c.isalnum() or c in (' ', '-', '_') for c in stem):
+            return None
+        return filename
+
+    @staticmethod
+    def _make_filename(name: str) -> str:
+        """
+        세션 이름으로 파일명 만들기
+
+        Args:
+            name: 세션 이름
+
+        Returns:
+            특수문자를 제거한 파일명
+        """
+        # 파일명 정리 (특수문자 제거)
+        safe_name = "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).strip()
+        if not safe_name:
+            safe_name = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+        return f"{safe_name}.json"
+
+    def print_sessions_list(self, sessions: Optional[List[SessionRecord]] = None,
+                            page_size: Optional[int] = None,
+                            filter: Optional[str] = None) -> None:
+        """
+        저장된 세션 목록을 예쁘게 출력
+
+        Args:
+            sessions: 미리 조회한 세션 목록 (없으면 저장소에서 하나씩 조회)
+            page_size: 이 개수만큼 출력할 때마다 계속 볼지 물어봄 (None이면 전부 출력)
+            filter: 이름/전화번호/메모에 포함된 문자열 (sessions가 없을 때만 사용)
+        """
+        if sessions is None:
+            total = self.count_sessions(filter)
+            sessions = self.iter_sessions(filter=filter)
+        else:
+            total = len(sessions)
+
+        if not self._print_list_header(total):
+            return
+
+        for i, session in enumerate(sessions, 1):
+            self._print_session_entry(i, session)
+
+            if page_size and i % page_size == 0 and i < total:
+                answer = input(f"-- {i}/{total} -- 계속하려면 Enter, 그만 보려면 q: ")
+                if answer.strip().lower() == "q":
+                    break
+
+    async def aprint_sessions_list(self, page_size: Optional[int] = None,
+                                   filter: Optional[str] = None) -> None:
+        """
+        print_sessions_list()의 비동기 버전
+
+        한 페이지씩 입출력 스레드에서 조회하고, 다음 페이지를 볼지 묻는 입력 대기는
+        별도 스레드에서 하므로 사용자가 답하는 동안에도 다른 저장소 작업이 밀리지 않습니다.
+        """
+        total = await self._run_io(self.count_sessions, filter)
+        if not self._print_list_header(total):
             return
 
-        print(f"\n📋 저장된 세션 목록 ({len(sessions)}개):")
+        loop = asyncio.get_running_loop()
+        step = page_size or total
+        for offset in range(0, total, step):
+            page = await self._run_io(
+                lambda: list(self.iter_sessions(filter=filter, offset=offset, limit=step))
+            )
+            for i, session in enumerate(page, offset + 1):
+                self._print_session_entry(i, session)
+
+            shown = offset + len(page)
+            if not page or shown >= total:
+                break
+            answer = await loop.run_in_executor(
+                None, input, f"-- {shown}/{total} -- 계속하려면 Enter, 그만 보려면 q: "
+            )
+            if answer.strip().lower() == "q":
+                break
+
+    @staticmethod
+    def _print_list_header(total: int) -> bool:
+        """세션 목록 제목 출력 (세션이 없으면 안내만 출력하고 False)"""
+        if not total:
+            print("📭 저장된 세션이 없습니다.")
+            return False
+
+        print(f"\n📋 저장된 세션 목록 ({total}개):")
         print("=" * 60)
+        return True
+
+    @staticmethod
+    def _print_session_entry(i: int, session: SessionRecord) -> None:
+        """세션 하나를 목록 형식으로 출력"""
+        # 날짜는 레코드를 만들 때 이미 변환됨
+        created = session.created_at.strftime("%Y-%m-%d %H:%M") if session.created_at else "Unknown"
+        last_used = session.last_used.strftime("%Y-%m-%d %H:%M") if session.last_used else "Never"
+
+        print(f"{i:2d}. 📱 {session.name or 'Unknown'}")
+        print(f"     전화번호: {session.phone or 'Unknown'}")
+        print(f"     파일명: {session.filename}")
+        print(f"     생성일: {created}")
+        print(f"     마지막 사용: {last_used}")
+
+        if session.notes:
+            print(f"     메모: {session.notes}")
+
+        status = session.status
+        if status:
+            identity = status.get("identity") or {}
+            if status.get("valid"):
+                who = identity.get("first_name") or identity.get("username")
+                state = f"✅ 유효 ({who})" if who else "✅ 유효"
+            elif status.get("valid") is False:
+                state = "❌ 만료"
+            else:
+                state = f"⚠️ 확인 실패 ({status.get('error')})"
+            print(f"     상태: {state} ({status.get('checked_at', '')[:16].replace('T', ' ')})")
+
+        print("-" * 60)
+
+
+def _identity_of(me: Any) -> Dict[str, Any]:
+    """get_me() 결과에서 캐시할 사용자 정보 추출"""
+    return {
+        "id": getattr(me, 'id', None),
+        "first_name": getattr(me, 'first_name', None),
+        "username": getattr(me, 'username', None)
+    }
+
+
+async def _probe_authorized(client: Any) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    """
+    연결된 클라이언트의 인증 여부와 사용자 정보 확인
 
-        for i, session in enumerate(sessions, 1):
-            name = session.get("name", "Unknown")
-            phone = session.get("phone", "Unknown")
-            created = session.get("created_at", "Unknown")
-            last_used = session.get("last_used", "Never")
-            filename = session.get("filename", "Unknown")
+    Args:
+        client: 연결된 TelegramClient 또는 같은 코루틴을 가진 객체
 
-            # 날짜 포맷팅
-            try:
-                if created != "Unknown":
-                    created_dt = datetime.fromisoformat(created)
-                    created = created_dt.strftime("%Y-%m-%d %H:%M")
+    Returns:
+        (인증된 세션 여부, 사용자 정보)
+    """
+    if not await client.is_user_authorized():
+        return False, None
 
-                if last_used != "Never" and last_used:
-                    last_used_dt = datetime.fromisoformat(last_used)
-                    last_used = last_used_dt.strftime("%Y-%m-%d %H:%M")
-            except Exception:
-                pass
+    return True, _identity_of(await client.get_me())
 
-            print(f"{i:2d}. 📱 {name}")
-            print(f"     전화번호: {phone}")
-            print(f"     파일명: {filename}")
-            print(f"     생성일: {created}")
-            print(f"     마지막 사용: {last_used}")
 
-            if session.get("notes"):
-                print(f"     메모: {session['notes']}")
+async def _probe_client(client: Any) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    """
+    클라이언트를 연결하고 인증 여부와 사용자 정보 확인
 
-            print("-" * 60)
+    Args:
+        client: TelegramClient 또는 같은 코루틴을 가진 객체
+
+    Returns:
+        (인증된 세션 여부, 사용자 정보)
+    """
+    await client.connect()
+    return await _probe_authorized(client)
 
 
-async def test_session_connection(session_string: str, api_id: int, api_hash: str) -> bool:
+async def _probe_pooled(pool: ClientPool, session_string: str
+                        ) -> Tuple[bool, Optional[Dict[str, Any]]]:
     """
-    세션 문자열로 텔레그램 연결 테스트
+    연결 풀의 클라이언트로 인증 여부와 사용자 정보 확인
 
     Args:
-        session_string: 테스트할 세션 문자열
+        pool: 클라이언트 연결 풀
+        session_string: 세션 문자열
+
+    Returns:
+        (인증된 세션 여부, 사용자 정보)
+    """
+    async with pool.client(session_string) as client:
+        return await _probe_authorized(client)
+
+
+async def _check_connection(session_string: str, api_id: int, api_hash: str,
+                            pool: Optional[ClientPool] = None
+                            ) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    """
+    세션 문자열로 연결해서 인증 여부와 사용자 정보 확인
+
+    Args:
+        session_string: 확인할 세션 문자열
         api_id: 텔레그램 API ID
         api_hash: 텔레그램 API Hash
+        pool: 클라이언트 연결 풀 (있으면 연결을 재사용하고 끊지 않음)
 
     Returns:
-        연결 성공 여부
+        (인증된 세션 여부, 사용자 정보)
     """
-    client = None
+    if pool is not None:
+        return await _probe_pooled(pool, session_string)
+
+    client = create_client(session_string, api_id, api_hash)
     try:
-        print("🔍 세션 연결을 테스트합니다...")
+        return await _probe_client(client)
+    finally:
+        await client.disconnect()
 
-        client = TelegramClient(
-            StringSession(session_string),
-            api_id,
-            api_hash
-        )
 
-        await client.connect()
+def _report_authorization(valid: bool, identity: Optional[Dict[str, Any]],
+                          cached: bool = False) -> bool:
+    """
+    연결 테스트 결과 출력
 
-        if await client.is_user_authorized():
-            me = await client.get_me()
-            name = getattr(me, 'first_name', None) or getattr(me, 'username', None) or 'Unknown'
-            print(f"✅ 연결 성공! ({name})")
-            return True
+    Args:
+        valid: 인증된 세션 여부
+        identity: 사용자 정보
+        cached: 최근 검사 결과를 그대로 쓴 경우
+
+    Returns:
+        인증된 세션 여부
+    """
+    if valid:
+        identity = identity or {}
+        name = identity.get("first_name") or identity.get("username") or 'Unknown'
+        if cached:
+            logger.info("✅ 연결 성공! (%s, 최근 확인 결과)", name)
         else:
-            print("❌ 세션이 만료되었거나 유효하지 않습니다.")
-            return False
+            logger.info("✅ 연결 성공! (%s)", name)
+        return True
+
+    logger.warning("❌ 세션이 만료되었거나 유효하지 않습니다.")
+    return False
+
+
+@metrics.timed("test_session_connection")
+async def test_session_connection(session_string: str, api_id: int, api_hash: str,
+                                  pool: Optional[ClientPool] = None) -> bool:
+    """
+    세션 문자열로 텔레그램 연결 테스트
+
+    저장된 세션은 검사 결과를 캐시하는 SessionManager.test_connection()을 쓰세요.
+
+    Args:
+        session_string: 테스트할 세션 문자열
+        api_id: 텔레그램 API ID
+        api_hash: 텔레그램 API Hash
+        pool: 클라이언트 연결 풀 (있으면 연결을 재사용하고 끊지 않음)
+
+    Returns:
+        연결 성공 여부
+    """
+    try:
+        logger.info("🔍 세션 연결을 테스트합니다...")
+        return _report_authorization(
+            *await _check_connection(session_string, api_id, api_hash, pool)
+        )
 
     except Exception as e:
-        print(f"❌ 연결 테스트 실패: {e}")
+        logger.error("❌ 연결 테스트 실패: %s", e)
         return False
 
-    finally:
-        if client:
-            await client.disconnect()
-
 
 def main() -> None:
     """간단한 CLI 인터페이스"""
+    log_config.configure_console()
     manager = SessionManager()
 
     while True:
@@ -319,12 +981,12 @@ def main() -> None:
 
             print("\n📋 사용 가능한 세션:")
             for i, session in enumerate(sessions, 1):
-                print(f"{i}. {session['name']} ({session.get('phone', 'Unknown')})")
+                print(f"{i}. {session.name} ({session.phone or 'Unknown'})")
 
             try:
                 idx = int(input("\n세션 번호를 선택하세요: ")) - 1
                 if 0 <= idx < len(sessions):
-                    session_name = sessions[idx]["name"]
+                    session_name = sessions[idx].name
                     session_string = manager.load_session(session_name)
 
                     if session_string:
@@ -347,12 +1009,12 @@ def main() -> None:
 
             print("\n📋 저장된 세션:")
             for i, session in enumerate(sessions, 1):
-                print(f"{i}. {session['name']} ({session.get('phone', 'Unknown')})")
+                print(f"{i}. {session.name} ({session.phone or 'Unknown'})")
 
             try:
                 idx = int(input("\n삭제할 세션 번호를 선택하세요: ")) - 1
                 if 0 <= idx < len(sessions):
-                    session_name = sessions[idx]["name"]
+                    session_name = sessions[idx].name
                     confirm = input(f"정말로 '{session_name}' 세션을 삭제하시겠습니까? (y/n): ").strip().lower()
 
                     if confirm in ['y', 'yes', '예']:
@@ -0,0 +1,127 @@
+# type: ignore
+"""
+세션 메타데이터 레코드
+목록/조회 결과를 자유 형식 딕셔너리 대신 __slots__ 기반 객체로 다루는 기능
+(날짜는 불러올 때 한 번만 datetime으로 변환)
+
+Python 3.11.9
+PEP8 준수
+"""
+
+from datetime import datetime
+from functools import total_ordering
+from typing import Any, Dict, Optional
+
+
+def _parse_datetime(value: Any) -> Optional[datetime]:
+    """ISO 형식 문자열을 datetime으로 변환 (비어 있거나 잘못된 값은 None)"""
+    if isinstance(value, datetime):
+        return value
+    if not value:
+        return None
+
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@total_ordering
+class SessionRecord:
+    """
+    세션 메타데이터 (세션 문자열 제외)
+
+    정렬 순서는 생성 시간, 같으면 파일명 기준입니다.
+    """
+
+    __slots__ = (
+        "filename", "name", "phone", "notes",
+        "created_at", "last_used", "file_size", "status"
+    )
+
+    def __init__(self, filename: str, name: Optional[str] = None,
+                 phone: Optional[str] = None, notes: Optional[str] = None,
+                 created_at: Optional[datetime] = None,
+                 last_used: Optional[datetime] = None,
+                 file_size: Optional[int] = None,
+                 status: Optional[Dict[str, Any]] = None) -> None:
+        """
+        레코드 초기화
+
+        Args:
+            filename: 세션 파일명 (저장소 키)
+            name: 세션 이름
+            phone: 전화번호
+            notes: 메모
+            created_at: 생성 시간
+            last_used: 마지막 사용 시간
+            file_size: 세션 파일 크기 (JSON 백엔드만)
+            status: 마지막 연결 검사 결과
+        """
+        self.filename = filename
+        self.name = name
+        self.phone = phone
+        self.notes = notes
+        self.created_at = created_at
+        self.last_used = last_used
+        self.file_size = file_size
+        self.status = status
+
+    @classmethod
+    def from_entry(cls, filename: str, entry: Dict[str, Any]) -> "SessionRecord":
+        """
+        저장소 메타데이터 딕셔너리로 레코드 생성
+
+        Args:
+            filename: 세션 파일명
+            entry: 저장소가 반환한 메타데이터
+
+        Returns:
+            세션 레코드
+        """
+        return cls(
+            filename=filename,
+            name=entry.get("name"),
+            phone=entry.get("phone"),
+            notes=entry.get("notes"),
+            created_at=_parse_datetime(entry.get("created_at")),
+            last_used=_parse_datetime(entry.get("last_used")),
+            file_size=entry.get("file_size"),
+            status=entry.get("status")
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON으로 내보낼 수 있는 딕셔너리로 변환 (날짜는 ISO 형식)
+
+        Returns:
+            세션 정보 딕셔너리
+        """
+        return {
+            "filename": self.filename,
+            "name": self.name,
+            "phone": self.phone,
+            "notes": self.notes,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "last_used": self.last_used.isoformat() if self.last_used else None,
+            "file_size": self.file_size,
+            "status": self.status
+        }
+
+    def _sort_key(self) -> tuple:
+        return self.created_at or datetime.min, self.filename
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, SessionRecord):
+            return NotImplemented
+        return self._sort_key() == other._sort_key()
+
+    def __lt__(self, other: "SessionRecord") -> bool:
+        if not isinstance(other, SessionRecord):
+            return NotImplemented
+        return self._sort_key() < other._sort_key()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"SessionRecord(filename={self.filename!r}, name={self.name!r}, phone={self.phone!r})"
@@ -0,0 +1,258 @@
+# type: ignore
+"""
+세션 검색 인덱스
+이름/메모의 단어와 전화번호 앞자리로 세션을 빠르게 찾기 위한 메모리 인덱스
+(정렬된 키 목록에서 이진 탐색으로 접두사 검색)
+
+Python 3.11.9
+PEP8 준수
+"""
+
+import re
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# 검색 대상 텍스트 필드
+TEXT_FIELDS = ("name", "notes")
+
+_TOKEN_RE = re.compile(r"\w+")
+_NON_DIGIT_RE = re.compile(r"\D")
+# 전화번호로 볼 검색 단어 ("+8210", "010-1234" 등)
+_PHONE_TERM_RE = re.compile(r"\+?\d[\d\-()]*")
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    텍스트를 소문자 단어 목록으로 나누기
+
+    Args:
+        text: 원본 텍스트
+
+    Returns:
+        단어 리스트 (중복 포함)
+    """
+    if not text:
+        return []
+    return _TOKEN_RE.findall(text.lower())
+
+
+def phone_digits(phone: Optional[str]) -> str:
+    """
+    전화번호에서 숫자만 남기기 ("+82 10-1234" -> "82101234")
+
+    Args:
+        phone: 전화번호
+
+    Returns:
+        숫자 문자열 (없으면 빈 문자열)
+    """
+    if not phone:
+        return ""
+    return _NON_DIGIT_RE.sub("", phone)
+
+
+class _PrefixIndex:
+    """키 -> 파일명 집합 사전과 접두사 검색용 정렬된 키 목록"""
+
+    __slots__ = ("postings", "keys")
+
+    def __init__(self) -> None:
+        self.postings: Dict[str, Set[str]] = {}
+        self.keys: List[str] = []
+
+    def add(self, key: str, filename: str) -> None:
+        """키에 파일명 추가"""
+        filenames = self.postings.get(key)
+        if filenames is None:
+            self.postings[key] = {filename}
+            insort(self.keys, key)
+        else:
+            filenames.add(filename)
+
+    def discard(self, key: str, filename: str) -> None:
+        """키에서 파일명 제거 (남은 파일이 없으면 키도 제거)"""
+        filenames = self.postings.get(key)
+        if filenames is None:
+            return
+
+        filenames.discard(filename)
+        if not filenames:
+            del self.postings[key]
+            i = bisect_left(self.keys, key)
+            if i < len(self.keys) and self.keys[i] == key:
+                del self.keys[i]
+
+    def match(self, prefix: str) -> Set[str]:
+        """
+        prefix로 시작하는 모든 키의 파일명 합집합
+
+        일치하는 키가 하나뿐이면 복사하지 않고 인덱스의 집합을 그대로
+        반환하므로 결과를 수정하면 안 됩니다.
+        """
+        keys = self.keys
+        i = bisect_left(keys, prefix)
+        if i >= len(keys) or not keys[i].startswith(prefix):
+            return set()
+        if i + 1 >= len(keys) or not keys[i + 1].startswith(prefix):
+            return self.postings[keys[i]]
+
+        matched: Set[str] = set()
+        while i < len(keys) and keys[i].startswith(prefix):
+            matched |= self.postings[keys[i]]
+            i += 1
+        return matched
+
+
+def _intersect(sets: List[Set[str]]) -> Set[str]:
+    """작은 집합부터 교집합 (입력 집합은 수정하지 않음)"""
+    if not sets:
+        return set()
+
+    sets.sort(key=len)
+    result = set(sets[0])
+    for other in sets[1:]:
+        if not result:
+            break
+        result &= other
+    return result
+
+
+class SessionSearchIndex:
+    """
+    이름/메모 단어와 전화번호 접두사 검색 인덱스
+
+    검색어를 공백으로 나눈 각 단어가 모두 일치하는 세션만 찾습니다.
+    단어는 이름/메모 단어의 접두사로, 숫자로 된 단어는 전화번호의
+    접두사로도 비교합니다. (예: "alice +8210" -> 이름이나 메모에 alice로
+    시작하는 단어가 있고 전화번호가 +82 10...인 세션)
+    """
+
+    def __init__(self, entries: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+        """
+        검색 인덱스 초기화
+
+        Args:
+            entries: 파일명 -> 메타데이터 (저장소의 list_entries() 결과)
+        """
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._keys: Dict[str, Tuple[Set[str], str]] = {}
+        self._tokens = _PrefixIndex()
+        self._phones = _PrefixIndex()
+
+        if entries:
+            self._build(entries.items())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _build(self, items: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """처음 한 번에 인덱스 구성 (키를 모아서 한 번만 정렬)"""
+        tokens = self._tokens.postings
+        phones = self._phones.postings
+
+        for filename, entry in items:
+            entry_tokens, digits = self._index_keys(entry)
+            self._entries[filename] = self._metadata(entry)
+            self._keys[filename] = (entry_tokens, digits)
+
+            for token in entry_tokens:
+                tokens.setdefault(token, set()).add(filename)
+            if digits:
+                phones.setdefault(digits, set()).add(filename)
+
+        self._tokens.keys = sorted(tokens)
+        self._phones.keys = sorted(phones)
+
+    def put(self, filename: str, entry: Dict[str, Any]) -> None:
+        """
+        세션 추가 또는 갱신
+
+        Args:
+            filename: 세션 파일명
+            entry: 세션 정보 (세션 문자열은 보관하지 않음)
+        """
+        self.remove(filename)
+
+        entry_tokens, digits = self._index_keys(entry)
+        self._entries[filename] = self._metadata(entry)
+        self._keys[filename] = (entry_tokens, digits)
+
+        for token in entry_tokens:
+            self._tokens.add(token, filename)
+        if digits:
+            self._phones.add(digits, filename)
+
+    def remove(self, filename: str) -> None:
+        """
+        세션 제거 (없으면 무시)
+
+        Args:
+            filename: 세션 파일명
+        """
+        keys = self._keys.pop(filename, None)
+        self._entries.pop(filename, None)
+        if keys is None:
+            return
+
+        entry_tokens, digits = keys
+        for token in entry_tokens:
+            self._tokens.discard(token, filename)
+        if digits:
+            self._phones.discard(digits, filename)
+
+    def touch(self, filename: str, used_at: str) -> None:
+        """
+        마지막 사용 시간 갱신 (검색 키는 바뀌지 않음)
+
+        Args:
+            filename: 세션 파일명
+            used_at: 사용 시간 (ISO 형식)
+        """
+        entry = self._entries.get(filename)
+        if entry is not None:
+            entry["last_used"] = used_at
+
+    def search(self, query: str) -> Dict[str, Dict[str, Any]]:
+        """
+        검색어와 일치하는 세션 찾기
+
+        Args:
+            query: 검색어 (공백으로 나눈 단어는 모두 일치해야 함)
+
+        Returns:
+            파일명 -> 메타데이터 (검색어가 비어 있으면 빈 사전)
+        """
+        terms = query.split()
+        if not terms:
+            return {}
+
+        term_matches = []
+        for term in terms:
+            found = self._match_words(term)
+            if _PHONE_TERM_RE.fullmatch(term):
+                found = found | self._phones.match(phone_digits(term))
+            if not found:
+                return {}
+            term_matches.append(found)
+
+        return {filename: self._entries[filename] for filename in _intersect(term_matches)}
+
+    def _match_words(self, term: str) -> Set[str]:
+        """검색 단어 하나와 일치하는 세션 ("a-b"처럼 나뉘는 단어는 모두 일치해야 함)"""
+        token_matches = [self._tokens.match(token) for token in tokenize(term)]
+        if len(token_matches) == 1:
+            return token_matches[0]
+        return _intersect(token_matches)
+
+    @staticmethod
+    def _index_keys(entry: Dict[str, Any]) -> Tuple[Set[str], str]:
+        """세션 하나의 검색 키 (이름/메모 단어, 전화번호 숫자)"""
+        entry_tokens = set()
+        for field in TEXT_FIELDS:
+            entry_tokens.update(tokenize(entry.get(field)))
+        return entry_tokens, phone_digits(entry.get("phone"))
+
+    @staticmethod
+    def _metadata(entry: Dict[str, Any]) -> Dict[str, Any]:
+        """결과로 돌려줄 메타데이터 (세션 문자열 제외)"""
+        return {key: value for key, value in entry.items() if key != "session_string"}
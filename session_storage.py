@@ -0,0 +1,981 @@
+# type: ignore
+"""
+세션 저장소 백엔드
+세션 정보를 실제로 저장하는 방식을 교체할 수 있도록 분리한 저장소 계층
+
+- JsonFileStorage: 세션 하나당 JSON 파일 하나 (기존 방식, 메타데이터 인덱스 사용,
+  세션이 아주 많으면 하위 디렉토리로 나누는 sharded 배치 선택 가능)
+- SqliteStorage: SQLite 데이터베이스 하나 (WAL 모드, 인덱스된 컬럼으로 조회)
+
+Python 3.11.9
+PEP8 준수
+"""
+
+import contextlib
+import functools
+import heapq
+import itertools
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, Optional, Any, Tuple, Union
+
+try:
+    from . import json_codec
+    from . import log_config
+    from . import metrics
+    from .atomic_io import AtomicBatch, write_json_atomic
+    from .file_lock import SessionLocks
+    from .fs_watch import DEFAULT_POLL_INTERVAL, create_watcher
+    from .session_index import (
+        SessionIndex, SessionStatusStore, UsageJournal, iter_session_files,
+        META_DIR_NAME, META_FIELDS, USAGE_JOURNAL_COMPACT_BYTES
+    )
+except ImportError:
+    import json_codec
+    import log_config
+    import metrics
+    from atomic_io import AtomicBatch, write_json_atomic
+    from file_lock import SessionLocks
+    from fs_watch import DEFAULT_POLL_INTERVAL, create_watcher
+    from session_index import (
+        SessionIndex, SessionStatusStore, UsageJournal, iter_session_files,
+        META_DIR_NAME, META_FIELDS, USAGE_JOURNAL_COMPACT_BYTES
+    )
+
+logger = log_config.get_logger(__name__)
+
+SQLITE_FILENAME = "sessions.db"
+
+# 목록 정렬에 쓸 수 있는 필드
+SORT_FIELDS = ("created_at", "last_used", "name", "phone")
+# 목록 필터가 검색하는 필드
+FILTER_FIELDS = ("name", "phone", "notes")
+
+
+def parse_sort(sort: str) -> Tuple[str, bool]:
+    """
+    정렬 지정 문자열 해석
+
+    Args:
+        sort: 정렬 필드 ("-" 접두사는 내림차순, 예: "-created_at")
+
+    Returns:
+        (정렬 필드, 내림차순 여부)
+
+    Raises:
+        ValueError: 지원하지 않는 정렬 필드인 경우
+    """
+    descending = sort.startswith("-")
+    field = sort.lstrip("-")
+    if field not in SORT_FIELDS:
+        raise ValueError(f"정렬할 수 없는 필드: {field} (가능: {', '.join(SORT_FIELDS)})")
+    return field, descending
+
+
+def unique_filenames(filename: str) -> Iterator[str]:
+    """
+    같은 파일명이 이미 쓰이고 있을 때 시도할 파일명들
+
+    Args:
+        filename: 기본 파일명 (예: "My Session.json")
+
+    Yields:
+        "My Session.json", "My Session_2.json", "My Session_3.json", ...
+    """
+    stem, dot, suffix = filename.rpartition(".")
+    if not dot:
+        stem, suffix = filename, ""
+    else:
+        suffix = "." + suffix
+
+    yield filename
+    for number in itertools.count(2):
+        yield f"{stem}_{number}{suffix}"
+
+
+def _locked(method):
+    """저장소 잠금을 잡고 메서드 실행 (스레드 풀에서 호출해도 안전하도록)"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class SessionStorage(ABC):
+    """세션 저장소 인터페이스 (세션은 파일명 형태의 키로 구분)"""
+
+    @abstractmethod
+    def write(self, filename: str, session_data: Dict[str, Any]) -> None:
+        """
+        세션 정보 저장 (같은 키가 있으면 덮어쓰고 기존 상태는 지움)
+
+        Args:
+            filename: 세션 키 (예: "My Session.json")
+            session_data: session_string을 포함한 세션 정보
+        """
+
+    @abstractmethod
+    def read(self, filename: str) -> Dict[str, Any]:
+        """
+        세션 정보 읽기
+
+        Args:
+            filename: 세션 키
+
+        Returns:
+            session_string을 포함한 세션 정보
+
+        Raises:
+            KeyError: 세션이 없는 경우
+        """
+
+    @abstractmethod
+    def delete(self, filename: str) -> None:
+        """
+        세션 삭제
+
+        Args:
+            filename: 세션 키
+
+        Raises:
+            KeyError: 세션이 없는 경우
+        """
+
+    @abstractmethod
+    def list_entries(self) -> Dict[str, Dict[str, Any]]:
+        """
+        모든 세션의 메타데이터 반환 (session_string 제외)
+
+        상태가 기록된 세션은 "status" 필드에 상태 딕셔너리가 들어갑니다.
+
+        Returns:
+            세션 키 -> 메타데이터 딕셔너리
+        """
+
+    @abstractmethod
+    def update_status(self, updates: Dict[str, Dict[str, Any]]) -> None:
+        """
+        세션 상태(연결 검사 결과 등)를 한 번에 갱신
+
+        세션 정보 자체는 다시 쓰지 않고 기존 상태에 병합합니다.
+
+        Args:
+            updates: 세션 키 -> 갱신할 상태 필드
+        """
+
+    @abstractmethod
+    def find(self, key: str) -> Optional[str]:
+        """
+        세션 키, 이름 또는 전화번호로 세션 키 찾기
+
+        Args:
+            key: 세션 키(확장자 생략 가능), 세션 이름 또는 전화번호
+
+        Returns:
+            찾은 세션 키 (없으면 None)
+        """
+
+    def write_many(self, items: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        """
+        여러 세션을 한 번에 저장
+
+        기본 구현은 write()를 반복하므로, 가능한 백엔드는 한 번의
+        트랜잭션/인덱스 기록으로 처리하도록 재정의합니다.
+
+        Args:
+            items: (세션 키, 세션 정보) 쌍
+
+        Returns:
+            저장한 세션 수
+        """
+        count = 0
+        for filename, session_data in items:
+            self.write(filename, session_data)
+            count += 1
+        return count
+
+    def write_unique(self, filename: str, session_data: Dict[str, Any],
+                     prepare: Optional[Callable[[str, Dict[str, Any]], Dict[str, Any]]] = None
+                     ) -> str:
+        """
+        이름이 다른 세션을 덮어쓰지 않도록 빈 키를 골라서 저장
+
+        같은 키에 같은 이름의 세션이 있으면 덮어쓰고, 다른 이름의 세션이
+        있으면 (특수문자를 제거한 파일명이 겹친 경우) "키_2.json"처럼
+        번호를 붙인 키에 저장합니다.
+
+        기본 구현은 확인과 저장 사이에 다른 프로세스가 끼어들 수 있으므로,
+        가능한 백엔드는 잠금/트랜잭션으로 재정의합니다.
+
+        Args:
+            filename: 기본 세션 키
+            session_data: session_string을 포함한 세션 정보
+            prepare: 최종 키가 정해진 뒤 저장할 세션 정보를 만드는 함수 (암호화 등)
+
+        Returns:
+            실제로 저장한 세션 키
+        """
+        for candidate in unique_filenames(filename):
+            try:
+                existing = self.read(candidate)
+            except KeyError:
+                existing = None
+
+            if existing is None or existing.get("name") == session_data.get("name"):
+                self.write(candidate, prepare(candidate, session_data) if prepare else session_data)
+                return candidate
+
+    def iter_sessions(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        모든 세션을 session_string 포함해서 하나씩 반환
+
+        Yields:
+            (세션 키, 세션 정보) 쌍
+        """
+        for filename in self.list_entries():
+            try:
+                yield filename, self.read(filename)
+            except KeyError:
+                # 목록 조회 후 삭제된 세션
+                continue
+
+    def query_entries(self, filter: Optional[str] = None, sort: str = "-created_at",
+                      offset: int = 0, limit: Optional[int] = None
+                      ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        조건에 맞는 세션 메타데이터를 정렬해서 일부만 반환
+
+        기본 구현은 메타데이터 인덱스에서 필요한 만큼만 골라내고
+        (limit이 있으면 힙으로 상위 offset + limit개만 유지),
+        SQL을 쓸 수 있는 백엔드는 정렬/필터/페이지를 쿼리로 처리합니다.
+
+        Args:
+            filter: 이름/전화번호/메모에 포함된 문자열 (대소문자 무시)
+            sort: 정렬 필드 ("-" 접두사는 내림차순)
+            offset: 건너뛸 세션 수
+            limit: 반환할 최대 세션 수 (None이면 전부)
+
+        Yields:
+            (세션 키, 메타데이터) 쌍
+        """
+        field, descending = parse_sort(sort)
+        needle = filter.lower() if filter else None
+
+        items = (
+            item for item in self.list_entries().items()
+            if needle is None or any(
+                needle in (item[1].get(name) or "").lower() for name in FILTER_FIELDS
+            )
+        )
+
+        def key(item):
+            return item[1].get(field) or "", item[0]
+
+        if limit is not None:
+            pick = heapq.nlargest if descending else heapq.nsmallest
+            ordered = pick(offset + limit, items, key=key)
+        else:
+            ordered = sorted(items, key=key, reverse=descending)
+
+        yield from itertools.islice(ordered, offset, None)
+
+    def count_entries(self, filter: Optional[str] = None) -> int:
+        """
+        조건에 맞는 세션 수
+
+        Args:
+            filter: 이름/전화번호/메모에 포함된 문자열 (대소문자 무시)
+
+        Returns:
+            세션 수
+        """
+        if not filter:
+            return len(self.list_entries())
+        return sum(1 for _ in self.query_entries(filter=filter))
+
+    def touch(self, filename: str, used_at: str) -> None:
+        """
+        마지막 사용 시간 기록
+
+        기본 구현은 세션 전체를 다시 쓰므로, 가능한 백엔드는 더 가벼운
+        방식으로 재정의합니다.
+
+        Args:
+            filename: 세션 키
+            used_at: 사용 시간 (ISO 형식)
+        """
+        session_data = self.read(filename)
+        session_data["last_used"] = used_at
+        self.write(filename, session_data)
+
+    def generation(self) -> Any:
+        """
+        다른 프로세스의 변경을 반영할 때마다 바뀌는 값
+
+        값이 바뀌면 저장소 메타데이터로 만든 캐시(검색 인덱스 등)를 다시
+        만들어야 합니다. 자기 기록으로는 바뀌지 않으므로 그런 캐시는 저장/삭제를
+        직접 반영하면 됩니다. 기본 구현은 바깥 변경을 알 수 없으므로 항상 0입니다.
+
+        Returns:
+            비교용 값
+        """
+        return 0
+
+    def flush(self) -> None:
+        """미뤄둔 메타데이터 변경사항 반영"""
+
+    def location(self, filename: str) -> str:
+        """사용자에게 보여줄 저장 위치"""
+        return filename
+
+    def close(self) -> None:
+        """저장소 자원 정리"""
+        self.flush()
+
+
+class JsonFileStorage(SessionStorage):
+    """세션 하나당 JSON 파일 하나로 저장하는 백엔드"""
+
+    def __init__(self, sessions_dir: Union[str, Path], durable: bool = True,
+                 layout: Optional[str] = None,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL,
+                 compact: bool = False) -> None:
+        """
+        JSON 파일 저장소 초기화
+
+        세션 파일은 항상 임시 파일에 쓴 뒤 교체하므로 중간에 종료되어도
+        잘린 파일이 남지 않습니다.
+
+        메타데이터 목록은 메모리에 캐시하고, 세션 디렉토리가 바뀌면
+        (inotify, 또는 poll_interval 간격의 수정 시간 비교로 감지) 다시 읽습니다.
+
+        여러 프로세스가 같은 디렉토리에 쓸 수 있도록 세션 파일은 세션별 잠금,
+        인덱스/상태 파일은 짧은 메타데이터 잠금으로 보호합니다.
+        (잠금은 프로세스 단위이므로 한 프로세스에서는 저장소를 하나만 여세요)
+
+        Args:
+            sessions_dir: 세션 파일들을 저장할 디렉토리
+            durable: 저장할 때 fsync로 디스크 기록까지 보장할지 여부
+            layout: 파일 배치 방식 ("flat" 또는 "sharded", None이면 지금 방식 유지)
+            poll_interval: inotify를 쓸 수 없을 때 다른 프로세스의 변경을 확인하는 간격 (초)
+            compact: 세션 파일을 들여쓰기 없이 한 줄로 저장할지 여부
+                     (읽을 때는 두 형식을 모두 읽으므로 섞여 있어도 됨)
+        """
+        self.sessions_dir = Path(sessions_dir)
+        self.sessions_dir.mkdir(exist_ok=True)
+        self.durable = durable
+        self._indent = None if compact else 2
+        self._lock = threading.RLock()
+        # 다른 프로세스와의 충돌 방지 (세션 잠금을 먼저, 메타데이터 잠금은 나중에 잡음)
+        meta_dir = self.sessions_dir / META_DIR_NAME
+        meta_dir.mkdir(exist_ok=True)
+        self._locks = SessionLocks(meta_dir)
+        self._index = SessionIndex(self.sessions_dir, layout, self._locks.metadata)
+        self._usage = UsageJournal(self._index.meta_dir)
+        self._status = SessionStatusStore(self._index.meta_dir)
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._watcher = create_watcher(self._index.watch_dirs(),
+                                       [self._usage.path, self._index.log_path], poll_interval)
+
+    def _check_cache(self) -> None:
+        """다른 프로세스가 세션 디렉토리를 바꿨으면 캐시 버리기"""
+        changed = self._watcher.poll()
+        if not changed:
+            return
+
+        self._entries = None
+        # 메타 파일만 바뀌었으면 (사용 기록 저널 추가 등) 세션 디렉토리 비교는 생략
+        meta_paths = {self._index.meta_dir, self._usage.path, self._index.log_path}
+        self._index.revalidate(check_dirs=not changed <= meta_paths)
+
+    @_locked
+    def write(self, filename: str, session_data: Dict[str, Any]) -> None:
+        with self._locks.session(filename):
+            self._write_locked(filename, session_data)
+
+    @_locked
+    def write_unique(self, filename: str, session_data: Dict[str, Any],
+                     prepare: Optional[Callable[[str, Dict[str, Any]], Dict[str, Any]]] = None
+                     ) -> str:
+        for candidate in unique_filenames(filename):
+            # 확인과 저장을 같은 세션 잠금 안에서 처리
+            with self._locks.session(candidate):
+                try:
+                    with open(self._index.path(candidate), 'rb') as f:
+                        existing_name = json_codec.load(f).get("name")
+                except FileNotFoundError:
+                    existing_name = session_data.get("name")
+                except ValueError:
+                    # 읽을 수 없는 파일은 덮어쓰지 않음
+                    continue
+
+                if existing_name == session_data.get("name"):
+                    self._write_locked(
+                        candidate, prepare(candidate, session_data) if prepare else session_data
+                    )
+                    return candidate
+
+    def _write_locked(self, filename: str, session_data: Dict[str, Any]) -> None:
+        """세션 잠금을 잡은 상태에서 세션 파일과 인덱스 기록"""
+        # 쓰기 전 디렉토리 수정 시간 (인덱스가 자기 변경과 바깥의 변경을 구분하도록)
+        dir_mtime = self._index.dir_mtime_ns()
+        # JSON 직렬화, 임시 파일 쓰기, fsync, 이름 변경까지 포함
+        with metrics.timer("disk_write"):
+            write_json_atomic(self._index.path(filename), session_data,
+                              indent=self._indent, durable=self.durable)
+
+        with self._locks.metadata():
+            self._index.put(filename, session_data, dir_mtime)
+            self._status.remove(filename)
+        self._entries = None
+
+    @metrics.timed("disk_write_batch")
+    @_locked
+    def write_many(self, items: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        # 파일을 모두 임시 파일로 쓰고 디스크 동기화는 한 번만 (그룹 커밋),
+        # 인덱스도 한 번만 기록
+        written = {}
+        dir_mtime = self._index.dir_mtime_ns()
+        batch = AtomicBatch(self.durable)
+        try:
+            for filename, session_data in items:
+                batch.stage_json(self._index.path(filename), session_data, indent=self._indent)
+                written[filename] = {field: session_data.get(field) for field in META_FIELDS}
+
+            # 교체할 때만 세션 잠금 (다른 프로세스와 교착되지 않도록 정렬된 순서로)
+            with contextlib.ExitStack() as stack:
+                for filename in sorted(written):
+                    stack.enter_context(self._locks.session(filename))
+                batch.commit()
+
+                if written:
+                    with self._locks.metadata():
+                        self._index.put_many(written, dir_mtime)
+                        self._status.remove(*written)
+        except BaseException:
+            batch.abort()
+            raise
+
+        self._entries = None
+        return len(written)
+
+    @_locked
+    def read(self, filename: str) -> Dict[str, Any]:
+        filepath = self._index.path(filename)
+
+        try:
+            with metrics.timer("disk_read"):
+                with open(filepath, 'rb') as f:
+                    raw = f.read()
+        except FileNotFoundError:
+            raise KeyError(filename) from None
+        metrics.increment("disk_read_bytes", len(raw))
+
+        with metrics.timer("json_parse"):
+            session_data = json_codec.loads(raw)
+
+        UsageJournal.apply(session_data, self._usage.load().get(filename))
+        return session_data
+
+    @_locked
+    def delete(self, filename: str) -> None:
+        filepath = self._index.path(filename)
+
+        with self._locks.session(filename):
+            dir_mtime = self._index.dir_mtime_ns()
+            try:
+                filepath.unlink()
+            except FileNotFoundError:
+                raise KeyError(filename) from None
+
+            with self._locks.metadata():
+                self._index.remove(filename, dir_mtime)
+                self._status.remove(filename)
+        self._entries = None
+
+    @_locked
+    def list_entries(self) -> Dict[str, Dict[str, Any]]:
+        # 캐시된 목록을 돌려주므로 각 항목 딕셔너리는 수정하지 말 것
+        self._check_cache()
+        if self._entries is None:
+            self._entries = self._load_entries()
+        return dict(self._entries)
+
+    def _load_entries(self) -> Dict[str, Dict[str, Any]]:
+        """인덱스, 사용 기록 저널, 상태 파일을 합쳐서 메타데이터 목록 만들기"""
+        usage = self._usage.load()
+        statuses = self._status.load()
+        entries = {}
+
+        for filename, entry in self._index.load().items():
+            entry = {key: value for key, value in entry.items() if key != "mtime_ns"}
+            UsageJournal.apply(entry, usage.get(filename))
+            if filename in statuses:
+                entry["status"] = statuses[filename]
+            entries[filename] = entry
+
+        return entries
+
+    @_locked
+    def update_status(self, updates: Dict[str, Dict[str, Any]]) -> None:
+        with self._locks.metadata():
+            self._status.update(updates)
+        self._entries = None
+
+    @_locked
+    def find(self, key: str) -> Optional[str]:
+        self._check_cache()
+        return self._index.find(key)
+
+    @_locked
+    def generation(self) -> Any:
+        self._check_cache()
+        return self._index.generation
+
+    @_locked
+    def touch(self, filename: str, used_at: str) -> None:
+        # 세션 파일은 건드리지 않고 저널에 한 줄만 추가
+        # (반영 중인 다른 프로세스가 저널을 옮기는 사이에 추가한 줄이 사라지지 않도록 잠금)
+        with self._locks.metadata():
+            journal_size = self._usage.record(filename, used_at)
+        if self._entries is not None and filename in self._entries:
+            UsageJournal.apply(self._entries[filename], used_at)
+
+        if journal_size >= USAGE_JOURNAL_COMPACT_BYTES:
+            self.flush()
+
+    @metrics.timed("journal_flush")
+    @_locked
+    def flush(self) -> None:
+        """저널의 마지막 사용 시간을 세션 파일에 반영하고 저널 비우기"""
+        # 저널을 반영용 파일로 옮김 (이후 다른 프로세스의 기록은 새 저널에 쌓임)
+        with self._locks.metadata():
+            usage = self._usage.begin_compaction()
+
+        updated = {}
+        dir_mtime = self._index.dir_mtime_ns()
+        with contextlib.ExitStack() as stack:
+            # 세션 파일 읽기-수정-쓰기 동안 세션 잠금 (정렬된 순서로)
+            with AtomicBatch(self.durable) as batch:
+                for filename in sorted(usage):
+                    stack.enter_context(self._locks.session(filename))
+
+                    filepath = self._index.path(filename)
+                    try:
+                        with open(filepath, 'rb') as f:
+                            session_data = json_codec.load(f)
+                    except FileNotFoundError:
+                        # 이미 삭제된 세션의 기록
+                        continue
+
+                    if not UsageJournal.apply(session_data, usage[filename]):
+                        continue
+
+                    batch.stage_json(filepath, session_data, indent=self._indent)
+                    updated[filename] = session_data
+
+            with self._locks.metadata():
+                if updated:
+                    self._index.put_many(updated, dir_mtime)
+                self._usage.end_compaction()
+
+        self._entries = None
+
+    def location(self, filename: str) -> str:
+        return str(self._index.path(filename))
+
+    @_locked
+    def close(self) -> None:
+        self.flush()
+        self._watcher.close()
+        self._locks.close()
+
+
+class SqliteStorage(SessionStorage):
+    """SQLite 데이터베이스 하나에 모든 세션을 저장하는 백엔드"""
+
+    def __init__(self, sessions_dir: Union[str, Path],
+                 db_filename: str = SQLITE_FILENAME) -> None:
+        """
+        SQLite 저장소 초기화
+
+        처음 열 때 세션 디렉토리에 기존 JSON 세션 파일이 있으면
+        한 번만 데이터베이스로 가져옵니다.
+
+        Args:
+            sessions_dir: 데이터베이스 파일을 둘 디렉토리
+            db_filename: 데이터베이스 파일명
+        """
+        self.sessions_dir = Path(sessions_dir)
+        self.sessions_dir.mkdir(exist_ok=True)
+        self.db_path = self.sessions_dir / db_filename
+
+        # 비동기 메서드가 스레드 풀에서 호출하므로 잠금으로 연결 공유
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._create_schema()
+        self.migrate_from_json()
+
+    def _create_schema(self) -> None:
+        """테이블과 인덱스 생성"""
+        with self._conn:
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS sessions (
+                    filename TEXT PRIMARY KEY,
+                    name TEXT,
+                    phone TEXT,
+                    notes TEXT,
+                    created_at TEXT,
+                    last_used TEXT,
+                    session_string TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_sessions_name ON sessions(name);
+                CREATE INDEX IF NOT EXISTS idx_sessions_phone ON sessions(phone);
+                CREATE INDEX IF NOT EXISTS idx_sessions_created_at ON sessions(created_at);
+                CREATE INDEX IF NOT EXISTS idx_sessions_last_used ON sessions(last_used);
+                CREATE TABLE IF NOT EXISTS session_status (
+                    filename TEXT PRIMARY KEY
+                        REFERENCES sessions(filename) ON DELETE CASCADE,
+                    status TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS storage_meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+            """)
+
+    @_locked
+    def migrate_from_json(self) -> int:
+        """
+        기존 JSON 세션 파일을 데이터베이스로 가져오기 (최초 1회, flat/sharded 배치 모두)
+
+        JSON 파일은 삭제하지 않고 그대로 둡니다.
+
+        Returns:
+            가져온 세션 수
+        """
+        row = self._conn.execute(
+            "SELECT value FROM storage_meta WHERE key = 'json_migrated'"
+        ).fetchone()
+        if row:
+            return 0
+
+        rows = []
+        for filepath in iter_session_files(self.sessions_dir):
+            try:
+                with open(filepath, 'rb') as f:
+                    session_data = json_codec.load(f)
+
+                rows.append(self._to_row(filepath.name, session_data))
+
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning("⚠️ 파일 읽기 실패 (%s): %s", filepath.name, e)
+                continue
+
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO sessions "
+                "(filename, name, phone, notes, created_at, last_used, session_string) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self._conn.execute(
+                "INSERT OR IGNORE INTO storage_meta (key, value) VALUES ('json_migrated', '1')"
+            )
+
+        if rows:
+            logger.info("📦 JSON 세션 %d개를 데이터베이스로 옮겼습니다.", len(rows))
+
+        return len(rows)
+
+    @metrics.timed("disk_write")
+    @_locked
+    def write(self, filename: str, session_data: Dict[str, Any]) -> None:
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sessions "
+                "(filename, name, phone, notes, created_at, last_used, session_string) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                self._to_row(filename, session_data)
+            )
+
+    @metrics.timed("disk_write")
+    @_locked
+    def write_unique(self, filename: str, session_data: Dict[str, Any],
+                     prepare: Optional[Callable[[str, Dict[str, Any]], Dict[str, Any]]] = None
+                     ) -> str:
+        # 쓰기 잠금을 먼저 잡아서 확인과 저장 사이에 다른 프로세스가 끼어들지 못하게 함
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            for candidate in unique_filenames(filename):
+                row = self._conn.execute(
+                    "SELECT name FROM sessions WHERE filename = ?", (candidate,)
+                ).fetchone()
+                if row is not None and row[0] != session_data.get("name"):
+                    continue
+
+                data = prepare(candidate, session_data) if prepare else session_data
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO sessions "
+                    "(filename, name, phone, notes, created_at, last_used, session_string) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    self._to_row(candidate, data)
+                )
+                self._conn.commit()
+                return candidate
+        except BaseException:
+            self._conn.rollback()
+            raise
+
+    @metrics.timed("disk_write_batch")
+    @_locked
+    def write_many(self, items: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        # 하나의 트랜잭션으로 일괄 저장
+        rows = (self._to_row(filename, session_data) for filename, session_data in items)
+        with self._conn:
+            cursor = self._conn.executemany(
+                "INSERT OR REPLACE INTO sessions "
+                "(filename, name, phone, notes, created_at, last_used, session_string) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+        return max(cursor.rowcount, 0)
+
+    def iter_sessions(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT filename, name, session_string, phone, notes, created_at, last_used "
+                "FROM sessions ORDER BY created_at"
+            )
+
+        while True:
+            # 잠금은 묶음 단위로만 잡음
+            with self._lock:
+                rows = cursor.fetchmany(500)
+            if not rows:
+                break
+
+            for row in rows:
+                session_data = dict(row)
+                yield session_data.pop("filename"), session_data
+
+    @metrics.timed("disk_read")
+    @_locked
+    def read(self, filename: str) -> Dict[str, Any]:
+        row = self._conn.execute(
+            "SELECT name, session_string, phone, notes, created_at, last_used "
+            "FROM sessions WHERE filename = ?",
+            (filename,)
+        ).fetchone()
+
+        if row is None:
+            raise KeyError(filename)
+
+        return dict(row)
+
+    @_locked
+    def delete(self, filename: str) -> None:
+        with self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM sessions WHERE filename = ?", (filename,)
+            )
+
+        if cursor.rowcount == 0:
+            raise KeyError(filename)
+
+    @_locked
+    def list_entries(self) -> Dict[str, Dict[str, Any]]:
+        rows = self._conn.execute(
+            "SELECT s.filename, s.name, s.phone, s.notes, s.created_at, s.last_used, "
+            "st.status FROM sessions s "
+            "LEFT JOIN session_status st ON st.filename = s.filename "
+            "ORDER BY s.created_at DESC"
+        )
+
+        entries = {}
+        for row in rows:
+            entry = {field: row[field] for field in META_FIELDS}
+            if row["status"]:
+                entry["status"] = json_codec.loads(row["status"])
+            entries[row["filename"]] = entry
+
+        return entries
+
+    @_locked
+    def update_status(self, updates: Dict[str, Dict[str, Any]]) -> None:
+        with self._conn:
+            for filename, fields in updates.items():
+                row = self._conn.execute(
+                    "SELECT status FROM session_status WHERE filename = ?", (filename,)
+                ).fetchone()
+                status = json_codec.loads(row["status"]) if row else {}
+                status.update(fields)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO session_status (filename, status) "
+                    "SELECT filename, ? FROM sessions WHERE filename = ?",
+                    (json_codec.dumps(status).decode('utf-8'), filename)
+                )
+
+    @_locked
+    def find(self, key: str) -> Optional[str]:
+        queries = (
+            ("SELECT filename FROM sessions WHERE filename = ?", key),
+            ("SELECT filename FROM sessions WHERE name = ? "
+             "ORDER BY created_at DESC LIMIT 1", key),
+            ("SELECT filename FROM sessions WHERE filename = ?", f"{key}.json"),
+            ("SELECT filename FROM sessions WHERE phone = ? "
+             "ORDER BY created_at DESC LIMIT 1", key),
+        )
+
+        for query, param in queries:
+            row = self._conn.execute(query, (param,)).fetchone()
+            if row:
+                return row["filename"]
+
+        return None
+
+    @_locked
+    def generation(self) -> Any:
+        # 다른 연결이 커밋했을 때만 바뀜 (이 연결의 커밋으로는 바뀌지 않음)
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    @_locked
+    def touch(self, filename: str, used_at: str) -> None:
+        # 인덱스된 컬럼 하나만 갱신
+        with self._conn:
+            self._conn.execute(
+                "UPDATE sessions SET last_used = ? WHERE filename = ?",
+                (used_at, filename)
+            )
+
+    def query_entries(self, filter: Optional[str] = None, sort: str = "-created_at",
+                      offset: int = 0, limit: Optional[int] = None
+                      ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        field, descending = parse_sort(sort)
+        where, params = self._filter_clause(filter)
+
+        # 정렬 필드는 SORT_FIELDS에서 검증된 값만 쿼리에 넣음
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT s.filename, s.name, s.phone, s.notes, s.created_at, s.last_used, "
+                "st.status FROM sessions s "
+                "LEFT JOIN session_status st ON st.filename = s.filename "
+                f"{where} ORDER BY s.{field} {'DESC' if descending else 'ASC'}, "
+                f"s.filename {'DESC' if descending else 'ASC'} LIMIT ? OFFSET ?",
+                (*params, -1 if limit is None else limit, offset)
+            )
+
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(500)
+            if not rows:
+                break
+
+            for row in rows:
+                entry = {name: row[name] for name in META_FIELDS}
+                if row["status"]:
+                    entry["status"] = json_codec.loads(row["status"])
+                yield row["filename"], entry
+
+    @_locked
+    def count_entries(self, filter: Optional[str] = None) -> int:
+        where, params = self._filter_clause(filter)
+        row = self._conn.execute(
+            f"SELECT COUNT(*) AS count FROM sessions s {where}", params
+        ).fetchone()
+        return row["count"]
+
+    @staticmethod
+    def _filter_clause(filter: Optional[str]) -> Tuple[str, tuple]:
+        """목록 필터를 WHERE 절로 변환"""
+        if not filter:
+            return "", ()
+
+        escaped = filter.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        pattern = f"%{escaped}%"
+        where = "WHERE " + " OR ".join(
+            f"s.{name} LIKE ? ESCAPE '\\'" for name in FILTER_FIELDS
+        )
+        return where, (pattern,) * len(FILTER_FIELDS)
+
+    def location(self, filename: str) -> str:
+        return f"{self.db_path} ({filename})"
+
+    @_locked
+    def close(self) -> None:
+        self._conn.close()
+
+    @staticmethod
+    def _to_row(filename: str, session_data: Dict[str, Any]) -> tuple:
+        """세션 정보를 sessions 테이블 행으로 변환"""
+        return (
+            filename,
+            session_data.get("name"),
+            session_data.get("phone"),
+            session_data.get("notes"),
+            session_data.get("created_at"),
+            session_data.get("last_used"),
+            session_data["session_string"]
+        )
+
+
+# 백엔드 이름 -> 저장소 클래스
+STORAGE_BACKENDS = {
+    "json": JsonFileStorage,
+    "sqlite": SqliteStorage,
+}
+
+
+def create_storage(backend: Union[str, SessionStorage],
+                   sessions_dir: Union[str, Path],
+                   passphrase: Optional[str] = None,
+                   layout: Optional[str] = None,
+                   compact: bool = False) -> SessionStorage:
+    """
+    백엔드 이름 또는 저장소 인스턴스로 저장소 생성
+
+    Args:
+        backend: "json", "sqlite" 또는 SessionStorage 인스턴스
+        sessions_dir: 세션 디렉토리
+        passphrase: 세션 문자열 암호화 암호 (None이면 평문 저장)
+        layout: JSON 백엔드의 파일 배치 방식 ("flat" 또는 "sharded")
+        compact: JSON 백엔드의 세션 파일을 들여쓰기 없이 저장할지 여부
+
+    Returns:
+        저장소 인스턴스
+
+    Raises:
+        ValueError: 알 수 없는 백엔드 이름이거나 암호가 틀린 경우
+    """
+    if isinstance(backend, SessionStorage):
+        storage = backend
+    else:
+        try:
+            storage_class = STORAGE_BACKENDS[backend]
+        except KeyError:
+            raise ValueError(f"알 수 없는 저장소 백엔드: {backend}") from None
+
+        if storage_class is JsonFileStorage:
+            storage = storage_class(sessions_dir, layout=layout, compact=compact)
+        elif layout is not None:
+            raise ValueError(f"파일 배치 방식은 json 백엔드에서만 지정할 수 있습니다: {backend}")
+        else:
+            # SQLite는 세션을 행으로 저장하므로 compact는 의미 없음
+            storage = storage_class(sessions_dir)
+
+    if passphrase is not None:
+        # 암호화 모듈은 암호를 쓸 때만 불러옴 (session_vault가 이 모듈을 import함)
+        try:
+            from .session_vault import EncryptedStorage
+        except ImportError:
+            from session_vault import EncryptedStorage
+        storage = EncryptedStorage(storage, passphrase)
+
+    return storage
@@ -0,0 +1,303 @@
+# type: ignore
+"""
+암호화 세션 저장소
+세션 문자열을 암호(passphrase)에서 만든 키로 AES-GCM 암호화해서 저장하는 기능
+(키 유도(scrypt)는 프로세스당 한 번만 수행하고 결과를 캐시)
+
+메타데이터(이름, 전화번호, 메모, 날짜)는 목록/검색을 위해 암호화하지 않고,
+세션 문자열만 암호화합니다.
+
+Python 3.11.9
+PEP8 준수
+"""
+
+import base64
+import functools
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+try:
+    from .atomic_io import create_json_atomic, write_json_atomic
+    from .session_index import META_DIR_NAME
+    from .session_storage import SessionStorage
+except ImportError:
+    from atomic_io import create_json_atomic, write_json_atomic
+    from session_index import META_DIR_NAME
+    from session_storage import SessionStorage
+
+VAULT_FILENAME = "vault.json"
+VAULT_VERSION = 1
+
+# 암호화된 세션 문자열 앞에 붙는 표시
+ENCRYPTED_PREFIX = "enc:v1:"
+
+# scrypt 기본 설정 (약 32MB 메모리, 일반 PC에서 0.1초 안팎)
+SCRYPT_N = 2 ** 15
+SCRYPT_R = 8
+SCRYPT_P = 1
+KEY_LENGTH = 32
+NONCE_LENGTH = 12
+
+# 암호 확인용 평문과 연관 데이터
+_CHECK_PLAINTEXT = "tgcc-vault"
+_CHECK_AAD = "vault-check"
+
+
+@functools.lru_cache(maxsize=8)
+def derive_key(passphrase: str, salt: bytes, n: int = SCRYPT_N,
+               r: int = SCRYPT_R, p: int = SCRYPT_P) -> bytes:
+    """
+    암호에서 AES 키 유도 (같은 인자는 프로세스 안에서 한 번만 계산)
+
+    Args:
+        passphrase: 암호
+        salt: 저장소별 무작위 salt
+        n: scrypt CPU/메모리 비용
+        r: scrypt 블록 크기
+        p: scrypt 병렬화 수
+
+    Returns:
+        32바이트 키
+    """
+    return hashlib.scrypt(
+        passphrase.encode('utf-8'), salt=salt, n=n, r=r, p=p,
+        maxmem=256 * n * r * p, dklen=KEY_LENGTH
+    )
+
+
+def is_encrypted(value: Optional[str]) -> bool:
+    """
+    암호화된 세션 문자열인지 확인
+
+    Args:
+        value: 세션 문자열
+
+    Returns:
+        암호화 여부
+    """
+    return isinstance(value, str) and value.startswith(ENCRYPTED_PREFIX)
+
+
+class SessionVault:
+    """저장소별 키 설정(.meta/vault.json)과 AES-GCM 암호화/복호화"""
+
+    def __init__(self, meta_dir: Path, passphrase: str) -> None:
+        """
+        금고 초기화 (설정 파일이 없으면 새 salt로 생성)
+
+        Args:
+            meta_dir: 메타데이터 디렉토리
+            passphrase: 암호
+
+        Raises:
+            ValueError: cryptography가 없거나 암호가 틀린 경우
+        """
+        # cryptography는 암호화 저장소를 열 때만 불러옴
+        try:
+            from cryptography.exceptions import InvalidTag
+            from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+        except ImportError:
+            raise ValueError("세션 암호화를 사용하려면 cryptography 패키지가 필요합니다: pip install cryptography") from None
+        if not passphrase:
+            raise ValueError("세션 저장소 암호가 비어 있습니다.")
+
+        def cipher(config: Dict[str, Any]) -> Any:
+            salt = base64.b64decode(config["salt"])
+            return AESGCM(derive_key(passphrase, salt, config["n"], config["r"], config["p"]))
+
+        self.path = Path(meta_dir) / VAULT_FILENAME
+        config = self._load_config()
+
+        if config is None:
+            config = {
+                "version": VAULT_VERSION,
+                "kdf": "scrypt",
+                "n": SCRYPT_N,
+                "r": SCRYPT_R,
+                "p": SCRYPT_P,
+                "salt": base64.b64encode(os.urandom(16)).decode('ascii')
+            }
+            self._aead = cipher(config)
+            config["check"] = self.encrypt(_CHECK_PLAINTEXT, _CHECK_AAD)
+
+            # 다른 프로세스가 먼저 만들었으면 그 salt를 사용 (salt가 둘이면 서로 복호화 불가)
+            self.path.parent.mkdir(exist_ok=True)
+            if not create_json_atomic(self.path, config, indent=2):
+                config = self._load_config()
+
+        self._aead = cipher(config)
+
+        if "check" not in config:
+            config["check"] = self.encrypt(_CHECK_PLAINTEXT, _CHECK_AAD)
+            self._write_config(config)
+        else:
+            try:
+                self.decrypt(config["check"], _CHECK_AAD)
+            except InvalidTag:
+                raise ValueError("세션 저장소 암호가 올바르지 않습니다.") from None
+
+    def encrypt(self, plaintext: str, aad: str) -> str:
+        """
+        문자열 암호화
+
+        Args:
+            plaintext: 평문
+            aad: 함께 인증할 데이터 (세션 키, 다른 세션으로 옮겨 붙이는 것을 방지)
+
+        Returns:
+            표시가 붙은 base64 암호문
+        """
+        nonce = os.urandom(NONCE_LENGTH)
+        ciphertext = self._aead.encrypt(nonce, plaintext.encode('utf-8'), aad.encode('utf-8'))
+        return ENCRYPTED_PREFIX + base64.b64encode(nonce + ciphertext).decode('ascii')
+
+    def decrypt(self, token: str, aad: str) -> str:
+        """
+        문자열 복호화
+
+        Args:
+            token: encrypt()가 만든 암호문
+            aad: 암호화할 때 쓴 연관 데이터
+
+        Returns:
+            평문
+
+        Raises:
+            cryptography.exceptions.InvalidTag: 키나 연관 데이터가 다르거나 변조된 경우
+        """
+        raw = base64.b64decode(token[len(ENCRYPTED_PREFIX):])
+        plaintext = self._aead.decrypt(raw[:NONCE_LENGTH], raw[NONCE_LENGTH:], aad.encode('utf-8'))
+        return plaintext.decode('utf-8')
+
+    def _load_config(self) -> Optional[Dict[str, Any]]:
+        """금고 설정 읽기 (없으면 None)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+        except FileNotFoundError:
+            return None
+
+        if config.get("version") != VAULT_VERSION or config.get("kdf") != "scrypt":
+            raise ValueError(f"지원하지 않는 금고 설정: {self.path}")
+        return config
+
+    def _write_config(self, config: Dict[str, Any]) -> None:
+        """금고 설정 기록 (salt를 잃으면 세션을 복호화할 수 없으므로 fsync까지)"""
+        self.path.parent.mkdir(exist_ok=True)
+        write_json_atomic(self.path, config, indent=2)
+
+
+class EncryptedStorage(SessionStorage):
+    """
+    다른 저장소를 감싸서 세션 문자열만 암호화하는 저장소
+
+    암호화 전에 저장된 평문 세션도 그대로 읽을 수 있으며,
+    encrypt_existing()으로 한 번에 암호화할 수 있습니다.
+    """
+
+    def __init__(self, inner: SessionStorage, passphrase: str) -> None:
+        """
+        암호화 저장소 초기화
+
+        Args:
+            inner: 실제로 저장할 저장소 (JsonFileStorage, SqliteStorage 등)
+            passphrase: 암호
+        """
+        self.inner = inner
+        self.sessions_dir = inner.sessions_dir
+        self._vault = SessionVault(Path(inner.sessions_dir) / META_DIR_NAME, passphrase)
+
+    def write(self, filename: str, session_data: Dict[str, Any]) -> None:
+        self.inner.write(filename, self._seal(filename, session_data))
+
+    def write_many(self, items: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        return self.inner.write_many(
+            (filename, self._seal(filename, session_data)) for filename, session_data in items
+        )
+
+    def write_unique(self, filename: str, session_data: Dict[str, Any],
+                     prepare: Optional[Callable[[str, Dict[str, Any]], Dict[str, Any]]] = None
+                     ) -> str:
+        # 최종 키가 정해진 뒤 그 키를 연관 데이터로 암호화
+        def seal(candidate: str, data: Dict[str, Any]) -> Dict[str, Any]:
+            return self._seal(candidate, prepare(candidate, data) if prepare else data)
+
+        return self.inner.write_unique(filename, session_data, seal)
+
+    def read(self, filename: str) -> Dict[str, Any]:
+        return self._open(filename, self.inner.read(filename))
+
+    def iter_sessions(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        for filename, session_data in self.inner.iter_sessions():
+            yield filename, self._open(filename, session_data)
+
+    def delete(self, filename: str) -> None:
+        self.inner.delete(filename)
+
+    def list_entries(self) -> Dict[str, Dict[str, Any]]:
+        return self.inner.list_entries()
+
+    def update_status(self, updates: Dict[str, Dict[str, Any]]) -> None:
+        self.inner.update_status(updates)
+
+    def find(self, key: str) -> Optional[str]:
+        return self.inner.find(key)
+
+    def generation(self) -> Any:
+        return self.inner.generation()
+
+    def query_entries(self, filter: Optional[str] = None, sort: str = "-created_at",
+                      offset: int = 0, limit: Optional[int] = None
+                      ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        return self.inner.query_entries(filter, sort, offset, limit)
+
+    def count_entries(self, filter: Optional[str] = None) -> int:
+        return self.inner.count_entries(filter)
+
+    def touch(self, filename: str, used_at: str) -> None:
+        self.inner.touch(filename, used_at)
+
+    def flush(self) -> None:
+        self.inner.flush()
+
+    def location(self, filename: str) -> str:
+        return f"{self.inner.location(filename)} (암호화)"
+
+    def close(self) -> None:
+        self.inner.close()
+
+    def encrypt_existing(self) -> int:
+        """
+        아직 평문으로 저장된 세션을 모두 암호화
+
+        다시 쓰는 세션의 연결 검사 상태는 지워집니다.
+
+        Returns:
+            암호화한 세션 수
+        """
+        plaintext = [
+            (filename, session_data)
+            for filename, session_data in self.inner.iter_sessions()
+            if not is_encrypted(session_data.get("session_string"))
+        ]
+        return self.write_many(plaintext)
+
+    def _seal(self, filename: str, session_data: Dict[str, Any]) -> Dict[str, Any]:
+        """저장할 세션 정보의 세션 문자열 암호화"""
+        session_string = session_data.get("session_string")
+        if not session_string or is_encrypted(session_string):
+            return session_data
+
+        sealed = dict(session_data)
+        sealed["session_string"] = self._vault.encrypt(session_string, filename)
+        return sealed
+
+    def _open(self, filename: str, session_data: Dict[str, Any]) -> Dict[str, Any]:
+        """읽은 세션 정보의 세션 문자열 복호화 (평문이면 그대로)"""
+        session_string = session_data.get("session_string")
+        if is_encrypted(session_string):
+            session_data["session_string"] = self._vault.decrypt(session_string, filename)
+        return session_data
@@ -0,0 +1,65 @@
+# type: ignore
+"""
+텔레그램 라이브러리 지연 로더
+목록 조회/삭제처럼 네트워크를 쓰지 않는 작업은 telethon을 불러오지 않도록
+클라이언트를 실제로 만들 때만 telethon을 import하는 기능
+
+Python 3.11.9
+PEP8 준수
+"""
+
+from types import ModuleType
+from typing import Any, Optional
+
+try:
+    from . import log_config
+    from . import metrics
+except ImportError:
+    import log_config
+    import metrics
+
+logger = log_config.get_logger(__name__)
+
+
+def _import_telethon() -> ModuleType:
+    """telethon import (없으면 설치 방법 안내 후 ImportError)"""
+    try:
+        import telethon
+        import telethon.sessions
+        import telethon.errors
+    except ImportError as e:
+        logger.error("❌ 텔레그램 라이브러리가 없습니다: %s (설치 명령어: pip install telethon)", e)
+        raise
+
+    return telethon
+
+
+def create_client(session_string: Optional[str], api_id: int, api_hash: str) -> Any:
+    """
+    StringSession 기반 TelegramClient 생성
+
+    Args:
+        session_string: 세션 문자열 (새 세션이면 None)
+        api_id: 텔레그램 API ID
+        api_hash: 텔레그램 API Hash
+
+    Returns:
+        연결되지 않은 TelegramClient (성능 측정이 켜져 있으면 connect/is_user_authorized/
+        get_me/disconnect 시간을 기록하는 래퍼)
+    """
+    telethon = _import_telethon()
+    return metrics.instrument_client(telethon.TelegramClient(
+        telethon.sessions.StringSession(session_string),
+        api_id,
+        api_hash
+    ))
+
+
+def telethon_errors() -> ModuleType:
+    """
+    telethon.errors 모듈 반환 (except 절에서 오류 클래스를 쓸 때 사용)
+
+    Returns:
+        telethon.errors 모듈
+    """
+    return _import_telethon().errors
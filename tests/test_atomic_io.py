@@ -0,0 +1,93 @@
+# type: ignore
+"""
+원자적 파일 쓰기 회귀 테스트
+
+Python 3.11.9
+PEP8 준수
+"""
+
+import json
+import sys
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_DIR))
+
+import atomic_io  # noqa: E402
+from atomic_io import AtomicBatch, create_json_atomic  # noqa: E402
+from session_archive import write_archive  # noqa: E402
+from session_manager import SessionManager  # noqa: E402
+from session_storage import JsonFileStorage  # noqa: E402
+
+
+def test_batch_restaging_same_path_keeps_last(tmp_path):
+    path = tmp_path / "x.json"
+    with AtomicBatch() as batch:
+        batch.stage_json(path, {"n": 1})
+        batch.stage_json(path, {"n": 2})
+        assert len(batch) == 1
+
+    assert json.loads(path.read_text(encoding="utf-8")) == {"n": 2}
+    assert [p.name for p in tmp_path.iterdir()] == ["x.json"]
+
+
+def test_write_many_duplicate_filenames(tmp_path):
+    storage = JsonFileStorage(tmp_path / "sessions")
+    try:
+        count = storage.write_many([
+            ("x.json", {"name": "x", "session_string": "first"}),
+            ("x.json", {"name": "x", "session_string": "second"}),
+        ])
+        assert count == 1
+        assert storage.read("x.json")["session_string"] == "second"
+    finally:
+        storage.close()
+
+
+def test_import_bulk_overwrite_with_colliding_records(tmp_path):
+    archive = tmp_path / "sessions.ndjson"
+    write_archive(archive, [
+        {"name": "x!", "session_string": "a"},
+        {"name": "x?", "session_string": "b"},
+        {"name": "x!", "session_string": "c"},
+    ], None)
+
+    manager = SessionManager(str(tmp_path / "sessions"))
+    try:
+        assert manager.import_bulk(archive, overwrite=True) == 2
+        sessions = {record.name: record.filename for record in manager.list_sessions()}
+        assert sessions == {"x!": "x.json", "x?": "x_2.json"}
+        assert manager.load_session("x!") == "c"
+    finally:
+        manager.close()
+
+
+def test_create_json_atomic_only_once(tmp_path):
+    path = tmp_path / "config.json"
+    assert create_json_atomic(path, {"n": 1})
+    assert not create_json_atomic(path, {"n": 2})
+
+    assert json.loads(path.read_text(encoding="utf-8")) == {"n": 1}
+    assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
+
+
+def test_batch_syncs_once_for_many_files(tmp_path, monkeypatch):
+    calls = {"all": 0, "file": 0, "dir": 0}
+
+    def count(kind):
+        def sync(*args):
+            calls[kind] += 1
+        return sync
+
+    monkeypatch.setattr(atomic_io, "_sync_all", count("all"))
+    monkeypatch.setattr(atomic_io, "_sync_file", count("file"))
+    monkeypatch.setattr(atomic_io, "_sync_dir", count("dir"))
+
+    storage = JsonFileStorage(tmp_path, layout="flat")
+    try:
+        storage.write_many((f"s{i}.json", {"name": f"s{i}"}) for i in range(200))
+    finally:
+        storage.close()
+
+    assert calls == {"all": 1, "file": 0, "dir": 1}
+    assert len(list(tmp_path.glob("*.json"))) == 200
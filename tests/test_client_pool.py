@@ -0,0 +1,91 @@
+# type: ignore
+"""
+클라이언트 연결 풀 테스트 (가짜 클라이언트 사용)
+
+Python 3.11.9
+PEP8 준수
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_DIR))
+
+from client_pool import ClientPool  # noqa: E402
+
+
+class FakeClient:
+    """세션 문자열이 "ok"로 시작하면 인증된 것으로 보는 가짜 클라이언트"""
+
+    def __init__(self, session_string):
+        self.session_string = session_string
+        self.connected = False
+        self.authorized = session_string.startswith("ok")
+
+    async def connect(self):
+        self.connected = True
+
+    async def disconnect(self):
+        self.connected = False
+
+    def is_connected(self):
+        return self.connected
+
+    async def is_user_authorized(self):
+        return self.authorized
+
+
+def _pool(created, **kwargs):
+    def factory(session_string):
+        created.append(FakeClient(session_string))
+        return created[-1]
+    return ClientPool(client_factory=factory, **kwargs)
+
+
+def test_reuses_authorized_clients():
+    async def run():
+        created = []
+        pool = _pool(created)
+        async with pool.client("ok-1"):
+            pass
+        async with pool.client("ok-1") as client:
+            assert client.connected
+        assert len(created) == 1 and len(pool) == 1
+
+        await pool.close()
+        assert not created[0].connected
+
+    asyncio.run(run())
+
+
+def test_unauthorized_clients_are_not_pooled():
+    async def run():
+        created = []
+        pool = _pool(created)
+        async with pool.client("expired") as client:
+            assert not await client.is_user_authorized()
+        assert len(pool) == 0
+        assert not created[0].connected
+
+    asyncio.run(run())
+
+
+def test_unhealthy_client_in_use_is_not_disconnected_under_borrower():
+    async def run():
+        created = []
+        pool = _pool(created, probe_interval=0)
+        async with pool.client("ok-1") as first:
+            first.authorized = False
+            # 다시 빌리면 상태 확인에 실패해서 새 클라이언트를 받음
+            async with pool.client("ok-1") as second:
+                assert second is not first
+                assert first.connected
+            assert first.connected
+        # 마지막으로 빌린 쪽이 돌려주면 연결 해제
+        assert not first.connected
+        assert created[1].connected and len(pool) == 1
+        await pool.close()
+
+    asyncio.run(run())
@@ -0,0 +1,61 @@
+# type: ignore
+"""
+세션 아카이브 가져오기/내보내기 테스트
+
+Python 3.11.9
+PEP8 준수
+"""
+
+import sys
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_DIR))
+
+from session_archive import write_archive  # noqa: E402
+from session_manager import SessionManager  # noqa: E402
+
+
+def test_export_import_round_trip(tmp_path):
+    source = SessionManager(str(tmp_path / "a"))
+    try:
+        source.save_session("s1", "alice", phone="+8210")
+        source.save_session("s2", "alice!")
+        assert source.export_bulk(tmp_path / "backup.ndjson.gz") == 2
+    finally:
+        source.close()
+
+    target = SessionManager(str(tmp_path / "b"))
+    try:
+        assert target.import_bulk(tmp_path / "backup.ndjson.gz") == 2
+        assert {r.filename for r in target.list_sessions()} == {"alice.json", "alice_2.json"}
+        assert target.load_session("+8210") == "s1"
+        # 이미 있는 세션은 덮어쓰지 않으면 건너뜀
+        assert target.import_bulk(tmp_path / "backup.ndjson.gz") == 0
+    finally:
+        target.close()
+
+
+def test_import_ignores_unsafe_archive_filenames(tmp_path):
+    archive = tmp_path / "evil.ndjson"
+    write_archive(archive, [
+        {"filename": "../pwned.json", "name": "pwned", "session_string": "a"},
+        {"filename": "noext", "name": "noext", "session_string": "b"},
+        {"filename": ".meta/index.json", "name": "meta", "session_string": "c"},
+        {"filename": "C:evil.json", "name": "drive", "session_string": "d"},
+    ], None)
+
+    sessions_dir = tmp_path / "sessions"
+    manager = SessionManager(str(sessions_dir))
+    try:
+        assert manager.import_bulk(archive) == 4
+        assert {r.filename for r in manager.list_sessions()} == {
+            "pwned.json", "noext.json", "meta.json", "drive.json"
+        }
+    finally:
+        manager.close()
+
+    assert not (tmp_path / "pwned.json").exists()
+    assert sorted(p.name for p in sessions_dir.glob("*.json")) == [
+        "drive.json", "meta.json", "noext.json", "pwned.json"
+    ]
@@ -0,0 +1,89 @@
+# type: ignore
+"""
+세션 메타데이터 인덱스 테스트 (스냅샷 + 로그 재생, 스냅샷 다시 쓰기)
+
+Python 3.11.9
+PEP8 준수
+"""
+
+import json
+import shutil
+import sys
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_DIR))
+
+import session_index  # noqa: E402
+from session_index import SessionIndex  # noqa: E402
+
+
+def _write_session(sessions_dir, filename, name):
+    """세션 파일 하나 쓰기"""
+    session_data = {"name": name, "session_string": "s", "phone": None, "notes": None,
+                    "created_at": "2026-01-01T00:00:00", "last_used": None}
+    (sessions_dir / filename).write_text(json.dumps(session_data), encoding="utf-8")
+    return session_data
+
+
+def _save(index, filename, name):
+    """SessionManager처럼 파일을 쓰고 인덱스에 기록"""
+    dir_mtime = index.dir_mtime_ns()
+    index.put(filename, _write_session(index.sessions_dir, filename, name), dir_mtime)
+
+
+def test_other_instance_replays_log_tail(tmp_path):
+    writer = SessionIndex(tmp_path)
+    reader = SessionIndex(tmp_path)
+    _save(writer, "a.json", "a")
+    assert set(reader.load()) == {"a.json"}
+
+    _save(writer, "b.json", "b")
+    dir_mtime = writer.dir_mtime_ns()
+    (tmp_path / "a.json").unlink()
+    writer.remove("a.json", dir_mtime)
+
+    reader.revalidate()
+    assert set(reader.load()) == {"b.json"}
+    assert reader.find("b") == "b.json"
+    assert reader.find("a") is None
+
+
+def test_log_compaction_rewrites_snapshot(tmp_path, monkeypatch):
+    monkeypatch.setattr(session_index, "INDEX_LOG_COMPACT_BYTES", 512)
+    index = SessionIndex(tmp_path)
+    index.load()
+    for i in range(30):
+        _save(index, f"s{i}.json", f"s{i}")
+
+    # 로그는 스냅샷보다 커지기 전에 스냅샷으로 옮겨지고, 새로 연 인덱스도 같은 내용을 읽음
+    snapshot = json.loads(index.index_path.read_text(encoding="utf-8"))
+    assert len(snapshot["entries"]) >= 15
+    assert index.log_path.stat().st_size < index.index_path.stat().st_size + 512
+    assert set(SessionIndex(tmp_path).load()) == {f"s{i}.json" for i in range(30)}
+
+
+def test_stale_log_from_old_snapshot_is_ignored(tmp_path, monkeypatch):
+    index = SessionIndex(tmp_path)
+    index.load()
+    _save(index, "a.json", "a")
+    old_log = index.log_path.read_bytes()
+
+    monkeypatch.setattr(session_index, "INDEX_LOG_COMPACT_BYTES", 0)
+    _save(index, "b.json", "b")
+    # 스냅샷을 다시 쓴 뒤 이전 로그가 남아 있어도 두 번 적용하지 않음
+    index.log_path.write_bytes(old_log + json.dumps(["del", "b.json"]).encode() + b"\n")
+
+    assert set(SessionIndex(tmp_path).load()) == {"a.json", "b.json"}
+
+
+def test_files_changed_outside_are_picked_up(tmp_path):
+    index = SessionIndex(tmp_path)
+    _save(index, "a.json", "a")
+    assert set(index.load()) == {"a.json"}
+
+    shutil.copy(tmp_path / "a.json", tmp_path / "copied.json")
+    (tmp_path / "a.json").unlink()
+
+    fresh = SessionIndex(tmp_path)
+    assert set(fresh.load()) == {"copied.json"}
@@ -0,0 +1,60 @@
+# type: ignore
+"""
+세션 검색 인덱스 무효화 테스트
+
+Python 3.11.9
+PEP8 준수
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_DIR))
+
+from session_manager import SessionManager  # noqa: E402
+
+
+def _names(records):
+    return sorted(record.name for record in records)
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_search_sees_own_changes(tmp_path, backend):
+    manager = SessionManager(tmp_path, backend=backend)
+    try:
+        manager.save_session("s", "alice", notes="work")
+        manager.save_session("s", "bob", notes="alice friend")
+        assert _names(manager.search("ali")) == ["alice", "bob"]
+
+        manager.save_session("s", "alina")
+        manager.delete_session("bob")
+        assert _names(manager.search("ali")) == ["alice", "alina"]
+    finally:
+        manager.close()
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_search_sees_other_process_changes(tmp_path, backend):
+    manager = SessionManager(tmp_path, backend=backend)
+    try:
+        manager.save_session("s", "alice")
+        manager.save_session("s", "bob")
+        assert _names(manager.search("ali")) == ["alice"]
+
+        script = (
+            "from session_manager import SessionManager\n"
+            f"m = SessionManager({str(tmp_path)!r}, backend={backend!r})\n"
+            "m.delete_session('alice')\n"
+            "m.save_session('s', 'alicia')\n"
+            "m.close()\n"
+        )
+        subprocess.run([sys.executable, "-c", script], cwd=REPO_DIR, check=True,
+                       capture_output=True)
+
+        assert _names(manager.search("ali")) == ["alicia"]
+    finally:
+        manager.close()
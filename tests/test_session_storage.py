@@ -0,0 +1,194 @@
+# type: ignore
+"""
+세션 저장소 백엔드 테스트
+
+Python 3.11.9
+PEP8 준수
+"""
+
+import json
+import sys
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_DIR))
+
+from session_index import LAYOUT_FILENAME, META_DIR_NAME, UsageJournal, shard_dir  # noqa: E402
+from session_manager import SessionManager  # noqa: E402
+from session_storage import JsonFileStorage, SqliteStorage  # noqa: E402
+
+
+def _session(name, session_string="s"):
+    return {"name": name, "session_string": session_string, "phone": "+8210", "notes": None,
+            "created_at": "2026-01-01T00:00:00", "last_used": None}
+
+
+def test_sqlite_migrates_json_sessions_once(tmp_path):
+    json_storage = JsonFileStorage(tmp_path, layout="sharded")
+    json_storage.write("a.json", _session("a", "first"))
+    json_storage.write("b.json", _session("b"))
+    json_storage.close()
+
+    storage = SqliteStorage(tmp_path)
+    try:
+        assert set(storage.list_entries()) == {"a.json", "b.json"}
+        assert storage.read("a.json")["session_string"] == "first"
+        assert storage.find("+8210") in {"a.json", "b.json"}
+
+        # 한 번 옮긴 뒤에는 JSON 파일을 다시 읽지 않음 (삭제한 세션이 되살아나지 않음)
+        storage.delete("a.json")
+        assert storage.migrate_from_json() == 0
+    finally:
+        storage.close()
+
+    reopened = SqliteStorage(tmp_path)
+    try:
+        assert set(reopened.list_entries()) == {"b.json"}
+    finally:
+        reopened.close()
+
+
+def test_manager_round_trip_on_sqlite(tmp_path):
+    manager = SessionManager(str(tmp_path), backend="sqlite")
+    try:
+        assert manager.save_session("secret", "alice", phone="+821011112222")
+        assert manager.load_session("+821011112222") == "secret"
+        assert [record.name for record in manager.list_sessions()] == ["alice"]
+        assert manager.delete_session("alice")
+        assert manager.list_sessions() == []
+    finally:
+        manager.close()
+
+
+def test_load_records_last_used_in_journal_without_rewriting(tmp_path):
+    manager = SessionManager(str(tmp_path))
+    try:
+        manager.save_session("secret", "alice")
+        session_file = tmp_path / "alice.json"
+        before = session_file.read_bytes()
+
+        assert manager.load_session("alice") == "secret"
+        assert session_file.read_bytes() == before
+        assert manager.get_session_info("alice").last_used is not None
+
+        # 저널을 세션 파일에 반영하면 저널은 비워짐
+        manager.storage.flush()
+        assert json.loads(session_file.read_text(encoding="utf-8"))["last_used"]
+        assert not (tmp_path / ".meta" / "usage.log").exists()
+    finally:
+        manager.close()
+
+
+def test_usage_journal_reads_only_new_lines(tmp_path, monkeypatch):
+    journal = UsageJournal(tmp_path)
+    journal.record("a.json", "2026-01-01T00:00:01")
+    journal.record("b.json", "2026-01-01T00:00:02")
+    assert journal.load() == {"a.json": "2026-01-01T00:00:01",
+                              "b.json": "2026-01-01T00:00:02"}
+
+    parsed = []
+    parse = UsageJournal._parse
+
+    def counting_parse(lines):
+        lines = list(lines)
+        parsed.extend(lines)
+        return parse(lines)
+
+    monkeypatch.setattr(UsageJournal, "_parse", staticmethod(counting_parse))
+    other = UsageJournal(tmp_path)
+    other.record("a.json", "2026-01-01T00:00:03")
+    assert journal.load()["a.json"] == "2026-01-01T00:00:03"
+    assert len(parsed) == 1
+
+    # 아직 쓰는 중인 마지막 줄은 다음에 읽음
+    with open(journal.path, 'ab') as f:
+        f.write(b'["c.json", "2026-01-01T00:00:04"')
+    assert "c.json" not in journal.load()
+    with open(journal.path, 'ab') as f:
+        f.write(b']\n')
+    assert journal.load()["c.json"] == "2026-01-01T00:00:04"
+
+
+def test_usage_journal_follows_compaction(tmp_path):
+    journal = UsageJournal(tmp_path)
+    journal.record("a.json", "2026-01-01T00:00:01")
+    assert "a.json" in journal.load()
+
+    compactor = UsageJournal(tmp_path)
+    assert compactor.begin_compaction() == {"a.json": "2026-01-01T00:00:01"}
+    compactor.record("b.json", "2026-01-01T00:00:02")
+    # 반영 중에는 반영용 파일과 새 저널을 함께 읽음
+    assert set(journal.load()) == {"a.json", "b.json"}
+
+    compactor.end_compaction()
+    assert journal.load() == {"b.json": "2026-01-01T00:00:02"}
+
+
+def test_layout_migrates_flat_to_sharded_and_back(tmp_path):
+    storage = JsonFileStorage(tmp_path, layout="flat")
+    storage.write_many((f"s{i}.json", _session(f"s{i}", f"string{i}")) for i in range(20))
+    storage.close()
+    assert len(list(tmp_path.glob("*.json"))) == 20
+
+    storage = JsonFileStorage(tmp_path, layout="sharded")
+    try:
+        assert not list(tmp_path.glob("*.json"))
+        assert (shard_dir(tmp_path, "s3.json") / "s3.json").is_file()
+        assert len(storage.list_entries()) == 20
+        assert storage.read("s3.json")["session_string"] == "string3"
+    finally:
+        storage.close()
+
+    # 배치 방식을 지정하지 않으면 저장된 방식 유지
+    storage = JsonFileStorage(tmp_path)
+    try:
+        assert storage.read("s7.json")["session_string"] == "string7"
+        assert not list(tmp_path.glob("*.json"))
+    finally:
+        storage.close()
+
+    storage = JsonFileStorage(tmp_path, layout="flat")
+    try:
+        assert len(list(tmp_path.glob("*.json"))) == 20
+        assert not shard_dir(tmp_path, "s3.json").exists()
+        assert len(storage.list_entries()) == 20
+    finally:
+        storage.close()
+
+
+def test_layout_migration_resumes_after_interruption(tmp_path):
+    storage = JsonFileStorage(tmp_path, layout="sharded")
+    storage.write_many((f"s{i}.json", _session(f"s{i}")) for i in range(10))
+    storage.close()
+
+    # flat으로 옮기다가 중간에 종료된 상태 (파일 하나만 옮겨짐)
+    moved = shard_dir(tmp_path, "s0.json") / "s0.json"
+    moved.replace(tmp_path / "s0.json")
+    (tmp_path / META_DIR_NAME / LAYOUT_FILENAME).write_text(
+        json.dumps({"layout": "flat", "complete": False}), encoding="utf-8")
+
+    storage = JsonFileStorage(tmp_path)
+    try:
+        assert len(list(tmp_path.glob("*.json"))) == 10
+        assert len(storage.list_entries()) == 10
+    finally:
+        storage.close()
+
+    marker = json.loads((tmp_path / META_DIR_NAME / LAYOUT_FILENAME).read_text(encoding="utf-8"))
+    assert marker == {"layout": "flat", "complete": True}
+
+
+def test_sqlite_status_round_trip(tmp_path):
+    storage = SqliteStorage(tmp_path)
+    try:
+        storage.write("a.json", _session("a"))
+        storage.update_status({"a.json": {"ok": False, "error": "연결 실패"}})
+        storage.update_status({"a.json": {"checked_at": "2026-01-01T00:00:00"}})
+
+        assert storage.list_entries()["a.json"]["status"] == {
+            "ok": False, "error": "연결 실패", "checked_at": "2026-01-01T00:00:00"
+        }
+        row = storage._conn.execute("SELECT typeof(status) FROM session_status").fetchone()
+        assert row[0] == "text"
+    finally:
+        storage.close()
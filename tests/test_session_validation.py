@@ -0,0 +1,74 @@
+# type: ignore
+"""
+세션 연결 일괄 검사 테스트 (가짜 클라이언트 사용)
+
+Python 3.11.9
+PEP8 준수
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_DIR))
+
+from session_manager import SessionManager  # noqa: E402
+
+
+class FakeClient:
+    """세션 문자열이 "ok"로 시작하면 인증된 것으로 보는 가짜 클라이언트"""
+
+    connects = 0
+
+    def __init__(self, session_string):
+        self.session_string = session_string
+
+    async def connect(self):
+        FakeClient.connects += 1
+        if self.session_string == "boom":
+            raise ConnectionError("network down")
+
+    async def disconnect(self):
+        pass
+
+    async def is_user_authorized(self):
+        return self.session_string.startswith("ok")
+
+    async def get_me(self):
+        return SimpleNamespace(id=7, first_name="Alice", username="alice")
+
+
+def test_validate_all_writes_status_and_uses_cache(tmp_path):
+    FakeClient.connects = 0
+    manager = SessionManager(str(tmp_path))
+    try:
+        manager.save_session("ok-1", "good")
+        manager.save_session("expired", "bad")
+        manager.save_session("boom", "broken")
+
+        report = asyncio.run(manager.validate_all(client_factory=FakeClient))
+        assert (report["total"], report["valid"], report["invalid"], report["errors"]) == (3, 1, 1, 1)
+        assert FakeClient.connects == 3
+
+        status = manager.get_session_info("good").status
+        assert status["valid"] is True
+        assert status["identity"] == {"id": 7, "first_name": "Alice", "username": "alice"}
+        assert manager.get_session_info("bad").status["valid"] is False
+        assert manager.get_cached_identity("good")["first_name"] == "Alice"
+
+        # 확인된 결과는 캐시를 쓰고, 오류로 끝난 세션만 다시 검사
+        report = asyncio.run(manager.validate_all(client_factory=FakeClient))
+        assert report["cached"] == 2
+        assert FakeClient.connects == 4
+
+        report = asyncio.run(manager.validate_all(client_factory=FakeClient, force_refresh=True))
+        assert report["cached"] == 0
+        assert FakeClient.connects == 7
+
+        # 다시 저장한 세션은 이전 검사 결과를 지움
+        manager.save_session("ok-2", "good")
+        assert manager.get_session_info("good").status is None
+    finally:
+        manager.close()
@@ -0,0 +1,68 @@
+# type: ignore
+"""
+암호화 세션 저장소 테스트
+
+Python 3.11.9
+PEP8 준수
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("cryptography")
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_DIR))
+
+from session_manager import SessionManager  # noqa: E402
+from session_vault import SessionVault, is_encrypted  # noqa: E402
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_encrypted_round_trip(tmp_path, backend):
+    manager = SessionManager(tmp_path, backend=backend, passphrase="secret")
+    try:
+        manager.save_session("plain-session", "alice")
+        filename = manager.get_session_info("alice").filename
+        raw = manager.storage.inner.read(filename)
+        assert is_encrypted(raw["session_string"])
+        assert manager.load_session("alice") == "plain-session"
+    finally:
+        manager.close()
+
+    manager = SessionManager(tmp_path, backend=backend, passphrase="secret")
+    try:
+        assert manager.load_session("alice") == "plain-session"
+    finally:
+        manager.close()
+
+
+def test_wrong_passphrase_is_rejected(tmp_path):
+    meta_dir = tmp_path / ".meta"
+    SessionVault(meta_dir, "secret")
+
+    with pytest.raises(ValueError):
+        SessionVault(meta_dir, "wrong")
+
+
+def test_concurrent_creation_adopts_first_salt(tmp_path, monkeypatch):
+    meta_dir = tmp_path / ".meta"
+    first = SessionVault(meta_dir, "secret")
+    token = first.encrypt("session", "a.json")
+
+    # 설정이 아직 없다고 본 직후 다른 프로세스가 먼저 만든 상황
+    load_config = SessionVault._load_config
+    calls = []
+
+    def racing_load_config(self):
+        calls.append(1)
+        return None if len(calls) == 1 else load_config(self)
+
+    monkeypatch.setattr(SessionVault, "_load_config", racing_load_config)
+    second = SessionVault(meta_dir, "secret")
+
+    assert len(calls) == 2
+    assert second.decrypt(token, "a.json") == "session"
+    assert [p.name for p in meta_dir.iterdir()] == ["vault.json"]